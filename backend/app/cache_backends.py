@@ -0,0 +1,267 @@
+import asyncio
+import os
+import pickle
+import sqlite3
+import tempfile
+import time
+from collections import OrderedDict
+from contextlib import closing
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# tmpfs when available so the shared store never touches disk
+SHARED_MEMORY_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+SHARED_CACHE_PATH = os.getenv("CACHE_SHARED_PATH", os.path.join(SHARED_MEMORY_DIR, "zenith-hr-cache.sqlite3"))
+# The shared cache runs on the event loop: a call waits at most this long for another worker's write lock
+SHARED_CACHE_BUSY_TIMEOUT = float(os.getenv("CACHE_SHARED_BUSY_TIMEOUT", "0.02"))
+SHARED_CACHE_EVICTION_INTERVAL = 64  # stores between size checks in each process
+SHARED_CACHE_INVALIDATION_WAIT = 5.0  # a locked invalidation is retried off the event loop for up to this long
+
+def _is_locked(error: sqlite3.OperationalError) -> bool:
+    return "locked" in str(error)
+
+class CacheBackend:
+    """Key/value store with LRU bounds and per-entry TTL used by the in-process caches"""
+
+    name = "base"
+    shared = False  # whether other worker processes see the same entries
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        raise NotImplementedError
+
+    def set(self, key: Hashable, value: Any):
+        raise NotImplementedError
+
+    def delete(self, key: Hashable):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters of this process (entries are those visible to it)"""
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.name,
+            "entries": len(self),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+class MemoryCacheBackend(CacheBackend):
+    """Process-local LRU mapping whose entries also expire ``ttl`` seconds after they were stored"""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int, ttl: float):
+        super().__init__(max_entries, ttl)
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: Hashable):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+class SharedCacheBackend(CacheBackend):
+    """Cache shared by every worker process on the host, stored in SQLite on tmpfs.
+
+    Each namespace is a slice of one table; values are pickled. Reads refresh
+    the entry's access time, at most once per ``access_interval``, so eviction
+    is (coarsely) LRU across all workers without a write per hit. The size
+    bound is enforced every ``SHARED_CACHE_EVICTION_INTERVAL`` stores rather
+    than counted on each one. Calls run on the event loop, so they wait only
+    briefly for another worker's write lock: a locked read is a miss and a
+    locked write is dropped. A locked delete or clear must not be dropped, so
+    it is retried in a worker thread. The connection is opened lazily per
+    process, so instances created before a fork stay usable in the children.
+    """
+
+    name = "shared"
+    shared = True
+
+    def __init__(self, namespace: str, max_entries: int, ttl: float, path: Optional[str] = None):
+        super().__init__(max_entries, ttl)
+        self.namespace = namespace
+        self.path = path or SHARED_CACHE_PATH
+        self.access_interval = max(1.0, ttl / 10)
+        self.lock_timeouts = 0
+        self.deferred_invalidations = 0
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._stores_since_eviction = 0
+
+    def _db(self) -> sqlite3.Connection:
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(
+                self.path, timeout=SHARED_CACHE_BUSY_TIMEOUT, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=OFF")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS cache_entries_lru ON cache_entries (namespace, accessed_at)"
+            )
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def __len__(self) -> int:
+        row = self._db().execute(
+            "SELECT COUNT(*) FROM cache_entries WHERE namespace = ? AND expires_at > ?",
+            (self.namespace, time.time())
+        ).fetchone()
+        return row[0]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        db = self._db()
+        now = time.time()
+        try:
+            row = db.execute(
+                "SELECT value, expires_at, accessed_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, str(key))
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return default
+            value, expires_at, accessed_at = row
+            if expires_at <= now:
+                db.execute("DELETE FROM cache_entries WHERE namespace = ? AND key = ?", (self.namespace, str(key)))
+                self.expirations += 1
+                self.misses += 1
+                return default
+            if now - accessed_at >= self.access_interval:
+                db.execute(
+                    "UPDATE cache_entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                    (now, self.namespace, str(key))
+                )
+        except sqlite3.OperationalError as e:
+            if not _is_locked(e):
+                raise
+            # Locked by another worker's write; not worth blocking the event loop for
+            self.lock_timeouts += 1
+            self.misses += 1
+            return default
+        self.hits += 1
+        return pickle.loads(value)
+
+    def set(self, key: Hashable, value: Any):
+        db = self._db()
+        now = time.time()
+        try:
+            db.execute(
+                "INSERT OR REPLACE INTO cache_entries (namespace, key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (self.namespace, str(key), pickle.dumps(value, pickle.HIGHEST_PROTOCOL), now + self.ttl, now)
+            )
+            self._stores_since_eviction += 1
+            if self._stores_since_eviction >= SHARED_CACHE_EVICTION_INTERVAL:
+                self._stores_since_eviction = 0
+                self._evict(db)
+        except sqlite3.OperationalError as e:
+            if not _is_locked(e):
+                raise
+            self.lock_timeouts += 1
+
+    def _evict(self, db: sqlite3.Connection):
+        """Drop the least recently used entries beyond ``max_entries``"""
+        count = db.execute("SELECT COUNT(*) FROM cache_entries WHERE namespace = ?", (self.namespace,)).fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            db.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key IN ("
+                "SELECT key FROM cache_entries WHERE namespace = ? ORDER BY accessed_at LIMIT ?)",
+                (self.namespace, self.namespace, excess)
+            )
+            self.evictions += excess
+
+    def delete(self, key: Hashable):
+        self._invalidating_write("DELETE FROM cache_entries WHERE namespace = ? AND key = ?", (self.namespace, str(key)))
+
+    def clear(self):
+        self._invalidating_write("DELETE FROM cache_entries WHERE namespace = ?", (self.namespace,))
+
+    def _invalidating_write(self, statement: str, parameters: Tuple):
+        """Run a delete now, or, while another worker holds the lock, in a thread that waits for it"""
+        try:
+            self._db().execute(statement, parameters)
+            return
+        except sqlite3.OperationalError as e:
+            if not _is_locked(e):
+                raise
+        self.lock_timeouts += 1
+        self.deferred_invalidations += 1
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._wait_and_write(statement, parameters)
+            return
+        loop.run_in_executor(None, self._wait_and_write, statement, parameters)
+
+    def _wait_and_write(self, statement: str, parameters: Tuple):
+        # Own connection, so SQLite's busy handler can sleep without holding the shared one
+        try:
+            with closing(sqlite3.connect(self.path, timeout=SHARED_CACHE_INVALIDATION_WAIT, isolation_level=None)) as db:
+                db.execute(statement, parameters)
+        except sqlite3.Error as e:
+            print(f"Shared cache invalidation in '{self.namespace}' failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **super().stats(),
+            "lock_timeouts": self.lock_timeouts,
+            "deferred_invalidations": self.deferred_invalidations,
+        }
+
+def make_cache_backend(namespace: str, max_entries: int, ttl: float) -> CacheBackend:
+    """Backend selected by CACHE_BACKEND: ``memory`` (default) or ``shared``"""
+    backend = os.getenv("CACHE_BACKEND", "memory").lower()
+    if backend == "shared":
+        return SharedCacheBackend(namespace, max_entries, ttl)
+    if backend != "memory":
+        print(f"Unknown CACHE_BACKEND '{backend}', using memory")
+    return MemoryCacheBackend(max_entries, ttl)
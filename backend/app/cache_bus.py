@@ -0,0 +1,128 @@
+import asyncio
+import json
+import os
+import socket
+from typing import Any, Callable, Dict, List, Optional, Set, Union
+
+from .cache_backends import SHARED_MEMORY_DIR
+
+CACHE_BUS_DIR = os.getenv("CACHE_BUS_DIR", os.path.join(SHARED_MEMORY_DIR, "zenith-hr-cache-bus"))
+SOCKET_SUFFIX = ".sock"
+
+class InvalidationBus:
+    """Broadcasts cache invalidations between the worker processes on one host.
+
+    Every started worker binds a Unix datagram socket in a shared directory;
+    publishing sends one small datagram to each other socket found there, and
+    receiving is driven by the event loop, so a write in one worker reaches the
+    others within milliseconds without any external service. Sockets left by
+    dead workers are removed the first time a send to them is refused.
+    """
+
+    def __init__(self, directory: str = CACHE_BUS_DIR):
+        self.directory = directory
+        self.published = 0
+        self.received = 0
+        self._handlers: Dict[str, List[Callable[[Union[None, str, List[str]]], Any]]] = {}
+        self._socket: Optional[socket.socket] = None
+        self._send_socket: Optional[socket.socket] = None
+        self._path: Optional[str] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: Set[asyncio.Future] = set()
+
+    @property
+    def started(self) -> bool:
+        return self._socket is not None
+
+    def subscribe(self, channel: str, handler: Callable[[Union[None, str, List[str]]], Any]):
+        """Call ``handler(key)`` for invalidations published by other workers (coroutines are scheduled)"""
+        self._handlers.setdefault(channel, []).append(handler)
+
+    def start(self):
+        """Bind this worker's socket and start receiving on the running event loop"""
+        if self.started:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{os.getpid()}{SOCKET_SUFFIX}")
+        if os.path.exists(path):
+            os.unlink(path)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.bind(path)
+        sock.setblocking(False)
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(sock.fileno(), self._receive)
+        self._socket = sock
+        self._path = path
+        print(f"Cache invalidation bus listening on {path}")
+
+    def stop(self):
+        if self._socket is not None:
+            if self._loop is not None and not self._loop.is_closed():
+                self._loop.remove_reader(self._socket.fileno())
+            self._socket.close()
+            self._socket = None
+        if self._send_socket is not None:
+            self._send_socket.close()
+            self._send_socket = None
+        if self._path and os.path.exists(self._path):
+            os.unlink(self._path)
+        self._path = None
+
+    def publish(self, channel: str, key: Union[None, str, List[str]] = None):
+        """Tell every other worker to invalidate ``key`` (a list: several keys; None: everything) on ``channel``"""
+        try:
+            entries = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return
+        if self._send_socket is None:
+            self._send_socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            self._send_socket.setblocking(False)
+        message = json.dumps({"channel": channel, "key": key, "origin": os.getpid()}).encode()
+        for entry in entries:
+            if not entry.name.endswith(SOCKET_SUFFIX) or entry.path == self._path:
+                continue
+            try:
+                self._send_socket.sendto(message, entry.path)
+                self.published += 1
+            except (ConnectionRefusedError, FileNotFoundError):
+                # Worker is gone
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
+            except BlockingIOError:
+                print(f"Cache invalidation to {entry.name} dropped: receiver queue full")
+            except OSError as e:
+                print(f"Cache invalidation to {entry.name} failed: {e}")
+
+    def _receive(self):
+        while self._socket is not None:
+            try:
+                data = self._socket.recv(65536)
+            except (BlockingIOError, InterruptedError):
+                return
+            try:
+                message = json.loads(data)
+            except ValueError:
+                continue
+            if message.get("origin") == os.getpid():
+                continue
+            self.received += 1
+            self._dispatch(message.get("channel"), message.get("key"))
+
+    def _dispatch(self, channel: str, key: Union[None, str, List[str]]):
+        for handler in self._handlers.get(channel, []):
+            try:
+                result = handler(key)
+                if asyncio.iscoroutine(result):
+                    task = asyncio.ensure_future(result)
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+            except Exception as e:
+                print(f"Error handling cache invalidation on '{channel}': {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {"started": self.started, "published": self.published, "received": self.received}
+
+# Global invalidation bus, started and stopped with the application
+cache_bus = InvalidationBus()
@@ -0,0 +1,215 @@
+import bisect
+import datetime
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from .employee_events import EmployeeListener, employee_events
+
+# Dashboard histogram dimensions and the bucket used when the attribute is missing
+DIMENSIONS = {
+    "account": "Unknown",
+    "location": "Unknown",
+    "employee_status": "Unknown",
+    "employment_category": "Unknown",
+    "is_leader": "No",
+    "position": "Unknown",
+    "department": "Unknown",
+    "gender": "Unknown",
+}
+
+GRANULARITIES = ("week", "month", "quarter")
+MAX_PERIODS = 1000
+
+def parse_join_date(employee: Dict[str, Any]) -> Optional[datetime.date]:
+    """Joining date of an employee (falling back to created_at), or None"""
+    value = employee.get("date_of_joining") or employee.get("created_at")
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    if isinstance(value, str) and value:
+        try:
+            return datetime.datetime.fromisoformat(value.replace('Z', '+00:00')).date()
+        except ValueError:
+            return None
+    return None
+
+def period_floor(day: datetime.date, granularity: str) -> datetime.date:
+    """First day of the week (Monday), month or quarter containing ``day``"""
+    if granularity == "week":
+        return day - datetime.timedelta(days=day.weekday())
+    if granularity == "quarter":
+        return datetime.date(day.year, 3 * ((day.month - 1) // 3) + 1, 1)
+    return day.replace(day=1)
+
+def next_period(period_start: datetime.date, granularity: str) -> datetime.date:
+    if granularity == "week":
+        return period_start + datetime.timedelta(days=7)
+    months = 3 if granularity == "quarter" else 1
+    month_index = period_start.month - 1 + months
+    return datetime.date(period_start.year + month_index // 12, month_index % 12 + 1, 1)
+
+def period_label(period_start: datetime.date, granularity: str) -> str:
+    if granularity == "week":
+        year, week, _ = period_start.isocalendar()
+        return f"{year}-W{week:02d}"
+    if granularity == "quarter":
+        return f"{period_start.year}-Q{(period_start.month - 1) // 3 + 1}"
+    return period_start.strftime("%b")
+
+class DashboardAggregates(EmployeeListener):
+    """Materialised dashboard histograms maintained by employee write deltas.
+
+    Every member's bucket values are remembered, so an update or delete
+    subtracts exactly what the previous version added. Reading the dashboard
+    costs O(number of buckets) instead of a table scan.
+
+    Join dates are parsed once, on write, into a sorted list of day ordinals;
+    the headcount at any date is a single bisect over that column.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.reset()
+
+    def reset(self):
+        self._counts: Dict[str, Counter] = {dimension: Counter() for dimension in DIMENSIONS}
+        self._join_ordinals: List[int] = []  # sorted date.toordinal() of every dated member
+        # Per dimension: (value, join year, join month) -> employees joined
+        self._joins_by_value: Dict[str, Counter] = {dimension: Counter() for dimension in DIMENSIONS}
+        self._undated = 0
+        self._members: Dict[str, Tuple[tuple, Optional[int]]] = {}
+
+    @property
+    def total(self) -> int:
+        return len(self._members)
+
+    def _apply(self, buckets: tuple, join_ordinal: Optional[int], delta: int):
+        for dimension, value in zip(DIMENSIONS, buckets):
+            counter = self._counts[dimension]
+            counter[value] += delta
+            if counter[value] <= 0:
+                del counter[value]
+        if join_ordinal is None:
+            self._undated += delta
+            return
+        join_date = datetime.date.fromordinal(join_ordinal)
+        for dimension, value in zip(DIMENSIONS, buckets):
+            joins = self._joins_by_value[dimension]
+            bucket = (value, join_date.year, join_date.month)
+            joins[bucket] += delta
+            if joins[bucket] <= 0:
+                del joins[bucket]
+        if delta > 0:
+            if self._loading:
+                # Sorted once in end_load instead of per insert
+                self._join_ordinals.append(join_ordinal)
+            else:
+                bisect.insort(self._join_ordinals, join_ordinal)
+        elif self._loading:
+            self._join_ordinals.remove(join_ordinal)
+        else:
+            i = bisect.bisect_left(self._join_ordinals, join_ordinal)
+            if i < len(self._join_ordinals) and self._join_ordinals[i] == join_ordinal:
+                del self._join_ordinals[i]
+
+    def apply_upsert(self, employee: Dict[str, Any]):
+        employee_id = employee.get("id")
+        if not employee_id:
+            return
+        self.apply_delete(employee_id)
+        buckets = tuple(employee.get(dimension, default) for dimension, default in DIMENSIONS.items())
+        join_date = parse_join_date(employee)
+        join_ordinal = join_date.toordinal() if join_date else None
+        self._members[employee_id] = (buckets, join_ordinal)
+        self._apply(buckets, join_ordinal, 1)
+
+    def apply_delete(self, employee_id: str):
+        previous = self._members.pop(employee_id, None)
+        if previous:
+            self._apply(*previous, -1)
+
+    def end_load(self):
+        self._join_ordinals.sort()
+        super().end_load()
+
+    def headcount_on(self, day: datetime.date) -> int:
+        """Employees who had joined on or before ``day``"""
+        return bisect.bisect_right(self._join_ordinals, day.toordinal())
+
+    def estimate(self, attribute: str, value: Any) -> Optional[int]:
+        """Live number of employees with ``attribute == value`` (for the query planner)"""
+        if not self.ready or attribute not in self._counts:
+            return None
+        return self._counts[attribute].get(value, 0)
+
+    def headcount_series(self, start: datetime.date, end: datetime.date, granularity: str = "month") -> List[Dict[str, Any]]:
+        """Headcount at the end of every week/month/quarter overlapping [start, end]"""
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"granularity must be one of {', '.join(GRANULARITIES)}")
+        if end < start:
+            raise ValueError("end must not be before start")
+        
+        series = []
+        period_start = period_floor(start, granularity)
+        while period_start <= end:
+            if len(series) >= MAX_PERIODS:
+                raise ValueError(f"Range spans more than {MAX_PERIODS} periods")
+            next_start = next_period(period_start, granularity)
+            period_end = next_start - datetime.timedelta(days=1)
+            series.append({
+                "period_start": period_start.isoformat(),
+                "period_end": period_end.isoformat(),
+                "label": period_label(period_start, granularity),
+                "count": self.headcount_on(period_end)
+            })
+            period_start = next_start
+        return series
+
+    def monthly_headcount(self, year: int) -> list:
+        """Employees who had joined by the end of each month of ``year``"""
+        series = self.headcount_series(datetime.date(year, 1, 1), datetime.date(year, 12, 31), "month")
+        return [
+            {"month": entry["label"], "count": entry["count"], "month_number": month}
+            for month, entry in enumerate(series, start=1)
+        ]
+
+    def breakdown(self, dimension: str, year: int) -> Dict[str, Dict[str, List[int]]]:
+        """Monthly hires and end-of-month headcount of ``year`` for every value of a dimension"""
+        if dimension not in DIMENSIONS:
+            raise ValueError(f"Unknown dimension '{dimension}'")
+        values: Dict[str, Dict[str, Any]] = {}
+        for (value, join_year, join_month), count in self._joins_by_value[dimension].items():
+            if join_year > year:
+                continue
+            entry = values.setdefault(value, {"before": 0, "hires": [0] * 12})
+            if join_year < year:
+                entry["before"] += count
+            else:
+                entry["hires"][join_month - 1] += count
+        
+        result = {}
+        for value, entry in values.items():
+            headcount = []
+            running = entry["before"]
+            for hires in entry["hires"]:
+                running += hires
+                headcount.append(running)
+            result[value] = {"hires": entry["hires"], "headcount": headcount}
+        return result
+
+    def snapshot(self, year: Optional[int] = None) -> Dict[str, Any]:
+        """Dashboard payload built from the current counters"""
+        year = year or datetime.datetime.now().year
+        data = {
+            "total_employees": self.total,
+            "monthly_headcount": self.monthly_headcount(year) if self.total else [],
+            "undated_employees": self._undated,
+        }
+        for dimension in DIMENSIONS:
+            data[f"by_{dimension}"] = dict(self._counts[dimension])
+        return data
+
+# Global dashboard aggregates, kept current by employee write hooks
+dashboard_aggregates = DashboardAggregates()
+employee_events.subscribe(dashboard_aggregates)
@@ -8,9 +8,11 @@ from .database_dynamodb import (
     get_feedback_table,
     get_recruitment_table,
     initialize_dynamodb,
+    close_dynamodb,
     format_dynamodb_item,
     parse_dynamodb_item
 )
+from .item_codecs import TABLE_CODECS
 
 load_dotenv()
 
@@ -19,16 +21,22 @@ load_dotenv()
 try:
     import asyncio
     # Run the initialization in a new event loop if one doesn't exist
+    async def _bootstrap_dynamodb():
+        # The pool opened here belongs to a throwaway loop; release it so the
+        # application's startup hook opens the long-lived one.
+        await initialize_dynamodb()
+        await close_dynamodb()
+
     try:
         loop = asyncio.get_event_loop()
         if loop.is_running():
             # If we're already in an async context, schedule the initialization
             asyncio.create_task(initialize_dynamodb())
         else:
-            loop.run_until_complete(initialize_dynamodb())
+            loop.run_until_complete(_bootstrap_dynamodb())
     except RuntimeError:
         # No event loop exists, create one
-        asyncio.run(initialize_dynamodb())
+        asyncio.run(_bootstrap_dynamodb())
     
     print("DynamoDB initialized successfully")
     
@@ -36,6 +44,10 @@ try:
     class DynamoDBCollection:
         def __init__(self, table_name: str):
             self.table_name = table_name
+            # Compiled per-model conversion where the table has a schema
+            codec = TABLE_CODECS.get(table_name)
+            self._parse = codec.decode if codec else parse_dynamodb_item
+            self._format = codec.encode if codec else format_dynamodb_item
         
         async def find_one(self, query: dict):
             """Find one item in DynamoDB table"""
@@ -50,7 +62,7 @@ try:
                         if "Item" in response:
                             item = response["Item"]
                             # Parse item from DynamoDB format (convert Decimal to float)
-                            parsed_item = parse_dynamodb_item(item)
+                            parsed_item = self._parse(item)
                             # Convert back to MongoDB-style format for compatibility
                             parsed_item["_id"] = parsed_item.pop("id", None)
                             return parsed_item
@@ -64,7 +76,7 @@ try:
                         if response.get("Items"):
                             item = response["Items"][0]
                             # Parse item from DynamoDB format (convert Decimal to float)
-                            parsed_item = parse_dynamodb_item(item)
+                            parsed_item = self._parse(item)
                             parsed_item["_id"] = parsed_item.pop("id", None)
                             return parsed_item
                     return None
@@ -112,7 +124,7 @@ try:
                     items = []
                     for item in response.get("Items", []):
                         # Parse item from DynamoDB format (convert Decimal to float)
-                        parsed_item = parse_dynamodb_item(item)
+                        parsed_item = self._parse(item)
                         parsed_item["_id"] = parsed_item.pop("id", None)
                         items.append(parsed_item)
                     
@@ -156,7 +168,7 @@ try:
                         item["updated_at"] = now
                     
                     # Format item for DynamoDB (convert floats to Decimal)
-                    formatted_item = format_dynamodb_item(item)
+                    formatted_item = self._format(item)
                     
                     await table.put_item(Item=formatted_item)
                     
@@ -1,16 +1,36 @@
 import os
 import asyncio
-from typing import Dict, Any, List, Optional
+import random
+from typing import Dict, Any, List, Optional, AsyncIterator, Callable, Tuple
 from datetime import datetime
 from decimal import Decimal
 import aioboto3
+from aiobotocore.config import AioConfig
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
 from botocore.exceptions import ClientError
 from dotenv import load_dotenv
 
 load_dotenv()
 
+class ItemNotFoundError(Exception):
+    """A conditional write targeted an item that does not exist"""
+
+class VersionConflictError(Exception):
+    """The stored item's version differs from the one the write expected"""
+
+    def __init__(self, current_version: Optional[int]):
+        super().__init__(f"Item was modified concurrently (current version {current_version})")
+        self.current_version = current_version
+
 class DynamoDBService:
-    """DynamoDB service for handling all database operations"""
+    """DynamoDB service for handling all database operations.
+
+    One aioboto3 session, resource and low-level client (each with its HTTP
+    connection pool) are opened per worker process by ``connect()`` during
+    application startup and shared by every request until ``close()`` runs on
+    shutdown. The separate client is needed for wire-format reads: the client
+    behind the resource (de)serializes attribute values itself.
+    """
     
     def __init__(self):
         self.region = os.getenv("AWS_REGION", "us-east-1")
@@ -22,30 +42,485 @@ class DynamoDBService:
             "recruitment": os.getenv("DYNAMODB_TABLE_RECRUITMENT", "zenith-hr-recruitment"),
             "feature_flags": os.getenv("DYNAMODB_TABLE_FEATURE_FLAGS", "zenith-hr-feature-flags")
         }
+        self.max_pool_connections = int(os.getenv("DYNAMODB_MAX_POOL_CONNECTIONS", "50"))
+        self.max_retry_attempts = int(os.getenv("DYNAMODB_MAX_RETRY_ATTEMPTS", "5"))
+        self.scan_segments = int(os.getenv("DYNAMODB_SCAN_SEGMENTS", "4"))
+        self.scan_page_size = int(os.getenv("DYNAMODB_SCAN_PAGE_SIZE", "0")) or None
+        self.batch_max_attempts = int(os.getenv("DYNAMODB_BATCH_MAX_ATTEMPTS", "8"))
+        self.batch_get_concurrency = int(os.getenv("DYNAMODB_BATCH_GET_CONCURRENCY", "4"))
+        # Bulk reads given a codec decode the client's wire format directly
+        self.raw_reads = os.getenv("DYNAMODB_RAW_READS", "true").lower() == "true"
+        self._serializer = TypeSerializer()
+        self._deserializer = TypeDeserializer()
         self.session = None
         self.dynamodb = None
+        self._resource_context = None
+        self._low_level_client = None
+        self._client_context = None
+        self._loop = None
+        self._lock = None
+        self._table_cache = {}
     
-    async def __aenter__(self):
-        """Async context manager entry"""
-        self.session = aioboto3.Session()
-        self.dynamodb = await self.session.resource('dynamodb', region_name=self.region).__aenter__()
+    @property
+    def is_connected(self) -> bool:
+        """Whether a pooled resource is open for the running event loop"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        return self.dynamodb is not None and self._loop is loop
+    
+    async def connect(self):
+        """Open the shared session and pooled resource if not already open"""
+        if self.is_connected:
+            return self
+        
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock = asyncio.Lock()
+        
+        async with self._lock:
+            if self.is_connected:
+                return self
+            if self.dynamodb is not None:
+                # Opened on an event loop that no longer runs (e.g. the
+                # import-time bootstrap); its connections cannot be reused.
+                self._reset()
+            
+            config = AioConfig(
+                max_pool_connections=self.max_pool_connections,
+                retries={"max_attempts": self.max_retry_attempts, "mode": "standard"}
+            )
+            self.session = aioboto3.Session()
+            self._resource_context = self.session.resource(
+                'dynamodb', region_name=self.region, config=config
+            )
+            self.dynamodb = await self._resource_context.__aenter__()
+            self._client_context = self.session.client(
+                'dynamodb', region_name=self.region, config=config
+            )
+            self._low_level_client = await self._client_context.__aenter__()
+            self._loop = loop
+            print(f"DynamoDB connection pool opened (max_pool_connections={self.max_pool_connections})")
         return self
     
+    async def close(self):
+        """Close the shared resource and release its connection pool"""
+        if self._resource_context is not None and self.is_connected:
+            try:
+                await self._resource_context.__aexit__(None, None, None)
+                if self._client_context is not None:
+                    await self._client_context.__aexit__(None, None, None)
+                print("DynamoDB connection pool closed")
+            except Exception as e:
+                print(f"Error closing DynamoDB connection pool: {e}")
+        self._reset()
+    
+    def _reset(self):
+        self.session = None
+        self.dynamodb = None
+        self._resource_context = None
+        self._low_level_client = None
+        self._client_context = None
+        self._loop = None
+        self._table_cache = {}
+    
+    async def __aenter__(self):
+        """Async context manager entry - borrows the shared pooled resource"""
+        return await self.connect()
+    
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit"""
-        if self.dynamodb:
-            await self.dynamodb.__aexit__(exc_type, exc_val, exc_tb)
+        """Async context manager exit - the pool stays open until close()"""
+        return False
     
     async def get_table(self, table_name: str):
         """Get DynamoDB table resource"""
-        if not self.dynamodb:
-            raise RuntimeError("DynamoDB service not initialized. Use async context manager.")
-        return await self.dynamodb.Table(self.tables[table_name])
+        await self.connect()
+        table = self._table_cache.get(table_name)
+        if table is None:
+            table = await self.dynamodb.Table(self.tables[table_name])
+            self._table_cache[table_name] = table
+        return table
+    
+    @property
+    def client(self):
+        """Low-level client that sends and returns attribute values in the wire format"""
+        if not self.is_connected:
+            raise RuntimeError("DynamoDB service not connected. Call connect() first.")
+        return self._low_level_client
+    
+    async def _reader(self, table_name: str, operation: str, request: Dict[str, Any], codec=None):
+        """Resolve the Scan/Query call, request and item decoder for a bulk read.
+        
+        With a codec and ``raw_reads`` enabled the low-level client is used and
+        items are decoded from the wire format by ``codec.decode_wire`` in one
+        pass; otherwise the table resource deserializes them and ``codec.decode``
+        (when given) converts the result. Either way the caller gets the same
+        dicts, and keys passed in or built from items stay plain values.
+        """
+        if codec is not None and self.raw_reads:
+            await self.connect()
+            request = dict(request)
+            request["TableName"] = self.tables[table_name]
+            for field in ("ExpressionAttributeValues", "ExclusiveStartKey"):
+                if field in request:
+                    request[field] = {key: self._serializer.serialize(value) for key, value in request[field].items()}
+            return getattr(self.client, operation), request, codec.decode_wire
+        table = await self.get_table(table_name)
+        return getattr(table, operation), request, codec.decode if codec is not None else None
+    
+    async def _paginate(self, operation, request: Dict[str, Any], decode=None) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Call a Scan/Query operation repeatedly, following LastEvaluatedKey"""
+        request = dict(request)
+        while True:
+            response = await operation(**request)
+            items = response.get("Items", [])
+            yield [decode(item) for item in items] if decode else items
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key:
+                break
+            request["ExclusiveStartKey"] = last_key
+    
+    async def scan_items(
+        self,
+        table_name: str,
+        total_segments: Optional[int] = None,
+        page_size: Optional[int] = None,
+        max_buffered_pages: Optional[int] = None,
+        codec=None,
+        **scan_kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream every item of a table, following pagination to the end.
+        
+        With ``total_segments > 1`` the table is split into Segment/TotalSegments
+        parallel scans, one asyncio worker each. Workers hand whole pages to the
+        consumer through a bounded queue, so at most ``max_buffered_pages`` pages
+        (default: two per segment) are held in memory regardless of table size.
+        Items from different segments arrive interleaved, in no particular order.
+        With a ``codec`` items are yielded decoded (see ``_reader``).
+        """
+        segments = total_segments or self.scan_segments
+        page_size = page_size or self.scan_page_size
+        if page_size:
+            scan_kwargs["Limit"] = page_size
+        scan, scan_kwargs, decode = await self._reader(table_name, "scan", scan_kwargs, codec)
+        
+        if segments <= 1:
+            async for page in self._paginate(scan, scan_kwargs, decode):
+                for item in page:
+                    yield item
+            return
+        
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_buffered_pages or segments * 2)
+        finished = object()
+        
+        async def scan_segment(segment: int):
+            try:
+                request = {**scan_kwargs, "Segment": segment, "TotalSegments": segments}
+                async for page in self._paginate(scan, request, decode):
+                    await queue.put(page)
+                await queue.put(finished)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await queue.put(e)
+        
+        workers = [asyncio.create_task(scan_segment(segment)) for segment in range(segments)]
+        try:
+            remaining = segments
+            while remaining:
+                page = await queue.get()
+                if page is finished:
+                    remaining -= 1
+                    continue
+                if isinstance(page, Exception):
+                    raise page
+                for item in page:
+                    yield item
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+    
+    async def query_items(self, table_name: str, codec=None, **query_kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """Stream every item matching a Query, following pagination to the end"""
+        query, query_kwargs, decode = await self._reader(table_name, "query", query_kwargs, codec)
+        async for page in self._paginate(query, query_kwargs, decode):
+            for item in page:
+                yield item
+    
+    async def read_page(
+        self,
+        table_name: str,
+        limit: int,
+        operation: str = "scan",
+        start_key: Optional[Dict[str, Any]] = None,
+        key_attributes: Tuple[str, ...] = ("id",),
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        codec=None,
+        **request_kwargs
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Read one page of up to ``limit`` matching items starting at ``start_key``.
+        
+        Returns the items and the key to resume from (None once the table or
+        index is exhausted). ``predicate`` filters items client-side; when a
+        DynamoDB page holds more matches than needed, the resume key is built
+        from ``key_attributes`` of the last item returned so nothing is skipped.
+        With a ``codec`` items are decoded before ``predicate`` sees them.
+        """
+        request = dict(request_kwargs)
+        request["Limit"] = limit
+        if start_key:
+            request["ExclusiveStartKey"] = start_key
+        call, request, decode = await self._reader(
+            table_name, "query" if operation == "query" else "scan", request, codec
+        )
+        
+        items: List[Dict[str, Any]] = []
+        while True:
+            response = await call(**request)
+            last_key = response.get("LastEvaluatedKey")
+            for item in response.get("Items", []):
+                if decode:
+                    item = decode(item)
+                if predicate and not predicate(item):
+                    continue
+                items.append(item)
+                if len(items) == limit:
+                    return items, {attribute: item[attribute] for attribute in key_attributes}
+            if not last_key:
+                return items, None
+            request["ExclusiveStartKey"] = last_key
+    
+    @staticmethod
+    def backoff_delay(attempt: int, base: float = 0.05, cap: float = 5.0) -> float:
+        """Exponential backoff with jitter for the ``attempt``-th retry (1-based)"""
+        return min(cap, base * 2 ** (attempt - 1)) * random.uniform(0.5, 1.0)
+    
+    async def batch_write_items(self, table_name: str, items: List[Dict[str, Any]], max_attempts: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Put up to 25 items with BatchWriteItem.
+        
+        ``UnprocessedItems`` (partial throttling) are resubmitted with exponential
+        backoff; the items still unprocessed after ``max_attempts`` calls are
+        returned. Errors of the call itself propagate.
+        """
+        await self.connect()
+        physical_name = self.tables[table_name]
+        requests = [{"PutRequest": {"Item": item}} for item in items]
+        attempts = max_attempts or self.batch_max_attempts
+        for attempt in range(1, attempts + 1):
+            response = await self.dynamodb.batch_write_item(RequestItems={physical_name: requests})
+            requests = response.get("UnprocessedItems", {}).get(physical_name, [])
+            if not requests:
+                return []
+            if attempt < attempts:
+                await asyncio.sleep(self.backoff_delay(attempt))
+        return [request["PutRequest"]["Item"] for request in requests]
+
+    BATCH_GET_MAX_KEYS = 100  # BatchGetItem limit per request
+    
+    async def batch_get_items(
+        self,
+        table_name: str,
+        keys: List[Dict[str, Any]],
+        codec=None,
+        concurrency: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        consistent_read: bool = False
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Read items by key with BatchGetItem, 100 keys per request.
+        
+        Chunks are requested concurrently (at most ``concurrency`` at a time)
+        and each chunk's ``UnprocessedKeys`` are resubmitted with exponential
+        backoff. Returns the items found, in no particular order, and the keys
+        still unprocessed after ``max_attempts`` calls. Keys must be distinct
+        (DynamoDB rejects a request that repeats one). With a ``codec`` items
+        are returned decoded (see ``_reader``); ``consistent_read`` asks for
+        strongly consistent reads.
+        """
+        await self.connect()
+        physical_name = self.tables[table_name]
+        raw = codec is not None and self.raw_reads
+        if raw:
+            batch_get = self.client.batch_get_item
+            keys = [{name: self._serializer.serialize(value) for name, value in key.items()} for key in keys]
+            decode = codec.decode_wire
+        else:
+            batch_get = self.dynamodb.batch_get_item
+            decode = codec.decode if codec is not None else None
+        attempts = max_attempts or self.batch_max_attempts
+        semaphore = asyncio.Semaphore(concurrency or self.batch_get_concurrency)
+        
+        async def get_chunk(chunk: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+            found: List[Dict[str, Any]] = []
+            async with semaphore:
+                for attempt in range(1, attempts + 1):
+                    response = await batch_get(RequestItems={physical_name: {"Keys": chunk, "ConsistentRead": consistent_read}})
+                    found.extend(response.get("Responses", {}).get(physical_name, []))
+                    chunk = response.get("UnprocessedKeys", {}).get(physical_name, {}).get("Keys", [])
+                    if not chunk:
+                        break
+                    if attempt < attempts:
+                        await asyncio.sleep(self.backoff_delay(attempt))
+            return found, chunk
+        
+        results = await asyncio.gather(*(
+            get_chunk(keys[start:start + self.BATCH_GET_MAX_KEYS])
+            for start in range(0, len(keys), self.BATCH_GET_MAX_KEYS)
+        ))
+        items = [decode(item) if decode else item for found, _ in results for item in found]
+        unprocessed = [key for _, left in results for key in left]
+        if raw:
+            unprocessed = [{name: self._deserializer.deserialize(value) for name, value in key.items()} for key in unprocessed]
+        return items, unprocessed
+
+    async def put_item_if_absent(self, table_name: str, item: Dict[str, Any]) -> bool:
+        """Put an item only if no item with its ``id`` exists; False when one does.
+
+        BatchWriteItem takes no conditions, so writes that must not replace
+        existing items go through a conditional PutItem each.
+        """
+        table = await self.get_table(table_name)
+        try:
+            await table.put_item(Item=item, ConditionExpression="attribute_not_exists(id)")
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return False
+            raise
+        return True
+
+    async def update_item_fields(
+        self,
+        table_name: str,
+        key: Dict[str, Any],
+        changes: Dict[str, Any],
+        remove: Tuple[str, ...] = (),
+        expected_version: Optional[int] = None,
+        version_attribute: str = "version"
+    ) -> Dict[str, Any]:
+        """Change some attributes of an existing item with one UpdateItem and return the new item.
+        
+        The generated UpdateExpression names only ``changes`` (set) and
+        ``remove`` (deleted), so the write costs the size of the change rather
+        than of the item. ``version_attribute`` is incremented on every update;
+        with ``expected_version`` the update only applies while the stored
+        version still matches (items without one count as version 0).
+        Raises ItemNotFoundError or VersionConflictError, told apart by the
+        item DynamoDB returns with the failed condition, without another read.
+        """
+        if set(key) & (set(changes) | set(remove)):
+            raise ValueError("Key attributes cannot be updated")
+        if version_attribute in changes or version_attribute in remove:
+            raise ValueError(f"'{version_attribute}' is maintained by update_item_fields")
+        names = {"#version": version_attribute}
+        values: Dict[str, Any] = {":zero": 0, ":one": 1}
+        assignments = []
+        for position, (attribute, value) in enumerate(changes.items()):
+            names[f"#a{position}"] = attribute
+            values[f":a{position}"] = value
+            assignments.append(f"#a{position} = :a{position}")
+        assignments.append("#version = if_not_exists(#version, :zero) + :one")
+        expression = "SET " + ", ".join(assignments)
+        if remove:
+            for position, attribute in enumerate(remove):
+                names[f"#r{position}"] = attribute
+            expression += " REMOVE " + ", ".join(f"#r{position}" for position in range(len(remove)))
+        
+        conditions = []
+        for position, attribute in enumerate(key):
+            names[f"#k{position}"] = attribute
+            conditions.append(f"attribute_exists(#k{position})")
+        if expected_version == 0:
+            conditions.append("attribute_not_exists(#version)")
+        elif expected_version is not None:
+            values[":expected"] = expected_version
+            conditions.append("#version = :expected")
+        
+        table = await self.get_table(table_name)
+        try:
+            response = await table.update_item(
+                Key=key,
+                UpdateExpression=expression,
+                ConditionExpression=" AND ".join(conditions),
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=values,
+                ReturnValues="ALL_NEW",
+                ReturnValuesOnConditionCheckFailure="ALL_OLD"
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+            # The returned item is in wire format ({"N": "3"})
+            current = e.response.get("Item")
+            if not current:
+                raise ItemNotFoundError(f"No item with key {key}")
+            version = current.get(version_attribute, {}).get("N")
+            raise VersionConflictError(int(version) if version is not None else 0)
+        return response["Attributes"]
+    
+    async def merge_item_fields(
+        self,
+        table_name: str,
+        key: Dict[str, Any],
+        changes: Dict[str, Any],
+        defaults: Optional[Dict[str, Any]] = None,
+        version_attribute: str = "version"
+    ) -> Dict[str, Any]:
+        """Create an item or change some of its attributes with one UpdateItem and return the new item.
+
+        Unlike PutItem, attributes not named in ``changes`` are kept.
+        ``defaults`` are only written where the item has no value yet (a
+        creation date, say). ``version_attribute`` is incremented, so a new
+        item starts at version 1.
+        """
+        defaults = defaults or {}
+        if set(key) & (set(changes) | set(defaults)):
+            raise ValueError("Key attributes cannot be updated")
+        if version_attribute in changes or version_attribute in defaults:
+            raise ValueError(f"'{version_attribute}' is maintained by merge_item_fields")
+        names = {"#version": version_attribute}
+        values: Dict[str, Any] = {":zero": 0, ":one": 1}
+        assignments = []
+        for position, (attribute, value) in enumerate(changes.items()):
+            names[f"#a{position}"] = attribute
+            values[f":a{position}"] = value
+            assignments.append(f"#a{position} = :a{position}")
+        for position, (attribute, value) in enumerate(defaults.items()):
+            names[f"#d{position}"] = attribute
+            values[f":d{position}"] = value
+            assignments.append(f"#d{position} = if_not_exists(#d{position}, :d{position})")
+        assignments.append("#version = if_not_exists(#version, :zero) + :one")
+
+        table = await self.get_table(table_name)
+        response = await table.update_item(
+            Key=key,
+            UpdateExpression="SET " + ", ".join(assignments),
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=values,
+            ReturnValues="ALL_NEW"
+        )
+        return response["Attributes"]
+
+    async def delete_existing_item(self, table_name: str, key: Dict[str, Any]) -> Dict[str, Any]:
+        """Delete an item in one conditional DeleteItem and return it; ItemNotFoundError if there was none"""
+        names = {f"#k{position}": attribute for position, attribute in enumerate(key)}
+        table = await self.get_table(table_name)
+        try:
+            response = await table.delete_item(
+                Key=key,
+                ConditionExpression=" AND ".join(f"attribute_exists({name})" for name in names),
+                ExpressionAttributeNames=names,
+                ReturnValues="ALL_OLD"
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                raise ItemNotFoundError(f"No item with key {key}")
+            raise
+        return response.get("Attributes", {})
     
     async def create_tables_if_not_exist(self):
         """Create DynamoDB tables if they don't exist"""
-        if not self.dynamodb:
-            raise RuntimeError("DynamoDB service not initialized. Use async context manager.")
+        await self.connect()
         
         # Table definitions
         table_definitions = {
@@ -301,33 +776,27 @@ dynamodb_service = DynamoDBService()
 # Helper functions for common operations
 async def get_employees_table():
     """Get employees table"""
-    async with dynamodb_service as db:
-        return await db.get_table("employees")
+    return await dynamodb_service.get_table("employees")
 
 async def get_users_table():
     """Get users table"""
-    async with dynamodb_service as db:
-        return await db.get_table("users")
+    return await dynamodb_service.get_table("users")
 
 async def get_goals_table():
     """Get goals table"""
-    async with dynamodb_service as db:
-        return await db.get_table("goals")
+    return await dynamodb_service.get_table("goals")
 
 async def get_feedback_table():
     """Get feedback table"""
-    async with dynamodb_service as db:
-        return await db.get_table("feedback")
+    return await dynamodb_service.get_table("feedback")
 
 async def get_recruitment_table():
     """Get recruitment table"""
-    async with dynamodb_service as db:
-        return await db.get_table("recruitment")
+    return await dynamodb_service.get_table("recruitment")
 
 async def get_feature_flags_table():
     """Get feature flags table"""
-    async with dynamodb_service as db:
-        return await db.get_table("feature_flags")
+    return await dynamodb_service.get_table("feature_flags")
 
 # Utility functions for DynamoDB operations
 def generate_id() -> str:
@@ -387,10 +856,14 @@ def parse_dynamodb_item(item: Dict[str, Any]) -> Dict[str, Any]:
 async def initialize_dynamodb():
     """Initialize DynamoDB tables"""
     try:
-        async with dynamodb_service as db:
-            await db.create_tables_if_not_exist()
+        await dynamodb_service.connect()
+        await dynamodb_service.create_tables_if_not_exist()
         print("DynamoDB initialization completed successfully")
     except Exception as e:
         print(f"DynamoDB initialization failed: {e}")
         # Fallback to mock collections for development
         print("Using mock database collections for development")
+
+async def close_dynamodb():
+    """Release the pooled DynamoDB resource on shutdown"""
+    await dynamodb_service.close()
@@ -0,0 +1,146 @@
+import os
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Union
+
+from .cache_backends import CacheBackend, make_cache_backend
+from .cache_bus import cache_bus
+from .single_flight import SingleFlight
+
+_MISSING = object()
+
+class EmployeeCache:
+    """Read-through cache in front of the employee table.
+
+    Single employees are cached by id and list pages by query key. Every
+    employee write drops that employee's entry and all cached pages, since any
+    page may contain or newly match the changed employee. A load that started
+    before an invalidation is not stored, so a slow read can never put stale
+    data back after a write.
+
+    Invalidations are broadcast on the cache bus so other worker processes
+    drop their copies too. Concurrent misses for the same key share one load
+    (single flight); an invalidation detaches the load in progress, so readers
+    arriving after a write never join a read that started before it.
+    """
+
+    BUS_CHANNEL = "employees"
+
+    def __init__(self, employees: CacheBackend, queries: CacheBackend):
+        self.employees = employees
+        self.queries = queries
+        self.invalidations = 0
+        self._generation = 0
+        self.employee_flights = SingleFlight("employees")
+        self.query_flights = SingleFlight("employee_queries")
+
+    async def _read_through(self, cache: CacheBackend, flights: SingleFlight, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        value = cache.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        generation = self._generation
+        value = await flights.do(key, loader)
+        if value is not None and generation == self._generation:
+            cache.set(key, value)
+        return value
+
+    async def get_employee(self, employee_id: str, loader: Callable[[], Awaitable[Optional[Dict[str, Any]]]]) -> Optional[Dict[str, Any]]:
+        """Cached employee, loading it with ``loader`` on a miss (None results are not cached)"""
+        return await self._read_through(self.employees, self.employee_flights, employee_id, loader)
+
+    async def get_employees(
+        self,
+        employee_ids: List[str],
+        loader: Callable[[List[str]], Awaitable[Dict[str, Dict[str, Any]]]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Cached employees by id; the misses are loaded together with one ``loader(ids)`` call.
+        
+        ``loader`` returns the employees it found keyed by id; ids absent from
+        the result are left out of the returned dict as well.
+        """
+        employees: Dict[str, Dict[str, Any]] = {}
+        missing: List[str] = []
+        for employee_id in employee_ids:
+            value = self.employees.get(employee_id, _MISSING)
+            if value is _MISSING:
+                missing.append(employee_id)
+            else:
+                employees[employee_id] = value
+        if missing:
+            generation = self._generation
+            loaded = await loader(missing)
+            for employee_id, value in loaded.items():
+                if generation == self._generation:
+                    self.employees.set(employee_id, value)
+                employees[employee_id] = value
+        return employees
+
+    async def get_query(self, query_key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Cached result of a list query, loading it with ``loader`` on a miss"""
+        return await self._read_through(self.queries, self.query_flights, query_key, loader)
+
+    def invalidate(self, employee_id: Optional[str] = None, broadcast: bool = True):
+        """Forget an employee (or every employee) and all cached list pages.
+
+        ``broadcast=False`` handles another worker's invalidation: a shared
+        backend was already cleared by that worker, so only local state goes.
+        """
+        self._generation += 1
+        self.invalidations += 1
+        if employee_id is None:
+            if broadcast or not self.employees.shared:
+                self.employees.clear()
+            self.employee_flights.clear()
+        else:
+            if broadcast or not self.employees.shared:
+                self.employees.delete(employee_id)
+            self.employee_flights.forget(employee_id)
+        if broadcast or not self.queries.shared:
+            self.queries.clear()
+        self.query_flights.clear()
+        if broadcast:
+            cache_bus.publish(self.BUS_CHANNEL, employee_id)
+
+    def invalidate_many(self, employee_ids: List[str], broadcast: bool = True):
+        """Forget several employees and all cached list pages, with one broadcast for all of them"""
+        self._generation += 1
+        self.invalidations += 1
+        for employee_id in employee_ids:
+            if broadcast or not self.employees.shared:
+                self.employees.delete(employee_id)
+            self.employee_flights.forget(employee_id)
+        if broadcast or not self.queries.shared:
+            self.queries.clear()
+        self.query_flights.clear()
+        if broadcast:
+            cache_bus.publish(self.BUS_CHANNEL, employee_ids)
+
+    def apply_broadcast(self, key: Union[None, str, List[str]]):
+        """Handle another worker's invalidation (one id, a list of ids or None for everything)"""
+        if isinstance(key, list):
+            self.invalidate_many(key, broadcast=False)
+        else:
+            self.invalidate(key, broadcast=False)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "employees": self.employees.stats(),
+            "queries": self.queries.stats(),
+            "invalidations": self.invalidations,
+            "single_flight": {
+                "employees": self.employee_flights.stats(),
+                "queries": self.query_flights.stats(),
+            },
+            "bus": cache_bus.stats(),
+        }
+
+EMPLOYEE_CACHE_TTL = float(os.getenv("EMPLOYEE_CACHE_TTL", "30"))
+
+# Global employee cache; every employee write path must call invalidate()
+employee_cache = EmployeeCache(
+    employees=make_cache_backend(
+        "employees", int(os.getenv("EMPLOYEE_CACHE_MAX_ENTRIES", "10000")), EMPLOYEE_CACHE_TTL
+    ),
+    queries=make_cache_backend(
+        "employee_queries", int(os.getenv("EMPLOYEE_QUERY_CACHE_MAX_ENTRIES", "256")), EMPLOYEE_CACHE_TTL
+    ),
+)
+cache_bus.subscribe(EmployeeCache.BUS_CHANNEL, employee_cache.apply_broadcast)
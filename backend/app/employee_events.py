@@ -0,0 +1,112 @@
+import asyncio
+from typing import Any, AsyncIterator, Dict, List
+
+class EmployeeListener:
+    """Base class for in-process read models kept in sync with employee writes.
+
+    Subclasses implement ``reset``, ``apply_upsert`` and ``apply_delete``.
+    Writes that arrive while the initial table load is running are buffered
+    and replayed once it finishes, so a stale scanned copy never wins over a
+    newer write.
+    """
+
+    def __init__(self):
+        self.ready = False
+        self._loading = False
+        self._pending: List[tuple] = []
+
+    def reset(self):
+        raise NotImplementedError
+
+    def apply_upsert(self, employee: Dict[str, Any]):
+        raise NotImplementedError
+
+    def apply_delete(self, employee_id: str):
+        raise NotImplementedError
+
+    def begin_load(self):
+        self.ready = False
+        self._loading = True
+        self._pending = []
+        self.reset()
+
+    def load(self, employee: Dict[str, Any]):
+        self.apply_upsert(employee)
+
+    def end_load(self):
+        pending, self._pending = self._pending, []
+        self._loading = False
+        for operation, argument in pending:
+            if operation == "upsert":
+                self.apply_upsert(argument)
+            else:
+                self.apply_delete(argument)
+        self.ready = True
+
+    def abort_load(self):
+        self._pending = []
+        self._loading = False
+        self.ready = False
+
+    def on_upsert(self, employee: Dict[str, Any]):
+        if self._loading:
+            self._pending.append(("upsert", employee))
+        else:
+            self.apply_upsert(employee)
+
+    def on_delete(self, employee_id: str):
+        if self._loading:
+            self._pending.append(("delete", employee_id))
+        else:
+            self.apply_delete(employee_id)
+
+class EmployeeEvents:
+    """Fan-out of employee writes to the registered read models"""
+
+    def __init__(self):
+        self._listeners: List[EmployeeListener] = []
+
+    def subscribe(self, listener: EmployeeListener):
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def upserted(self, employee: Dict[str, Any]):
+        """Notify listeners that an employee was created or updated"""
+        for listener in self._listeners:
+            try:
+                listener.on_upsert(employee)
+            except Exception as e:
+                print(f"Error applying employee upsert to {type(listener).__name__}: {e}")
+
+    def deleted(self, employee_id: str):
+        """Notify listeners that an employee was deleted"""
+        for listener in self._listeners:
+            try:
+                listener.on_delete(employee_id)
+            except Exception as e:
+                print(f"Error applying employee delete to {type(listener).__name__}: {e}")
+
+    async def warm(self, employees: AsyncIterator[Dict[str, Any]]) -> int:
+        """Load every listener from one pass over the employee table"""
+        listeners = list(self._listeners)
+        for listener in listeners:
+            listener.begin_load()
+        count = 0
+        try:
+            async for employee in employees:
+                for listener in listeners:
+                    listener.load(employee)
+                count += 1
+                if count % 1000 == 0:
+                    # Keep serving requests while a large directory loads
+                    await asyncio.sleep(0)
+        except BaseException:
+            for listener in listeners:
+                listener.abort_load()
+            raise
+        for listener in listeners:
+            listener.end_load()
+        return count
+
+# Global employee write hooks
+employee_events = EmployeeEvents()
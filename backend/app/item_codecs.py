@@ -0,0 +1,236 @@
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from .models.employee import EmployeeInDB
+from .models.feature_flag import FeatureFlagInDB
+from .models.feedback import FeedbackInDB
+from .models.goal import GoalInDB
+
+def _decode_any(value: Any) -> Any:
+    """Generic decoding for attributes outside the model schema"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, dict):
+        return {key: _decode_any(v) for key, v in value.items()}
+    if isinstance(value, list):
+        return [_decode_any(v) for v in value]
+    return value
+
+def _encode_any(value: Any) -> Any:
+    """Generic encoding for attributes outside the model schema"""
+    if value is None or isinstance(value, (str, bool, int, Decimal)):
+        return value
+    if isinstance(value, float):
+        return Decimal(str(value))
+    if isinstance(value, dict):
+        return {key: _encode_any(v) for key, v in value.items() if v is not None}
+    if isinstance(value, (list, tuple)):
+        return [_encode_any(v) for v in value]
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (set, bytes)):
+        return value
+    return str(value)
+
+_MISSING = object()
+
+def _decode_wire_any(value: Dict[str, Any]) -> Any:
+    """Generic decoding of a low-level client attribute value ({"S": ...}, {"N": ...})"""
+    for tag, data in value.items():
+        if tag == "S" or tag == "BOOL" or tag == "B":
+            return data
+        if tag == "N":
+            return float(data)
+        if tag == "M":
+            return {key: _decode_wire_any(v) for key, v in data.items()}
+        if tag == "L":
+            return [_decode_wire_any(v) for v in data]
+        if tag == "NULL":
+            return None
+        if tag == "NS":
+            return {float(n) for n in data}
+        if tag == "SS" or tag == "BS":
+            return set(data)
+    return None
+
+def _wire_int(data: str) -> Any:
+    try:
+        return int(data)
+    except ValueError:
+        return float(data)
+
+def _wire_decoder(tag: str, convert: Optional[Callable[[Any], Any]]) -> Callable[[Dict[str, Any]], Any]:
+    """Decoder for attributes expected to carry ``tag``; anything else is decoded generically"""
+    def decode(value: Dict[str, Any]) -> Any:
+        data = value.get(tag, _MISSING)
+        if data is _MISSING:
+            return _decode_wire_any(value)
+        return data if convert is None else convert(data)
+    return decode
+
+def _decode_int(value: Any) -> Any:
+    return int(value) if isinstance(value, Decimal) else value
+
+def _decode_float(value: Any) -> Any:
+    return float(value) if isinstance(value, Decimal) else value
+
+def _decode_date(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).date()
+    except ValueError:
+        # Left for model validation to report
+        return value
+
+def _decode_datetime(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return value
+
+def _encode_float(value: Any) -> Any:
+    return Decimal(str(value)) if isinstance(value, float) else value
+
+def _encode_temporal(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, (datetime, date)) else value
+
+def _encode_enum(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+# Field kind -> (decoder, encoder); None means the value is stored as-is
+_KIND_CODECS: Dict[str, tuple] = {
+    "str": (None, None),
+    "bool": (None, None),
+    "int": (_decode_int, None),
+    "float": (_decode_float, _encode_float),
+    "date": (_decode_date, _encode_temporal),
+    "datetime": (_decode_datetime, _encode_temporal),
+    "enum": (None, _encode_enum),
+    "any": (_decode_any, _encode_any),
+}
+
+# Field kind -> decoder of the low-level client wire format
+_KIND_WIRE_DECODERS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "str": _wire_decoder("S", None),
+    "enum": _wire_decoder("S", None),
+    "bool": _wire_decoder("BOOL", None),
+    "int": _wire_decoder("N", _wire_int),
+    "float": _wire_decoder("N", float),
+    "date": _wire_decoder("S", _decode_date),
+    "datetime": _wire_decoder("S", _decode_datetime),
+    "any": _decode_wire_any,
+}
+
+def field_kind(annotation: Any) -> str:
+    """Storage kind of a model field annotation"""
+    origin = get_origin(annotation)
+    if origin is Union:
+        kinds = {field_kind(arg) for arg in get_args(annotation) if arg is not type(None)}
+        if len(kinds) == 1:
+            return kinds.pop()
+        # e.g. Union[date, str]: parse when possible, keep the string otherwise
+        for kind in ("datetime", "date"):
+            if kind in kinds:
+                return kind
+        return "any"
+    if origin is not None or not isinstance(annotation, type):
+        return "any"
+    if issubclass(annotation, Enum):
+        return "enum"
+    if annotation is bool:
+        return "bool"
+    if annotation is int:
+        return "int"
+    if annotation is float:
+        return "float"
+    if annotation is str:
+        return "str"
+    if annotation is datetime:
+        return "datetime"
+    if annotation is date:
+        return "date"
+    return "any"
+
+class ModelCodec:
+    """DynamoDB item <-> dict conversion compiled once from a Pydantic model.
+
+    Each schema field gets a converter chosen from its annotation up front, so
+    converting an item is one dictionary lookup and at most one call per
+    attribute instead of the type probing and key-name heuristics of
+    ``parse_dynamodb_item`` / ``format_dynamodb_item``. Attributes that are
+    not part of the schema fall back to generic conversion.
+
+    ``decode_wire`` does the same for items read through the low-level client
+    (``{"S": ...}`` / ``{"N": ...}`` attribute values), skipping the resource
+    layer's TypeDeserializer and its intermediate Decimals.
+    """
+
+    def __init__(self, model: Type[BaseModel]):
+        self.model = model
+        self.kinds: Dict[str, str] = {}
+        self._decoders: Dict[str, Optional[Callable[[Any], Any]]] = {}
+        self._encoders: Dict[str, Optional[Callable[[Any], Any]]] = {}
+        self._wire_decoders: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+        for name, field in model.model_fields.items():
+            kind = field_kind(field.annotation)
+            self.kinds[name] = kind
+            self._decoders[name], self._encoders[name] = _KIND_CODECS[kind]
+            self._wire_decoders[name] = _KIND_WIRE_DECODERS[kind]
+
+    def decode(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """DynamoDB item -> dict ready for the model (Decimal -> int/float, ISO strings -> dates)"""
+        decoders = self._decoders
+        decoded = {}
+        for key, value in item.items():
+            decoder = decoders.get(key, _decode_any)
+            decoded[key] = value if decoder is None else decoder(value)
+        return decoded
+
+    def decode_wire(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Low-level client item -> the same dict ``decode`` returns for the resource item"""
+        decoders = self._wire_decoders
+        return {key: decoders.get(key, _decode_wire_any)(value) for key, value in item.items()}
+
+    def decode_many(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        decode = self.decode
+        return [decode(item) for item in items]
+
+    def encode(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Dict -> DynamoDB item (floats -> Decimal, dates -> ISO strings, None dropped)"""
+        encoders = self._encoders
+        encoded = {}
+        for key, value in data.items():
+            if value is None:
+                continue
+            encoder = encoders.get(key, _encode_any)
+            encoded[key] = value if encoder is None else encoder(value)
+        return encoded
+
+    def to_model(self, item: Dict[str, Any]) -> BaseModel:
+        return self.model(**self.decode(item))
+
+employee_codec = ModelCodec(EmployeeInDB)
+goal_codec = ModelCodec(GoalInDB)
+feedback_codec = ModelCodec(FeedbackInDB)
+feature_flag_codec = ModelCodec(FeatureFlagInDB)
+
+# Logical table name (see DynamoDBService.tables) -> codec of the items it stores
+TABLE_CODECS: Dict[str, ModelCodec] = {
+    "employees": employee_codec,
+    "goals": goal_codec,
+    "feedback": feedback_codec,
+    "feature_flags": feature_flag_codec,
+}
@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -5,8 +6,10 @@ import os
 from dotenv import load_dotenv
 
 from .routers import auth, employees, goals, feedback, ai, employees_dashboard, feature_flags
-from .database import initialize_dynamodb
-from .services.s3_service import initialize_s3
+from .database import initialize_dynamodb, close_dynamodb
+from .cache_bus import cache_bus
+from .services.import_jobs import import_job_runner
+from .services.s3_service import initialize_s3, close_s3
 from .services.bedrock_service import initialize_bedrock
 
 load_dotenv()
@@ -21,6 +24,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Mount the uploads directory (for backward compatibility)
@@ -50,8 +54,34 @@ async def startup_event():
     # Initialize Bedrock
     await initialize_bedrock()
     
+    # Receive cache invalidations from the other workers on this host
+    try:
+        cache_bus.start()
+    except OSError as e:
+        print(f"Cache invalidation bus unavailable: {e}")
+    
+    # Imports whose worker stopped resume from their last checkpoint
+    try:
+        import_job_runner.resume_orphaned()
+    except Exception as e:
+        print(f"Could not resume import jobs: {e}")
+    
+    # Load in-memory employee read models (search index, dashboard counters) in the background
+    app.state.employee_warmup = asyncio.create_task(employees.warm_employee_read_models())
+    
     print("AWS services initialization completed")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled AWS connections on shutdown"""
+    warmup = getattr(app.state, "employee_warmup", None)
+    if warmup and not warmup.done():
+        warmup.cancel()
+    await import_job_runner.shutdown()
+    cache_bus.stop()
+    await close_dynamodb()
+    await close_s3()
+
 @app.get("/")
 async def root():
     return {"message": "ZenithHR API is running with AWS services"}
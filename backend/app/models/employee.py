@@ -78,12 +78,19 @@ class EmployeeUpdate(BaseModel):
     skills: Optional[List[str]] = None
     expertise: Optional[str] = None
     experience_years: Optional[int] = None
+    
+    # Optimistic concurrency: the version last read; the update fails with 409 if it changed since
+    version: Optional[int] = None
+
+class EmployeeBatchGet(BaseModel):
+    ids: List[str] = Field(..., min_length=1, max_length=1000)
 
 class EmployeeInDB(EmployeeBase):
     id: str
     manager_name: Optional[str] = None
     created_at: Union[date, str]
     updated_at: Union[date, str]
+    version: Optional[int] = None  # incremented by every update
 
     @validator('created_at', 'updated_at', pre=True)
     def parse_date(cls, v):
@@ -0,0 +1,135 @@
+from typing import Any, Dict, List, Optional, Set
+
+from .employee_events import EmployeeListener, employee_events
+
+# Employee fields kept per node; enough to draw an org chart card
+SUMMARY_FIELDS = ("id", "name", "position", "department", "photo_url")
+
+def manager_of(employee: Dict[str, Any]) -> Optional[str]:
+    """Id of the employee's manager: ``reporting_to``, falling back to the legacy ``manager_id``"""
+    manager_id = employee.get("reporting_to") or employee.get("manager_id")
+    if not manager_id or manager_id == employee.get("id"):
+        return None
+    return manager_id
+
+class OrgHierarchy(EmployeeListener):
+    """In-memory reporting-line index built from ``reporting_to``/``manager_id``.
+
+    Each employee points at its manager and each manager holds the set of its
+    direct reports, so walking down a subtree costs the size of the subtree
+    and walking up costs the depth of the chain, however large the directory.
+    Writes move a single employee between report sets. Walks keep a visited
+    set, so a reporting cycle in the data cannot loop forever.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.reset()
+
+    def reset(self):
+        self._summaries: Dict[str, Dict[str, Any]] = {}
+        self._managers: Dict[str, str] = {}
+        self._reports: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._summaries)
+
+    def __contains__(self, employee_id: str) -> bool:
+        return employee_id in self._summaries
+
+    def summary(self, employee_id: str) -> Optional[Dict[str, Any]]:
+        summary = self._summaries.get(employee_id)
+        if summary is None:
+            return None
+        return {**summary, "reporting_to": self._managers.get(employee_id)}
+
+    def apply_upsert(self, employee: Dict[str, Any]):
+        employee_id = employee.get("id")
+        if not employee_id:
+            return
+        self._summaries[employee_id] = {field: employee.get(field) for field in SUMMARY_FIELDS}
+        manager_id = manager_of(employee)
+        previous = self._managers.get(employee_id)
+        if previous == manager_id:
+            return
+        self._unlink(employee_id)
+        if manager_id is not None:
+            self._managers[employee_id] = manager_id
+            self._reports.setdefault(manager_id, set()).add(employee_id)
+
+    def apply_delete(self, employee_id: str):
+        # Reports keep pointing at the removed manager until they are reassigned
+        self._summaries.pop(employee_id, None)
+        self._unlink(employee_id)
+
+    def _unlink(self, employee_id: str):
+        manager_id = self._managers.pop(employee_id, None)
+        if manager_id is None:
+            return
+        reports = self._reports.get(manager_id)
+        if reports is not None:
+            reports.discard(employee_id)
+            if not reports:
+                del self._reports[manager_id]
+
+    def reports(self, employee_id: str, depth: Optional[int] = 1) -> List[Dict[str, Any]]:
+        """Employees below ``employee_id`` down to ``depth`` levels (None: the whole subtree).
+
+        Breadth first, so direct reports come first; each entry carries its
+        ``level`` (1 for direct reports) and ``reporting_to``.
+        """
+        result: List[Dict[str, Any]] = []
+        visited = {employee_id}
+        level_ids = [employee_id]
+        level = 0
+        while level_ids and (depth is None or level < depth):
+            level += 1
+            next_ids = []
+            for manager_id in level_ids:
+                for report_id in sorted(self._reports.get(manager_id, ())):
+                    if report_id in visited:
+                        continue
+                    visited.add(report_id)
+                    next_ids.append(report_id)
+                    summary = self.summary(report_id)
+                    if summary is not None:
+                        summary["level"] = level
+                        result.append(summary)
+            level_ids = next_ids
+        return result
+
+    def ancestors(self, employee_id: str) -> List[Dict[str, Any]]:
+        """Managers above ``employee_id``, from the direct manager up to the top"""
+        result: List[Dict[str, Any]] = []
+        visited = {employee_id}
+        manager_id = self._managers.get(employee_id)
+        while manager_id is not None and manager_id not in visited:
+            visited.add(manager_id)
+            summary = self.summary(manager_id)
+            if summary is None:
+                break
+            result.append(summary)
+            manager_id = self._managers.get(manager_id)
+        return result
+
+    def headcount(self, employee_id: str) -> int:
+        """Number of employees anywhere below ``employee_id``"""
+        visited = {employee_id}
+        stack = [employee_id]
+        count = 0
+        while stack:
+            for report_id in self._reports.get(stack.pop(), ()):
+                if report_id in visited:
+                    continue
+                visited.add(report_id)
+                stack.append(report_id)
+                if report_id in self._summaries:
+                    count += 1
+        return count
+
+    def direct_report_count(self, employee_id: str) -> int:
+        return sum(1 for report_id in self._reports.get(employee_id, ()) if report_id in self._summaries)
+
+# Global org hierarchy, kept current by employee write hooks
+org_hierarchy = OrgHierarchy()
+employee_events.subscribe(org_hierarchy)
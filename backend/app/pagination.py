@@ -0,0 +1,50 @@
+import base64
+import hashlib
+import hmac
+import json
+from typing import Any, Dict, Optional
+
+from .security import SECRET_KEY
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed, tampered with or reused for another query"""
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+def _sign(payload: str) -> str:
+    digest = hmac.new(SECRET_KEY.encode(), payload.encode(), hashlib.sha256).digest()
+    return _b64encode(digest[:16])
+
+def query_fingerprint(request: Dict[str, Any], *extra: Any) -> str:
+    """Short digest identifying the query a cursor belongs to"""
+    material = json.dumps([request, list(extra)], sort_keys=True)
+    return hashlib.sha256(material.encode()).hexdigest()[:16]
+
+def encode_cursor(last_key: Optional[Dict[str, Any]], fingerprint: str) -> Optional[str]:
+    """Wrap a DynamoDB LastEvaluatedKey into an opaque, signed cursor"""
+    if not last_key:
+        return None
+    payload = _b64encode(json.dumps({"k": last_key, "q": fingerprint}).encode())
+    return f"{payload}.{_sign(payload)}"
+
+def decode_cursor(cursor: Optional[str], fingerprint: str) -> Optional[Dict[str, Any]]:
+    """Verify a cursor and return the ExclusiveStartKey it wraps"""
+    if not cursor:
+        return None
+    try:
+        payload, signature = cursor.split(".", 1)
+    except ValueError:
+        raise InvalidCursorError("Malformed cursor")
+    if not hmac.compare_digest(signature, _sign(payload)):
+        raise InvalidCursorError("Cursor signature mismatch")
+    try:
+        data = json.loads(_b64decode(payload))
+    except Exception:
+        raise InvalidCursorError("Malformed cursor")
+    if data.get("q") != fingerprint:
+        raise InvalidCursorError("Cursor does not belong to this query")
+    return data["k"]
@@ -0,0 +1,118 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+# Equality-filterable employee attributes and the GSI keyed on each of them
+# (see DynamoDBService.create_tables_if_not_exist).
+EMPLOYEE_INDEXES = {
+    "email": "EmailIndex",
+    "department": "DepartmentIndex",
+    "location": "LocationIndex",
+    "employee_status": "StatusIndex",
+    "employment_category": "CategoryIndex",
+    "is_leader": "LeaderIndex",
+    "position": "PositionIndex",
+    "gender": "GenderIndex",
+    "account": "AccountIndex",
+}
+
+# Rough number of distinct values per attribute in a typical directory. With
+# no live statistics, an attribute is assumed to match
+# ASSUMED_TABLE_SIZE / cardinality items per value.
+ASSUMED_TABLE_SIZE = 10000
+DEFAULT_CARDINALITY = {
+    "email": 100000,
+    "position": 500,
+    "account": 200,
+    "location": 50,
+    "department": 30,
+    "employment_category": 5,
+    "employee_status": 4,
+    "gender": 3,
+    "is_leader": 2,
+}
+
+@dataclass
+class QueryPlan:
+    """How to read the items matching a set of equality filters"""
+    operation: str                        # "query" or "scan"
+    index_name: Optional[str] = None
+    key_attribute: Optional[str] = None
+    key_value: Optional[str] = None
+    filters: Dict[str, Any] = field(default_factory=dict)  # applied as FilterExpression
+
+    @property
+    def uses_index(self) -> bool:
+        return self.operation == "query"
+
+    @property
+    def key_attributes(self) -> tuple:
+        """Attributes that make up a LastEvaluatedKey for this plan"""
+        if self.uses_index:
+            return ("id", self.key_attribute)
+        return ("id",)
+
+    def to_request(self) -> Dict[str, Any]:
+        """Build Query/Scan keyword arguments for this plan"""
+        request: Dict[str, Any] = {}
+        names: Dict[str, str] = {}
+        values: Dict[str, Any] = {}
+
+        if self.uses_index:
+            request["IndexName"] = self.index_name
+            request["KeyConditionExpression"] = "#k = :k"
+            names["#k"] = self.key_attribute
+            values[":k"] = self.key_value
+
+        conditions = []
+        for i, (attribute, value) in enumerate(sorted(self.filters.items())):
+            conditions.append(f"#f{i} = :f{i}")
+            names[f"#f{i}"] = attribute
+            values[f":f{i}"] = value
+        if conditions:
+            request["FilterExpression"] = " AND ".join(conditions)
+
+        if names:
+            request["ExpressionAttributeNames"] = names
+            request["ExpressionAttributeValues"] = values
+        return request
+
+    def describe(self) -> str:
+        if self.uses_index:
+            return f"query {self.index_name} ({self.key_attribute}={self.key_value!r}), filter on {sorted(self.filters)}"
+        return f"scan, filter on {sorted(self.filters)}"
+
+def plan_employee_query(
+    filters: Dict[str, Optional[str]],
+    estimate: Optional[Callable[[str, Any], Optional[int]]] = None
+) -> QueryPlan:
+    """Pick the most selective GSI for the given equality filters.
+
+    ``estimate(attribute, value)`` may return the expected number of matching
+    items (e.g. from live counters); attributes it cannot estimate fall back to
+    DEFAULT_CARDINALITY. The other filters become a FilterExpression, and a
+    scan is only planned when none of the filtered attributes is indexed.
+    """
+    active = {k: v for k, v in filters.items() if v is not None and v != ""}
+
+    best = None
+    best_cost = None
+    for attribute, value in active.items():
+        if attribute not in EMPLOYEE_INDEXES:
+            continue
+        cost = estimate(attribute, value) if estimate else None
+        if cost is None:
+            cost = ASSUMED_TABLE_SIZE / DEFAULT_CARDINALITY.get(attribute, 1)
+        if best_cost is None or cost < best_cost:
+            best, best_cost = attribute, cost
+
+    if best is None:
+        return QueryPlan(operation="scan", filters=active)
+
+    remaining = {k: v for k, v in active.items() if k != best}
+    return QueryPlan(
+        operation="query",
+        index_name=EMPLOYEE_INDEXES[best],
+        key_attribute=best,
+        key_value=active[best],
+        filters=remaining
+    )
@@ -1,9 +1,25 @@
-from fastapi import APIRouter, HTTPException, Depends, Query, File, UploadFile, status
-from typing import List, Optional
-from ..models.employee import EmployeeCreate, EmployeeUpdate, EmployeeInDB
-from ..database_dynamodb import get_employees_table, parse_dynamodb_item, format_dynamodb_item
+from fastapi import APIRouter, HTTPException, Depends, Query, File, UploadFile, Response, status
+from fastapi.responses import StreamingResponse
+from typing import List, Optional, Union
+from contextlib import aclosing
+import datetime
+from ..models.employee import EmployeeCreate, EmployeeUpdate, EmployeeInDB, EmployeeBatchGet
+from ..database_dynamodb import dynamodb_service, get_employees_table, ItemNotFoundError, VersionConflictError
+from ..item_codecs import employee_codec
+from ..query_planner import plan_employee_query, QueryPlan
+from ..pagination import encode_cursor, decode_cursor, query_fingerprint, InvalidCursorError
+from ..employee_events import employee_events
+from ..employee_cache import employee_cache, EmployeeCache
+from ..cache_bus import cache_bus
+from ..search_index import employee_search_index
+from ..org_hierarchy import org_hierarchy, manager_of
+from ..dashboard_aggregates import dashboard_aggregates
 from ..security import get_current_active_user
 from ..services.image_upload import ImageUploadService
+from ..services.employee_import import EmployeeImportError
+from ..services.employee_export import EXPORT_FORMATS, EmployeeExportError, check_export_format, stream_export
+from ..services.import_jobs import ImportJobConflict, import_job_runner, import_job_store
+from ..feature_flags import FeatureFlags
 import time
 
 router = APIRouter(
@@ -12,11 +28,126 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-@router.get("", response_model=List[EmployeeInDB])
-@router.get("/", response_model=List[EmployeeInDB])
-async def get_employees(
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=100),
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def iter_planned_employees(plan: QueryPlan, total_segments: Optional[int] = 1):
+    """Stream decoded employee items for a query plan.
+    
+    Scans default to a single segment, which keeps the item order stable
+    between page requests; pass None to scan with the configured number of
+    parallel segments when order does not matter.
+    """
+    request = plan.to_request()
+    if plan.uses_index:
+        return dynamodb_service.query_items("employees", codec=employee_codec, **request)
+    return dynamodb_service.scan_items("employees", total_segments=total_segments, codec=employee_codec, **request)
+
+def normalize_employee(raw: dict) -> Optional[dict]:
+    """Parse a raw employee item into the API shape, or None if it has no id"""
+    return prepare_employee(employee_codec.decode(raw))
+
+def prepare_employee(doc: dict) -> Optional[dict]:
+    """Fill API defaults on a decoded employee item, or None if it has no id"""
+    # Ensure id field exists for API model
+    if "id" not in doc and "_id" in doc:
+        doc["id"] = doc["_id"]
+    elif "id" not in doc:
+        return None
+
+    # Set photo_url to empty string if not present
+    if not doc.get("photo_url"):
+        doc["photo_url"] = ""
+    return doc
+
+async def read_employees_by_id(employee_ids: List[str]):
+    """Decoded employees keyed by id, read with BatchGetItem, and the ids left unprocessed"""
+    items, unprocessed = await dynamodb_service.batch_get_items(
+        "employees", [{"id": employee_id} for employee_id in employee_ids], codec=employee_codec
+    )
+    return {item["id"]: item for item in items if "id" in item}, [key["id"] for key in unprocessed]
+
+async def attach_manager_names(employees: List[dict]) -> List[dict]:
+    """Copies of ``employees`` with ``manager_name`` filled in.
+    
+    The distinct managers of the batch are resolved together: from the org
+    hierarchy once it is loaded, otherwise through the employee cache with
+    the misses read in one BatchGetItem. The given dicts may be shared
+    (cached pages, index documents) and are left untouched.
+    """
+    manager_ids = {manager_of(employee) for employee in employees} - {None}
+    if not manager_ids:
+        return employees
+    
+    if org_hierarchy.ready:
+        names = {}
+        for manager_id in manager_ids:
+            summary = org_hierarchy.summary(manager_id)
+            if summary is not None:
+                names[manager_id] = summary.get("name")
+    else:
+        async def load_managers(missing: List[str]) -> dict:
+            found, _unprocessed = await read_employees_by_id(missing)
+            return found
+        
+        try:
+            managers = await employee_cache.get_employees(sorted(manager_ids), load_managers)
+        except Exception as e:
+            # Names are a convenience; the employees are still returned without them
+            print(f"DEBUG: Failed to resolve manager names: {e}")
+            managers = {}
+        names = {manager_id: manager.get("name") for manager_id, manager in managers.items()}
+    
+    joined = []
+    for employee in employees:
+        manager_id = manager_of(employee)
+        joined.append({**employee, "manager_name": names[manager_id]} if manager_id in names else employee)
+    return joined
+
+def search_predicate(search: Optional[str]):
+    """Case-insensitive substring match on name, position and email"""
+    if not search:
+        return None
+    search_lower = search.lower()
+    
+    def matches(item: dict) -> bool:
+        return (
+            search_lower in (item.get("name") or "").lower()
+            or search_lower in (item.get("position") or "").lower()
+            or search_lower in (item.get("email") or "").lower()
+        )
+    return matches
+
+def page_search_results(
+    response: Response,
+    search: str,
+    filters: dict,
+    skip: int,
+    limit: int,
+    cursor: Optional[str]
+) -> List[dict]:
+    """Serve one page of ranked search results from the search index"""
+    active = {k: v for k, v in filters.items() if v}
+    fingerprint = query_fingerprint({"search": search, "filters": active})
+    offset = skip
+    if cursor:
+        try:
+            offset = decode_cursor(cursor, fingerprint)["offset"]
+        except (InvalidCursorError, KeyError, TypeError) as e:
+            raise HTTPException(status_code=400, detail=f"Invalid cursor: {e}")
+    
+    def matches_filters(employee: dict) -> bool:
+        return all(employee.get(attribute) == value for attribute, value in active.items())
+    
+    # One more than the page end tells whether a next page exists
+    ranked = employee_search_index.search(search, offset + limit + 1, where=matches_filters if active else None)
+    matches = [employee_search_index.get(employee_id) for employee_id, _score in ranked]
+    
+    page = matches[offset: offset + limit]
+    if len(matches) > offset + limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor({"offset": offset + limit}, fingerprint)
+    return page
+
+def employee_filters(
     department: Optional[str] = None,
     location: Optional[str] = None,
     employee_status: Optional[str] = None,
@@ -24,86 +155,300 @@ async def get_employees(
     is_leader: Optional[str] = None,
     position: Optional[str] = None,
     gender: Optional[str] = None,
-    account: Optional[str] = None,
+    account: Optional[str] = None
+) -> dict:
+    """Equality filters of the employee list, shared by the list and export routes"""
+    return {
+        "department": department,
+        "location": location,
+        "employee_status": employee_status,
+        "employment_category": employment_category,
+        "is_leader": is_leader,
+        "position": position,
+        "gender": gender,
+        "account": account
+    }
+
+@router.get("", response_model=List[EmployeeInDB])
+@router.get("/", response_model=List[EmployeeInDB])
+async def get_employees(
+    response: Response,
+    skip: int = Query(0, ge=0, deprecated=True, description="Offset paging; use cursor instead"),
+    limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} response header"),
+    filters: dict = Depends(employee_filters),
     search: Optional[str] = None
 ):
-    """Get all employees with optional filtering from DynamoDB"""
+    """Get all employees with optional filtering from DynamoDB.
+    
+    Pages are cursor based: when more results exist, the response carries an
+    ``X-Next-Cursor`` header to pass back as ``cursor``. Each page reads about
+    ``limit`` items. ``skip`` is kept for older clients and reads every item
+    before the offset. Pages are served from the employee cache until a write
+    invalidates them.
+    """
     try:
-        print(f"DEBUG: get_employees called with params: department={department}, location={location}, skip={skip}, limit={limit}")
-        
-        # Get table
-        table = await get_employees_table()
-        print(f"DEBUG: Table obtained: {table}")
-
-        # Simple scan to get all employees
-        print(f"DEBUG: Performing scan...")
-        resp = await table.scan(Limit=1000)  # Get up to 1000 employees
-        items = resp.get("Items", [])
-        print(f"DEBUG: Scan returned {len(items)} items")
-
-        # Parse and normalize items
-        print(f"DEBUG: Parsing {len(items)} items")
-        parsed = []
-        for i, raw in enumerate(items):
-            print(f"DEBUG: Parsing item {i+1}: {raw}")
-            doc = parse_dynamodb_item(raw)
-            print(f"DEBUG: Parsed item {i+1}: {doc}")
-            
-            # Ensure id field exists for API model
-            if "id" not in doc and "_id" in doc:
-                doc["id"] = doc["_id"]
-            elif "id" not in doc:
-                print(f"DEBUG: Skipping item {i+1} - no id field")
-                continue
-
-            # Set photo_url to empty string if not present
-            if not doc.get("photo_url"):
-                doc["photo_url"] = ""
-
-            parsed.append(doc)
-        
-        print(f"DEBUG: Final parsed items: {len(parsed)}")
-
-        # Apply search filter client-side
-        if search:
-            search_lower = search.lower()
-            parsed = [
-                d for d in parsed
-                if (
-                    search_lower in d.get("name", "").lower()
-                    or search_lower in d.get("position", "").lower()
-                    or search_lower in d.get("email", "").lower()
+        print(f"DEBUG: get_employees called with params: filters={filters}, skip={skip}, limit={limit}")
+        
+        if search and employee_search_index.ready:
+            # Ranked matches straight from the in-memory index, no table reads
+            return await attach_manager_names(page_search_results(response, search, filters, skip, limit, cursor))
+        
+        # Route equality filters to the most selective GSI; scan only when none applies
+        plan = plan_employee_query(filters, estimate=dashboard_aggregates.estimate)
+        print(f"DEBUG: get_employees plan: {plan.describe()}")
+        predicate = search_predicate(search)
+        request = plan.to_request()
+        
+        async def load_page():
+            next_cursor = None
+            if skip and not cursor:
+                # Deprecated offset mode: stream matches until the offset page is filled
+                wanted = skip + limit
+                matched = []
+                async with aclosing(iter_planned_employees(plan)) as items:
+                    async for item in items:
+                        if predicate and not predicate(item):
+                            continue
+                        matched.append(item)
+                        if len(matched) >= wanted:
+                            break
+                page = matched[skip: skip + limit]
+            else:
+                fingerprint = query_fingerprint(request, search)
+                try:
+                    start_key = decode_cursor(cursor, fingerprint)
+                except InvalidCursorError as e:
+                    raise HTTPException(status_code=400, detail=str(e))
+                
+                page, last_key = await dynamodb_service.read_page(
+                    "employees",
+                    limit,
+                    operation=plan.operation,
+                    start_key=start_key,
+                    key_attributes=plan.key_attributes,
+                    predicate=predicate,
+                    codec=employee_codec,
+                    **request
                 )
-            ]
-
-        # Apply pagination via slicing
-        sliced = parsed[skip: skip + limit]
+                next_cursor = encode_cursor(last_key, fingerprint)
+            return [doc for doc in map(prepare_employee, page) if doc], next_cursor
         
-        print(f"DEBUG: Returning {len(sliced)} employees")
-        return sliced
+        query_key = query_fingerprint(request, search, skip, limit, cursor)
+        employees, next_cursor = await employee_cache.get_query(query_key, load_page)
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
         
+        print(f"DEBUG: Returning {len(employees)} employees")
+        return await attach_manager_names(employees)
+        
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error fetching employees from DynamoDB: {e}")
         return []
 
-@router.get("/{employee_id}", response_model=EmployeeInDB)
-async def get_employee(employee_id: str):
-    """Get a specific employee by ID"""
+@router.get("/search/autocomplete")
+async def autocomplete_employees(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(10, ge=1, le=50)
+):
+    """Ranked typeahead suggestions for a name/position/email/expertise prefix"""
+    if not employee_search_index.ready:
+        raise HTTPException(status_code=503, detail="Search index is still loading")
+    return employee_search_index.autocomplete(q, limit)
+
+@router.get("/export")
+async def export_employees(
+    format: str = Query("csv", description="csv, ndjson or parquet (parquet needs pyarrow on the server)"),
+    filters: dict = Depends(employee_filters),
+    search: Optional[str] = None,
+    current_user: dict = Depends(get_current_active_user)
+):
+    """Download every employee matching the list filters as one file.
+    
+    Employees are read with a parallel scan (or an index query when a filter
+    allows it) and streamed to the client as they arrive, so memory use does
+    not grow with the table. Rows come in no particular order.
+    """
+    format = format.lower()
+    try:
+        check_export_format(format)
+    except EmployeeExportError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    plan = plan_employee_query(filters, estimate=dashboard_aggregates.estimate)
+    predicate = search_predicate(search)
+    print(f"DEBUG: export_employees format={format} plan: {plan.describe()}")
+    
+    async def employees():
+        async with aclosing(iter_planned_employees(plan, total_segments=None)) as items:
+            async for item in items:
+                if predicate and not predicate(item):
+                    continue
+                doc = prepare_employee(item)
+                if doc:
+                    yield doc
+    
+    media_type, extension = EXPORT_FORMATS[format]
+    filename = f"employees-{datetime.date.today().isoformat()}.{extension}"
+    return StreamingResponse(
+        stream_export(format, employees()),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+@router.get("/cache/stats")
+async def get_employee_cache_stats(current_user: dict = Depends(get_current_active_user)):
+    """Hit/miss, eviction and invalidation counters of the employee cache"""
+    return employee_cache.stats()
+
+@router.post("/import-csv", status_code=202)
+async def import_employees_csv(
+    file: UploadFile = File(...),
+    on_conflict: str = Query("overwrite", description="overwrite or skip employees that already exist"),
+    current_user: dict = Depends(get_current_active_user)
+):
+    """Start importing employees from a CSV/Excel file.
+    
+    The upload is spooled to disk and imported by a background job; poll
+    /import-jobs/{job_id} for progress, throughput and rejected rows.
+    Employee ids are derived from EmployeeID (or Email), so uploading the
+    same file again updates the fields the file carries (or, with
+    on_conflict=skip, keeps the employees as they are) instead of
+    duplicating them; fields the file does not carry are kept.
+    """
+    if not FeatureFlags.is_enabled("bulk_upload"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Bulk upload feature is not enabled"
+        )
+    
+    try:
+        job = await import_job_runner.submit(file, created_by=current_user.get("username"), on_conflict=on_conflict)
+    except EmployeeImportError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        print(f"Error starting employee import: {e}")
+        raise HTTPException(status_code=500, detail=f"Import failed: {str(e)}")
+    
+    job["status_url"] = f"{router.prefix}/import-jobs/{job['job_id']}"
+    return job
+
+@router.get("/import-jobs/{job_id}")
+async def get_import_job(job_id: str, current_user: dict = Depends(get_current_active_user)):
+    """Status, progress, throughput and error rows of an import job"""
+    job = import_job_store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return job
+
+@router.post("/import-jobs/{job_id}/resume", status_code=202)
+async def resume_import_job(job_id: str, current_user: dict = Depends(get_current_active_user)):
+    """Continue an interrupted or failed import after its last committed batch"""
     try:
+        job = import_job_runner.resume(job_id)
+    except ImportJobConflict as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if job is None:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    job["status_url"] = f"{router.prefix}/import-jobs/{job_id}"
+    return job
+
+async def cached_employee(employee_id: str) -> Optional[dict]:
+    """Decoded employee from the employee cache, read from the table on a miss; None if it does not exist"""
+    async def load_employee():
         table = await get_employees_table()
         response = await table.get_item(Key={"id": employee_id})
-        
         if "Item" not in response:
-            raise HTTPException(status_code=404, detail="Employee not found")
+            return None
+        return employee_codec.decode(response["Item"])
+    
+    return await employee_cache.get_employee(employee_id, load_employee)
+
+@router.post("/batch-get")
+async def batch_get_employees(request: EmployeeBatchGet):
+    """Get many employees by ID in one call.
+    
+    Cached employees are served from the employee cache; the rest are read
+    with BatchGetItem, 100 IDs per request, several requests at a time.
+    Returns the employees keyed by ID and the IDs that do not exist.
+    """
+    async def load_employees(employee_ids: List[str]) -> dict:
+        found, unprocessed = await read_employees_by_id(employee_ids)
+        if unprocessed:
+            raise HTTPException(
+                status_code=503,
+                detail=f"{len(unprocessed)} employees could not be read (throughput exceeded); try again"
+            )
+        return found
     
-        employee = parse_dynamodb_item(response["Item"])
-        return employee
+    try:
+        employee_ids = list(dict.fromkeys(request.ids))
+        employees = await employee_cache.get_employees(employee_ids, load_employees)
+        found = await attach_manager_names([employees[employee_id] for employee_id in employee_ids if employee_id in employees])
+        return {
+            "employees": {employee["id"]: EmployeeInDB(**employee) for employee in found},
+            "missing": [employee_id for employee_id in employee_ids if employee_id not in employees],
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"DEBUG: Error in batch_get_employees: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to fetch employees: {str(e)}")
+
+@router.get("/{employee_id}", response_model=EmployeeInDB)
+async def get_employee(employee_id: str):
+    """Get a specific employee by ID"""
+    try:
+        employee = await cached_employee(employee_id)
+        if employee is None:
+            raise HTTPException(status_code=404, detail="Employee not found")
+        return (await attach_manager_names([employee]))[0]
         
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch employee: {str(e)}")
 
+def hierarchy_node(employee_id: str):
+    """Check that the org hierarchy can answer for ``employee_id`` (503 while loading, 404 if unknown)"""
+    if not org_hierarchy.ready:
+        raise HTTPException(status_code=503, detail="Org hierarchy is still loading")
+    if employee_id not in org_hierarchy:
+        raise HTTPException(status_code=404, detail="Employee not found")
+
+@router.get("/{employee_id}/reports")
+async def get_employee_reports(
+    employee_id: str,
+    depth: int = Query(1, ge=1, le=50, description="Levels below the employee (1 = direct reports)")
+):
+    """Employees reporting to this employee, directly or down to ``depth`` levels"""
+    hierarchy_node(employee_id)
+    reports = org_hierarchy.reports(employee_id, depth)
+    return {
+        "employee_id": employee_id,
+        "depth": depth,
+        "reports": reports,
+        "total": len(reports),
+    }
+
+@router.get("/{employee_id}/ancestors")
+async def get_employee_ancestors(employee_id: str):
+    """Reporting chain of this employee, from the direct manager up to the top"""
+    hierarchy_node(employee_id)
+    return org_hierarchy.ancestors(employee_id)
+
+@router.get("/{employee_id}/headcount")
+async def get_employee_headcount(employee_id: str):
+    """Direct reports and total headcount of the subtree under this employee"""
+    hierarchy_node(employee_id)
+    return {
+        "employee_id": employee_id,
+        "direct_reports": org_hierarchy.direct_report_count(employee_id),
+        "headcount": org_hierarchy.headcount(employee_id),
+    }
+
 @router.post("/", response_model=EmployeeInDB, status_code=201)
 async def create_employee(employee_data: EmployeeCreate):
     """Create a new employee"""
@@ -119,12 +464,15 @@ async def create_employee(employee_data: EmployeeCreate):
         employee_dict["id"] = employee_id
         employee_dict["created_at"] = time.strftime("%Y-%m-%d")
         employee_dict["updated_at"] = time.strftime("%Y-%m-%d")
+        employee_dict["version"] = 1
         
         # Convert to DynamoDB format
-        dynamodb_item = format_dynamodb_item(employee_dict)
+        dynamodb_item = employee_codec.encode(employee_dict)
         
         # Insert into DynamoDB
         await table.put_item(Item=dynamodb_item)
+        employee_cache.invalidate(dynamodb_item["id"])
+        employee_events.upserted(normalize_employee(dynamodb_item))
         
         # Return the created employee
         return EmployeeInDB(**employee_dict)
@@ -134,38 +482,42 @@ async def create_employee(employee_data: EmployeeCreate):
 
 @router.put("/{employee_id}", response_model=EmployeeInDB)
 async def update_employee(employee_id: str, employee_update: EmployeeUpdate):
-    """Update an existing employee"""
+    """Update an existing employee.
+    
+    Only the fields sent are written, in one conditional UpdateItem that also
+    increments the employee's ``version``; fields sent as null are removed.
+    Send the ``version`` last read to have the update rejected with 409 when
+    someone else changed the employee in the meantime.
+    """
     try:
-        table = await get_employees_table()
-        
-        # Get existing employee
-        response = await table.get_item(Key={"id": employee_id})
-        if "Item" not in response:
-            raise HTTPException(status_code=404, detail="Employee not found")
-        
-        # Parse existing employee data
-        existing_employee = parse_dynamodb_item(response["Item"])
-        print(f"DEBUG: Existing employee data: {existing_employee}")
-        
         # Get update data (only fields that are being updated)
         update_data = employee_update.dict(exclude_unset=True)
-        print(f"DEBUG: Update data: {update_data}")
-        
-        # Merge existing data with update data
-        merged_data = existing_employee.copy()
-        merged_data.update(update_data)
-        merged_data["updated_at"] = time.strftime("%Y-%m-%d")
-        
-        print(f"DEBUG: Merged data: {merged_data}")
-        
-        # Convert to DynamoDB format and update
-        dynamodb_item = format_dynamodb_item(merged_data)
-        
-        # Update in DynamoDB
-        await table.put_item(Item=dynamodb_item)
+        expected_version = update_data.pop("version", None)
+        print(f"DEBUG: Update data: {update_data}, expected version: {expected_version}")
+        
+        update_data["updated_at"] = time.strftime("%Y-%m-%d")
+        removed = tuple(field for field, value in update_data.items() if value is None)
+        try:
+            item = await dynamodb_service.update_item_fields(
+                "employees",
+                {"id": employee_id},
+                employee_codec.encode(update_data),
+                remove=removed,
+                expected_version=expected_version
+            )
+        except ItemNotFoundError:
+            raise HTTPException(status_code=404, detail="Employee not found")
+        except VersionConflictError as e:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Employee was changed by someone else (now at version {e.current_version}); reload and try again"
+            )
+        employee_cache.invalidate(employee_id)
+        employee = normalize_employee(item)
+        employee_events.upserted(employee)
         
         # Return updated employee
-        return EmployeeInDB(**merged_data)
+        return EmployeeInDB(**(await attach_manager_names([employee]))[0])
         
     except HTTPException:
         raise
@@ -177,17 +529,14 @@ async def update_employee(employee_id: str, employee_update: EmployeeUpdate):
 
 @router.delete("/{employee_id}", status_code=204)
 async def delete_employee(employee_id: str):
-    """Delete an employee"""
+    """Delete an employee (one conditional DeleteItem; 404 if it does not exist)"""
     try:
-        table = await get_employees_table()
-        
-        # Check if employee exists
-        response = await table.get_item(Key={"id": employee_id})
-        if "Item" not in response:
+        try:
+            await dynamodb_service.delete_existing_item("employees", {"id": employee_id})
+        except ItemNotFoundError:
             raise HTTPException(status_code=404, detail="Employee not found")
-        
-        # Delete from DynamoDB
-        await table.delete_item(Key={"id": employee_id})
+        employee_cache.invalidate(employee_id)
+        employee_events.deleted(employee_id)
         
     except HTTPException:
         raise
@@ -200,16 +549,15 @@ async def upload_employee_photo(
     file: UploadFile = File(...),
     current_user = Depends(get_current_active_user)
 ):
-    """Upload a photo for a specific employee"""
+    """Upload a photo for a specific employee.
+    
+    Location and department (which place the photo in S3) come from the
+    in-process search index, without a table read; the new photo_url is then
+    written with one conditional UpdateItem, which also decides whether the
+    employee exists.
+    """
     try:
-        # Check if employee exists
-        table = await get_employees_table()
-        response = await table.get_item(Key={"id": employee_id})
-        if "Item" not in response:
-            raise HTTPException(status_code=404, detail="Employee not found")
-        
-        # Get employee data to extract location and department for S3 organization
-        employee_data = parse_dynamodb_item(response["Item"])
+        employee_data = employee_search_index.get(employee_id) or {}
         location = employee_data.get("location", "")
         department = employee_data.get("department", "")
         
@@ -226,31 +574,23 @@ async def upload_employee_photo(
         )
         
         print(f"DEBUG: Photo uploaded successfully, URL: {photo_url}")
-        print(f"DEBUG: Photo URL type: {type(photo_url)}")
-        print(f"DEBUG: Photo URL length: {len(photo_url) if photo_url else 'None'}")
-        
-        # Update employee record with new photo URL
-        employee_data["photo_url"] = photo_url
-        employee_data["updated_at"] = time.strftime("%Y-%m-%d")
         
-        print(f"DEBUG: Updated employee data: {employee_data}")
-        print(f"DEBUG: Photo URL in employee data: {employee_data.get('photo_url')}")
-        
-        # Save updated employee data
-        dynamodb_item = format_dynamodb_item(employee_data)
-        print(f"DEBUG: DynamoDB item to save: {dynamodb_item}")
-        await table.put_item(Item=dynamodb_item)
+        # Update only the photo URL on the employee record
+        try:
+            item = await dynamodb_service.update_item_fields(
+                "employees",
+                {"id": employee_id},
+                employee_codec.encode({"photo_url": photo_url, "updated_at": time.strftime("%Y-%m-%d")})
+            )
+        except ItemNotFoundError:
+            # No such employee (or deleted while the photo was uploading)
+            await ImageUploadService.delete_photo(photo_url)
+            raise HTTPException(status_code=404, detail="Employee not found")
+        employee_cache.invalidate(employee_id)
+        employee_events.upserted(normalize_employee(item))
         
         print(f"DEBUG: Employee record updated in DynamoDB")
         
-        # Verify the data was saved correctly
-        verify_response = await table.get_item(Key={"id": employee_id})
-        if "Item" in verify_response:
-            saved_data = parse_dynamodb_item(verify_response["Item"])
-            print(f"DEBUG: Verified saved data photo_url: {saved_data.get('photo_url')}")
-        else:
-            print("DEBUG: Could not verify saved data")
-        
         return {
             "message": "Photo uploaded successfully",
             "photo_url": photo_url,
@@ -262,3 +602,59 @@ async def upload_employee_photo(
     except Exception as e:
         print(f"Error uploading photo: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to upload photo: {str(e)}")
+
+async def warm_employee_read_models():
+    """Load the in-process employee read models from one parallel table scan"""
+    async def employees():
+        async for item in dynamodb_service.scan_items("employees", codec=employee_codec):
+            doc = prepare_employee(item)
+            if doc:
+                yield doc
+    
+    try:
+        count = await employee_events.warm(employees())
+        print(f"Employee read models loaded ({count} employees)")
+    except Exception as e:
+        print(f"Failed to load employee read models: {e}")
+
+async def refresh_employee_read_models(employee_id: Union[None, str, List[str]]):
+    """Apply an employee write made by another worker to this worker's read models"""
+    if employee_id is None:
+        await warm_employee_read_models()
+        return
+    if isinstance(employee_id, list):
+        await refresh_employees(employee_id)
+        return
+    try:
+        table = await get_employees_table()
+        response = await table.get_item(Key={"id": employee_id}, ConsistentRead=True)
+        if "Item" in response:
+            employee_events.upserted(normalize_employee(response["Item"]))
+        else:
+            employee_events.deleted(employee_id)
+    except Exception as e:
+        print(f"Failed to refresh employee {employee_id} from another worker's write: {e}")
+
+async def refresh_employees(employee_ids: List[str]):
+    """Apply a batch of another worker's writes (an import batch) with one BatchGetItem"""
+    try:
+        items, unprocessed = await dynamodb_service.batch_get_items(
+            "employees", [{"id": employee_id} for employee_id in employee_ids],
+            codec=employee_codec, consistent_read=True
+        )
+        found = set()
+        for item in items:
+            doc = prepare_employee(item)
+            if doc:
+                found.add(doc["id"])
+                employee_events.upserted(doc)
+        pending = {key["id"] for key in unprocessed}
+        for employee_id in employee_ids:
+            if employee_id not in found and employee_id not in pending:
+                employee_events.deleted(employee_id)
+        if pending:
+            print(f"Failed to refresh {len(pending)} employees from another worker's writes: still throttled")
+    except Exception as e:
+        print(f"Failed to refresh {len(employee_ids)} employees from another worker's writes: {e}")
+
+cache_bus.subscribe(EmployeeCache.BUS_CHANNEL, refresh_employee_read_models)
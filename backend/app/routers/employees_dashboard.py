@@ -1,8 +1,14 @@
-from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi import APIRouter, HTTPException, Query, Response
+from typing import List, Optional
 import datetime
 
-from ..database_dynamodb import get_employees_table, parse_dynamodb_item
+from ..models.employee import EmployeeInDB
+from ..database_dynamodb import dynamodb_service
+from ..item_codecs import employee_codec
+from ..dashboard_aggregates import DIMENSIONS, DashboardAggregates, dashboard_aggregates, parse_join_date
+from ..query_planner import plan_employee_query
+from ..pagination import encode_cursor, decode_cursor, query_fingerprint, InvalidCursorError
+from .employees import NEXT_CURSOR_HEADER, prepare_employee
 
 router = APIRouter(
     prefix="/api/employees-dashboard",
@@ -10,126 +16,161 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+async def scan_aggregates() -> DashboardAggregates:
+    """Aggregate a one-off parallel scan while the read models are still loading"""
+    aggregates = DashboardAggregates()
+    aggregates.begin_load()
+    async for item in dynamodb_service.scan_items("employees", codec=employee_codec):
+        aggregates.load(item)
+    aggregates.end_load()
+    return aggregates
+
+async def current_aggregates() -> DashboardAggregates:
+    if dashboard_aggregates.ready:
+        return dashboard_aggregates
+    return await scan_aggregates()
+
 @router.get("/")
 async def get_employees_dashboard():
-    """Get comprehensive employee analytics data for dashboard visualization"""
+    """Get comprehensive employee analytics data for dashboard visualization.
+    
+    Only aggregates are returned; member lists are fetched page by page from
+    /drilldown.
+    """
     try:
-        # Get all employees - use parallel queries for better performance
-        table = await get_employees_table()
+        aggregates = await current_aggregates()
+        return aggregates.snapshot()
         
-        # For dashboard, we need all employees, so we'll use scan but with better pagination
-        # In a production environment, consider using parallel scans or caching
-        response = await table.scan(
-            Limit=1000  # Limit initial scan to avoid timeout
+    except Exception as e:
+        print(f"Error getting dashboard data: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get dashboard data: {str(e)}"
         )
-        
-        if "Items" not in response:
-            return {
-                "total_employees": 0,
-                "monthly_headcount": [],
-                "by_account": {},
-                "by_location": {},
-                "by_employee_status": {},
-                "by_employment_category": {},
-                "by_is_leader": {},
-                "by_position": {},
-                "by_department": {},
-                "by_gender": {},
-                "employees": []
-            }
-        
-        employees = []
-        for item in response["Items"]:
-            employee = parse_dynamodb_item(item)
-            employees.append(employee)
-        
-        # Calculate monthly headcount data
-        monthly_headcount = []
-        current_year = datetime.datetime.now().year
-        
-        for month in range(1, 13):
-            month_date = datetime.datetime(current_year, month, 1)
-            end_date = datetime.datetime(current_year, month + 1, 1) if month < 12 else datetime.datetime(current_year + 1, 1, 1)
-            
-            # Count employees who joined before or during this month
-            count = 0
-            for emp in employees:
-                join_date_str = emp.get("date_of_joining") or emp.get("created_at")
-                if join_date_str:
-                    try:
-                        join_date = datetime.datetime.fromisoformat(join_date_str.replace('Z', '+00:00'))
-                        if join_date <= end_date:
-                            count += 1
-                    except:
-                        # If date parsing fails, count as joined
-                        count += 1
-            
-            monthly_headcount.append({
-                "month": month_date.strftime("%b"),
-                "count": count,
-                "month_number": month
-            })
-        
-        # Calculate distribution data
-        by_account = {}
-        by_location = {}
-        by_employee_status = {}
-        by_employment_category = {}
-        by_is_leader = {}
-        by_position = {}
-        by_department = {}
-        by_gender = {}
-        
-        for emp in employees:
-            # Account distribution
-            account = emp.get("account", "Unknown")
-            by_account[account] = by_account.get(account, 0) + 1
-            
-            # Location distribution
-            location = emp.get("location", "Unknown")
-            by_location[location] = by_location.get(location, 0) + 1
-            
-            # Employee status distribution
-            status = emp.get("employee_status", "Unknown")
-            by_employee_status[status] = by_employee_status.get(status, 0) + 1
-            
-            # Employment category distribution
-            category = emp.get("employment_category", "Unknown")
-            by_employment_category[category] = by_employment_category.get(category, 0) + 1
-            
-            # Is leader distribution
-            is_leader = emp.get("is_leader", "No")
-            by_is_leader[is_leader] = by_is_leader.get(is_leader, 0) + 1
-            
-            # Position distribution
-            position = emp.get("position", "Unknown")
-            by_position[position] = by_position.get(position, 0) + 1
-            
-            # Department distribution
-            department = emp.get("department", "Unknown")
-            by_department[department] = by_department.get(department, 0) + 1
-            
-            # Gender distribution
-            gender = emp.get("gender", "Unknown")
-            by_gender[gender] = by_gender.get(gender, 0) + 1
-        
+
+@router.get("/breakdown")
+async def get_dimension_breakdown(
+    dimension: str = Query(..., description="One of the by_* dashboard dimensions"),
+    year: Optional[int] = Query(None, ge=1900, le=2200)
+):
+    """Monthly hires and headcount of a year for every value of one dimension"""
+    if dimension not in DIMENSIONS:
+        raise HTTPException(status_code=400, detail=f"dimension must be one of {', '.join(DIMENSIONS)}")
+    year = year or datetime.date.today().year
+    try:
+        aggregates = await current_aggregates()
         return {
-            "total_employees": len(employees),
-            "monthly_headcount": monthly_headcount,
-            "by_account": by_account,
-            "by_location": by_location,
-            "by_employee_status": by_employee_status,
-            "by_employment_category": by_employment_category,
-            "by_is_leader": by_is_leader,
-            "by_position": by_position,
-            "by_department": by_department,
-            "by_gender": by_gender,
-            "employees": employees  # Include full employee data for filtering
+            "dimension": dimension,
+            "year": year,
+            "values": aggregates.breakdown(dimension, year)
         }
-        
     except Exception as e:
-        print(f"Error getting dashboard data: {e}")
+        print(f"Error getting dashboard breakdown: {e}")
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to get dashboard data: {str(e)}"
+            detail=f"Failed to get dashboard breakdown: {str(e)}"
+        )
+
+@router.get("/drilldown", response_model=List[EmployeeInDB])
+async def drilldown_employees(
+    response: Response,
+    dimension: Optional[str] = Query(None, description="One of the by_* dashboard dimensions; omit for all employees"),
+    value: Optional[str] = Query(None, description="Bucket value of the dimension"),
+    joined_from: Optional[datetime.date] = None,
+    joined_to: Optional[datetime.date] = None,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} response header")
+):
+    """Page through the employees behind one dashboard bucket.
+    
+    A dimension value is read through its GSI; the "Unknown" bucket (attribute
+    missing) and the unfiltered view fall back to a scan. The join-date window
+    is applied while paging.
+    """
+    if dimension is not None:
+        if dimension not in DIMENSIONS:
+            raise HTTPException(status_code=400, detail=f"dimension must be one of {', '.join(DIMENSIONS)}")
+        if value is None:
+            raise HTTPException(status_code=400, detail="value is required with dimension")
+    
+    if dimension is None:
+        plan = plan_employee_query({})
+        request = plan.to_request()
+    elif value == DIMENSIONS[dimension]:
+        # Employees without the attribute are not in its GSI
+        plan = plan_employee_query({})
+        request = {
+            "FilterExpression": "attribute_not_exists(#d) OR #d = :v",
+            "ExpressionAttributeNames": {"#d": dimension},
+            "ExpressionAttributeValues": {":v": value}
+        }
+    else:
+        plan = plan_employee_query({dimension: value})
+        request = plan.to_request()
+    
+    def _in_join_window(item: dict) -> bool:
+        join_date = parse_join_date(item)
+        if join_date is None:
+            return False
+        if joined_from and join_date < joined_from:
+            return False
+        if joined_to and join_date > joined_to:
+            return False
+        return True
+    
+    predicate = _in_join_window if (joined_from or joined_to) else None
+    
+    fingerprint = query_fingerprint(request, str(joined_from), str(joined_to))
+    try:
+        start_key = decode_cursor(cursor, fingerprint)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        items, last_key = await dynamodb_service.read_page(
+            "employees",
+            limit,
+            operation=plan.operation,
+            start_key=start_key,
+            key_attributes=plan.key_attributes,
+            predicate=predicate,
+            codec=employee_codec,
+            **request
+        )
+    except Exception as e:
+        print(f"Error getting dashboard drill-down: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get dashboard drill-down: {str(e)}"
+        )
+    
+    next_cursor = encode_cursor(last_key, fingerprint)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return [doc for doc in map(prepare_employee, items) if doc]
+
+@router.get("/headcount")
+async def get_headcount_series(
+    start: Optional[datetime.date] = Query(None, description="Defaults to January 1st of the current year"),
+    end: Optional[datetime.date] = Query(None, description="Defaults to December 31st of the start year"),
+    granularity: str = Query("month", pattern="^(week|month|quarter)$")
+):
+    """Headcount at the end of each week, month or quarter in a date range"""
+    start = start or datetime.date(datetime.date.today().year, 1, 1)
+    end = end or datetime.date(start.year, 12, 31)
+    try:
+        aggregates = await current_aggregates()
+        return {
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "granularity": granularity,
+            "series": aggregates.headcount_series(start, end, granularity)
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        print(f"Error getting headcount series: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get headcount series: {str(e)}"
         )
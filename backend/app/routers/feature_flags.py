@@ -1,7 +1,13 @@
 from fastapi import APIRouter, HTTPException, Depends
 from typing import List, Dict
 from ..models.feature_flag import FeatureFlagCreate, FeatureFlagUpdate, FeatureFlagInDB, FeatureFlagStatus
-from ..database_dynamodb import get_feature_flags_table, parse_dynamodb_item
+from ..database_dynamodb import dynamodb_service, get_feature_flags_table
+from ..item_codecs import feature_flag_codec
+from ..cache_backends import make_cache_backend
+from ..cache_bus import cache_bus
+from ..single_flight import SingleFlight
+from ..security import get_current_active_user
+import os
 import uuid
 from datetime import datetime
 
@@ -11,19 +17,52 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+FEATURE_FLAG_BUS_CHANNEL = "feature_flags"
+
+# Flag list and status map, read on every page load and changed rarely
+feature_flag_cache = make_cache_backend("feature_flags", 16, float(os.getenv("FEATURE_FLAG_CACHE_TTL", "30")))
+# Concurrent cache misses (e.g. every client loading at once after a change) share one scan
+feature_flag_flights = SingleFlight("feature_flags")
+# Bumped by every invalidation; a load that started before one is not stored
+feature_flag_generation = 0
+
+def invalidate_feature_flags(broadcast: bool = True):
+    """Drop cached flags here and, unless handling a broadcast, in the other workers"""
+    global feature_flag_generation
+    feature_flag_generation += 1
+    if broadcast or not feature_flag_cache.shared:
+        # A shared cache was already cleared by the worker that broadcast
+        feature_flag_cache.clear()
+    feature_flag_flights.clear()
+    if broadcast:
+        cache_bus.publish(FEATURE_FLAG_BUS_CHANNEL)
+
+cache_bus.subscribe(FEATURE_FLAG_BUS_CHANNEL, lambda _key: invalidate_feature_flags(broadcast=False))
+
+async def read_through_flags(key: str, loader):
+    """Cached value of ``key``, loading it with ``loader`` on a miss (shared by concurrent misses)"""
+    value = feature_flag_cache.get(key)
+    if value is not None:
+        return value
+    generation = feature_flag_generation
+    value = await feature_flag_flights.do(key, loader)
+    if generation == feature_flag_generation:
+        feature_flag_cache.set(key, value)
+    return value
+
 @router.get("/", response_model=List[FeatureFlagInDB])
 async def get_all_feature_flags():
     """Get all feature flags"""
     try:
-        table = await get_feature_flags_table()
-        response = await table.scan()
+        async def load_flags():
+            return [
+                item async for item in
+                dynamodb_service.scan_items("feature_flags", total_segments=1, codec=feature_flag_codec)
+            ]
         
-        feature_flags = []
-        for item in response.get('Items', []):
-            parsed_item = parse_dynamodb_item(item)
-            feature_flags.append(FeatureFlagInDB(**parsed_item))
+        items = await read_through_flags("all", load_flags)
         
-        return feature_flags
+        return [FeatureFlagInDB(**item) for item in items]
     except Exception as e:
         print(f"Error getting feature flags: {e}")
         raise HTTPException(
@@ -44,7 +83,7 @@ async def get_feature_flags_by_category(category: str):
         
         feature_flags = []
         for item in response.get('Items', []):
-            parsed_item = parse_dynamodb_item(item)
+            parsed_item = feature_flag_codec.decode(item)
             feature_flags.append(FeatureFlagInDB(**parsed_item))
         
         return feature_flags
@@ -69,7 +108,7 @@ async def get_feature_flags_by_module(module: str):
         
         feature_flags = []
         for item in response.get('Items', []):
-            parsed_item = parse_dynamodb_item(item)
+            parsed_item = feature_flag_codec.decode(item)
             feature_flags.append(FeatureFlagInDB(**parsed_item))
         
         return feature_flags
@@ -84,15 +123,20 @@ async def get_feature_flags_by_module(module: str):
 async def get_feature_flag_status():
     """Get all feature flags as a simple status map"""
     try:
-        table = await get_feature_flags_table()
-        response = await table.scan()
+        async def load_status_map():
+            status_map = {}
+            # Only the two attributes the map needs are read and decoded
+            async for item in dynamodb_service.scan_items(
+                "feature_flags",
+                total_segments=1,
+                codec=feature_flag_codec,
+                ProjectionExpression="#name, #status",
+                ExpressionAttributeNames={"#name": "name", "#status": "status"}
+            ):
+                status_map[item['name']] = item['status']
+            return status_map
         
-        status_map = {}
-        for item in response.get('Items', []):
-            parsed_item = parse_dynamodb_item(item)
-            status_map[parsed_item['name']] = parsed_item['status']
-        
-        return status_map
+        return await read_through_flags("status", load_status_map)
     except Exception as e:
         print(f"Error getting feature flag status: {e}")
         raise HTTPException(
@@ -100,6 +144,14 @@ async def get_feature_flag_status():
             detail=f"Failed to get feature flag status: {str(e)}"
         )
 
+@router.get("/cache/stats")
+async def get_feature_flag_cache_stats(current_user: dict = Depends(get_current_active_user)):
+    """Cache and single-flight (deduplicated read) counters of the flag endpoints"""
+    return {
+        "cache": feature_flag_cache.stats(),
+        "single_flight": feature_flag_flights.stats(),
+    }
+
 @router.get("/{flag_id}", response_model=FeatureFlagInDB)
 async def get_feature_flag(flag_id: str):
     """Get a specific feature flag by ID"""
@@ -110,7 +162,7 @@ async def get_feature_flag(flag_id: str):
         if 'Item' not in response:
             raise HTTPException(status_code=404, detail="Feature flag not found")
         
-        parsed_item = parse_dynamodb_item(response['Item'])
+        parsed_item = feature_flag_codec.decode(response['Item'])
         return FeatureFlagInDB(**parsed_item)
     except HTTPException:
         raise
@@ -146,6 +198,7 @@ async def create_feature_flag(feature_flag: FeatureFlagCreate):
         }
         
         await table.put_item(Item=item)
+        invalidate_feature_flags()
         
         return FeatureFlagInDB(**item)
     except Exception as e:
@@ -166,7 +219,7 @@ async def update_feature_flag(flag_id: str, feature_flag_update: FeatureFlagUpda
         if 'Item' not in response:
             raise HTTPException(status_code=404, detail="Feature flag not found")
         
-        existing_item = parse_dynamodb_item(response['Item'])
+        existing_item = feature_flag_codec.decode(response['Item'])
         
         # Update fields
         update_data = {}
@@ -210,6 +263,7 @@ async def update_feature_flag(flag_id: str, feature_flag_update: FeatureFlagUpda
             update_kwargs['ExpressionAttributeNames'] = expression_attribute_names
         
         await table.update_item(**update_kwargs)
+        invalidate_feature_flags()
         
         # Return updated item
         updated_item = {**existing_item, **update_data}
@@ -235,6 +289,7 @@ async def delete_feature_flag(flag_id: str):
             raise HTTPException(status_code=404, detail="Feature flag not found")
         
         await table.delete_item(Key={'id': flag_id})
+        invalidate_feature_flags()
         
         return {"message": "Feature flag deleted successfully"}
     except HTTPException:
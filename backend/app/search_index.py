@@ -0,0 +1,198 @@
+import bisect
+import heapq
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .employee_events import EmployeeListener, employee_events
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Ranking weight of a match in each field; a name hit outranks an expertise hit
+FIELD_WEIGHTS = {
+    "name": 4.0,
+    "position": 2.0,
+    "email": 1.5,
+    "expertise": 1.0,
+}
+EXACT_MATCH_BONUS = 2.0       # whole-token match vs. prefix match
+PREFIX_END = "\uffff"         # sorts after every token, closing a prefix's vocabulary range
+
+def tokenize(text: Any) -> List[str]:
+    """Lower-case alphanumeric tokens of a field value"""
+    if not text:
+        return []
+    if isinstance(text, (list, tuple)):
+        text = " ".join(str(part) for part in text)
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+class EmployeeSearchIndex(EmployeeListener):
+    """In-memory inverted index over employee name, position, email and expertise.
+
+    Each token maps to the employees containing it and the best field weight it
+    appears with. Prefix queries take the whole range of a sorted vocabulary
+    that starts with the term (found with bisect), so a query costs a few
+    dictionary lookups plus the size of the matching postings, and short
+    prefixes return every match; callers bound the result with ``limit``.
+    The indexed documents are kept so search results are served without
+    touching DynamoDB.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.reset()
+
+    def reset(self):
+        self._documents: Dict[str, Dict[str, Any]] = {}
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._document_tokens: Dict[str, Dict[str, float]] = {}
+        self._vocabulary: List[str] = []  # sorted distinct tokens
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def get(self, employee_id: str) -> Optional[Dict[str, Any]]:
+        return self._documents.get(employee_id)
+
+    def documents(self) -> List[Dict[str, Any]]:
+        return list(self._documents.values())
+
+    def _weighted_tokens(self, employee: Dict[str, Any]) -> Dict[str, float]:
+        weights: Dict[str, float] = {}
+        for field, weight in FIELD_WEIGHTS.items():
+            for token in tokenize(employee.get(field)):
+                if weights.get(token, 0.0) < weight:
+                    weights[token] = weight
+        return weights
+
+    def apply_upsert(self, employee: Dict[str, Any]):
+        employee_id = employee.get("id")
+        if not employee_id:
+            return
+        self.apply_delete(employee_id)
+
+        tokens = self._weighted_tokens(employee)
+        for token, weight in tokens.items():
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = {}
+                if self._loading:
+                    # Sorted once in end_load instead of per insert
+                    self._vocabulary.append(token)
+                else:
+                    bisect.insort(self._vocabulary, token)
+            posting[employee_id] = weight
+        self._document_tokens[employee_id] = tokens
+        self._documents[employee_id] = employee
+
+    def apply_delete(self, employee_id: str):
+        self._documents.pop(employee_id, None)
+        tokens = self._document_tokens.pop(employee_id, None)
+        if not tokens:
+            return
+        for token in tokens:
+            posting = self._postings.get(token)
+            if posting is None:
+                continue
+            posting.pop(employee_id, None)
+            if posting:
+                continue
+            del self._postings[token]
+            if self._loading:
+                self._vocabulary.remove(token)
+            else:
+                i = bisect.bisect_left(self._vocabulary, token)
+                if i < len(self._vocabulary) and self._vocabulary[i] == token:
+                    del self._vocabulary[i]
+
+    def end_load(self):
+        self._vocabulary.sort()
+        super().end_load()
+
+    def _term_scores(self, term: str, candidates: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+        """Score employees matching a term exactly or as a token prefix"""
+        scores: Dict[str, float] = {}
+
+        def add(posting: Dict[str, float], factor: float):
+            if candidates is not None and len(candidates) < len(posting):
+                for employee_id in candidates:
+                    weight = posting.get(employee_id)
+                    if weight is not None and scores.get(employee_id, 0.0) < weight * factor:
+                        scores[employee_id] = weight * factor
+            else:
+                for employee_id, weight in posting.items():
+                    if candidates is not None and employee_id not in candidates:
+                        continue
+                    if scores.get(employee_id, 0.0) < weight * factor:
+                        scores[employee_id] = weight * factor
+
+        exact = self._postings.get(term)
+        if exact:
+            add(exact, EXACT_MATCH_BONUS)
+
+        start = bisect.bisect_left(self._vocabulary, term)
+        end = bisect.bisect_left(self._vocabulary, term + PREFIX_END, start)
+        for i in range(start, end):
+            token = self._vocabulary[i]
+            if token != term:
+                add(self._postings[token], 1.0)
+        return scores
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        where: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> List[Tuple[str, float]]:
+        """Rank employees matching every query term (the terms may be prefixes).
+
+        Only employees accepted by ``where`` are ranked; with a ``limit`` the
+        best ones are picked with a heap instead of sorting every match.
+        """
+        terms = sorted(set(tokenize(query)), key=len, reverse=True)
+        if not terms:
+            return []
+
+        # Longest terms first: they usually have the smallest candidate sets
+        scores: Optional[Dict[str, float]] = None
+        for term in terms:
+            term_scores = self._term_scores(term, scores)
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {employee_id: score + term_scores[employee_id]
+                          for employee_id, score in scores.items() if employee_id in term_scores}
+            if not scores:
+                return []
+
+        if where is not None:
+            scores = {
+                employee_id: score for employee_id, score in scores.items()
+                if where(self._documents[employee_id])
+            }
+
+        def rank(entry):
+            employee_id, score = entry
+            return (-score, (self._documents[employee_id].get("name") or "").lower())
+
+        if limit is not None:
+            return heapq.nsmallest(limit, scores.items(), key=rank)
+        return sorted(scores.items(), key=rank)
+
+    def autocomplete(self, prefix: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Best matching employees for a typeahead prefix"""
+        suggestions = []
+        for employee_id, score in self.search(prefix, limit):
+            employee = self._documents[employee_id]
+            suggestions.append({
+                "id": employee_id,
+                "name": employee.get("name"),
+                "position": employee.get("position"),
+                "department": employee.get("department"),
+                "photo_url": employee.get("photo_url") or "",
+                "score": score
+            })
+        return suggestions
+
+# Global employee search index, kept current by employee write hooks
+employee_search_index = EmployeeSearchIndex()
+employee_events.subscribe(employee_search_index)
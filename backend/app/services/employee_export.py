@@ -0,0 +1,163 @@
+import csv
+import datetime
+import io
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, List
+
+from ..item_codecs import employee_codec
+
+# Export format -> (media type, file extension)
+EXPORT_FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+FLUSH_BYTES = 256 * 1024       # text formats are sent in chunks of about this size
+PARQUET_ROW_GROUP_ROWS = 5000  # rows buffered per Parquet row group
+
+class EmployeeExportError(Exception):
+    """The requested export cannot be produced (unknown format, missing library)"""
+
+def check_export_format(export_format: str):
+    """Raise EmployeeExportError unless ``export_format`` can be written here"""
+    if export_format not in EXPORT_FORMATS:
+        raise EmployeeExportError(f"format must be one of: {', '.join(EXPORT_FORMATS)}")
+    if export_format == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise EmployeeExportError("Parquet export needs the pyarrow package installed on the server")
+
+def export_columns() -> List[str]:
+    """Columns of the tabular formats: the employee model fields, in model order"""
+    return list(employee_codec.kinds)
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    return str(value)
+
+def _text(value: Any) -> str:
+    """Cell text of a value: ISO dates, JSON for lists and maps"""
+    if value is None:
+        return ""
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, default=_json_default)
+    return str(value)
+
+async def _csv_chunks(employees: AsyncIterable[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    columns = export_columns()
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    async for employee in employees:
+        writer.writerow([_text(employee.get(column)) for column in columns])
+        if buffer.tell() >= FLUSH_BYTES:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+async def _ndjson_chunks(employees: AsyncIterable[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    lines: List[str] = []
+    size = 0
+    async for employee in employees:
+        line = json.dumps(employee, default=_json_default)
+        lines.append(line)
+        size += len(line) + 1
+        if size >= FLUSH_BYTES:
+            yield ("\n".join(lines) + "\n").encode()
+            lines = []
+            size = 0
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+class _DrainableSink(io.RawIOBase):
+    """Write-only file that hands out what was written since the last drain"""
+
+    def __init__(self):
+        super().__init__()
+        self._buffer = bytearray()
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+def _parquet_converter(kind: str) -> Callable[[Any], Any]:
+    def number(cast):
+        def convert(value):
+            try:
+                return None if value is None or isinstance(value, bool) else cast(value)
+            except (TypeError, ValueError):
+                return None
+        return convert
+    if kind == "int":
+        return number(int)
+    if kind == "float":
+        return number(float)
+    if kind == "bool":
+        return lambda value: value if isinstance(value, bool) else None
+    return lambda value: None if value is None else _text(value)
+
+async def _parquet_chunks(employees: AsyncIterable[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    """Parquet written one row group at a time; each group is sent as soon as it is encoded"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    arrow_types = {"int": pa.int64(), "float": pa.float64(), "bool": pa.bool_()}
+    kinds = employee_codec.kinds
+    schema = pa.schema([(column, arrow_types.get(kind, pa.string())) for column, kind in kinds.items()])
+    converters = {column: _parquet_converter(kind) for column, kind in kinds.items()}
+    sink = _DrainableSink()
+    writer = pq.ParquetWriter(sink, schema, compression="snappy")
+    columns: Dict[str, List[Any]] = {column: [] for column in kinds}
+    rows = 0
+
+    def write_row_group() -> bytes:
+        nonlocal rows
+        writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+        for values in columns.values():
+            values.clear()
+        rows = 0
+        return sink.drain()
+
+    try:
+        async for employee in employees:
+            for column, values in columns.items():
+                values.append(converters[column](employee.get(column)))
+            rows += 1
+            if rows == PARQUET_ROW_GROUP_ROWS:
+                yield write_row_group()
+        if rows:
+            yield write_row_group()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+def stream_export(export_format: str, employees: AsyncIterable[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    """Encoded chunks of ``employees`` in ``export_format`` (checked with check_export_format).
+
+    Rows are encoded as they arrive and flushed in bounded chunks, so memory
+    stays flat however many employees are exported. CSV and Parquet carry the
+    employee model fields; NDJSON carries every stored attribute.
+    """
+    if export_format == "csv":
+        return _csv_chunks(employees)
+    if export_format == "ndjson":
+        return _ndjson_chunks(employees)
+    return _parquet_chunks(employees)
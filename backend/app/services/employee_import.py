@@ -0,0 +1,633 @@
+import asyncio
+import concurrent.futures
+import datetime
+import os
+import threading
+import time
+import uuid
+from contextlib import closing
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+import openpyxl
+import pandas as pd
+from botocore.exceptions import ClientError
+
+from ..database_dynamodb import dynamodb_service
+from ..employee_cache import employee_cache
+from ..employee_events import employee_events
+from ..item_codecs import employee_codec
+
+# Columns of the HR extract, in the order of the template
+EXPECTED_COLUMNS = [
+    "EmployeeID", "FirstName", "LastName", "EmploymentCategory",
+    "Gender", "EmployeeStatus", "Account", "Department",
+    "IsLeader", "Location", "Mobile", "Dob", "Doj",
+    "Email", "Position", "ProfilePic", "Expertise"
+]
+REQUIRED_FIELDS = ["FirstName", "LastName", "Position", "Department", "Email"]
+DATE_COLUMNS = ["Dob", "Doj"]
+DATE_FORMAT = "%Y-%m-%d"
+EMAIL_PATTERN = r"[^@\s]+@[^@\s]+\.[^@\s]+"
+
+BATCH_SIZE = 25  # rows written together; the checkpoint advances batch by batch
+WRITE_CONCURRENCY = int(os.getenv("EMPLOYEE_IMPORT_CONCURRENCY", "8"))
+PARSE_CHUNK_ROWS = 5000    # rows parsed and validated as one frame
+PARSE_BUFFERED_CHUNKS = 2  # validated chunks waiting for the writers
+MAX_REPORTED_ERRORS = 1000
+MAX_REPORTED_ROWS = 20     # row numbers listed per validation problem
+
+# What to do when an imported employee already exists: replace it, or keep it
+CONFLICT_MODES = ("overwrite", "skip")
+# Write errors caused by the item itself; retrying the same row cannot succeed
+PERMANENT_WRITE_ERRORS = ("ValidationException", "SerializationException", "ItemCollectionSizeLimitExceededException")
+# Namespace of the deterministic ids given to imported employees
+EMPLOYEE_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "zenith-hr/employees")
+
+class EmployeeImportError(Exception):
+    """The uploaded file as a whole cannot be imported (format, columns)"""
+
+@dataclass
+class ImportCheckpoint:
+    """How far an import is committed: every row up to ``row`` is done.
+
+    Batches commit out of order, so this is the end of the longest run of
+    fully handled batches from the start of the file; an import resumed from
+    it repeats no committed batch and skips no uncommitted row. Rows DynamoDB
+    rejected outright count as handled (``failed``), since writing them again
+    cannot succeed; the first of them are kept in ``rejections`` so a resumed
+    run still reports them.
+    """
+    row: int = 0
+    written: int = 0
+    skipped: int = 0
+    failed: int = 0
+    rejections: List[Tuple[int, str]] = field(default_factory=list)  # (row number, error) of rejected rows
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "row": self.row,
+            "written": self.written,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "rejections": [list(rejection) for rejection in self.rejections],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ImportCheckpoint":
+        return cls(
+            row=int(data.get("row", 0)),
+            written=int(data.get("written", 0)),
+            skipped=int(data.get("skipped", 0)),
+            failed=int(data.get("failed", 0)),
+            rejections=[(int(row), str(message)) for row, message in data.get("rejections", [])],
+        )
+
+@dataclass
+class ImportProgress:
+    """Running counters of an import, updated after every committed batch"""
+    total_rows: int = 0
+    valid_rows: int = 0
+    written: int = 0
+    skipped: int = 0
+    failed: int = 0
+    error_count: int = 0
+    errors: List[str] = field(default_factory=list)
+    failed_rows: List[int] = field(default_factory=list)  # rows DynamoDB rejected (first MAX_REPORTED_ERRORS)
+    validation_errors: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    checkpoint: ImportCheckpoint = field(default_factory=ImportCheckpoint)
+    resumed_from_row: int = 0
+    resumed_written: int = 0
+    started_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+
+    def record_error(self, message: str):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(message)
+
+    def record_failed_row(self, row_number: int, message: str):
+        self.record_error(f"Row {row_number}: {message}")
+        if len(self.failed_rows) < MAX_REPORTED_ERRORS:
+            self.failed_rows.append(row_number)
+
+    @classmethod
+    def resumed(cls, checkpoint: ImportCheckpoint) -> "ImportProgress":
+        """Progress of a run resumed from ``checkpoint``, carrying the counters and rejected rows before it.
+
+        Validation problems of the rows before the checkpoint are not stored;
+        the resumed run reports them again from the chunks it replays.
+        """
+        progress = cls(checkpoint=ImportCheckpoint.from_dict(checkpoint.to_dict()))
+        progress.resumed_from_row = progress.total_rows = checkpoint.row
+        progress.written = progress.resumed_written = checkpoint.written
+        progress.skipped = checkpoint.skipped
+        progress.failed = checkpoint.failed
+        progress.valid_rows = checkpoint.written + checkpoint.skipped + checkpoint.failed
+        for row_number, message in checkpoint.rejections:
+            progress.record_failed_row(row_number, message)
+        # Rejections beyond the reported ones still count as errors
+        progress.error_count = checkpoint.failed
+        return progress
+
+    def record_rejections(self, chunk: "ValidatedChunk"):
+        """Add a chunk's rejected rows to the per-problem report"""
+        self.error_count += chunk.rejected
+        for problem, (count, rows) in chunk.problems.items():
+            entry = self.validation_errors.setdefault(problem, {"count": 0, "rows": []})
+            entry["count"] += count
+            entry["rows"].extend(rows[:MAX_REPORTED_ROWS - len(entry["rows"])])
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = (self.finished_at or time.time()) - self.started_at
+        return round((self.written - self.resumed_written) / elapsed, 1) if elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total_rows": self.total_rows,
+            "valid_rows": self.valid_rows,
+            "written": self.written,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "error_count": self.error_count,
+            "errors": self.errors,
+            "failed_rows": self.failed_rows,
+            "validation_errors": self.validation_errors,
+            "checkpoint_row": self.checkpoint.row,
+            "resumed_from_row": self.resumed_from_row,
+            "rows_per_second": self.rows_per_second,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+def check_file_type(filename: str):
+    if not (filename or "").lower().endswith((".csv", ".xlsx", ".xls")):
+        raise EmployeeImportError("File must be CSV or Excel format")
+
+def check_columns(columns: Iterable[str]):
+    """Raise EmployeeImportError when the header lacks template columns"""
+    available = [str(column) for column in columns]
+    missing = [column for column in EXPECTED_COLUMNS if column not in available]
+    if missing:
+        error_message = f"Missing required columns: {', '.join(missing)}. "
+        error_message += f"Expected columns: {', '.join(EXPECTED_COLUMNS)}. "
+        error_message += f"Found columns: {', '.join(available)}"
+        raise EmployeeImportError(error_message)
+
+def check_conflict_mode(on_conflict: str):
+    if on_conflict not in CONFLICT_MODES:
+        raise EmployeeImportError(f"on_conflict must be one of: {', '.join(CONFLICT_MODES)}")
+
+def employee_import_id(employee_id: str, email: str) -> str:
+    """Item id of an imported employee, derived from its EmployeeID (or email when it has none).
+
+    Importing the same people again yields the same ids, so re-runs replace
+    or skip rows instead of duplicating them.
+    """
+    employee_id = employee_id.strip().lower()
+    key = f"employee_id:{employee_id}" if employee_id else f"email:{email.strip().lower()}"
+    return str(uuid.uuid5(EMPLOYEE_ID_NAMESPACE, key))
+
+@dataclass
+class ValidatedChunk:
+    """One chunk of parsed rows after validation"""
+    last_row: int
+    rows: int
+    employees: List[Tuple[int, Dict[str, Any]]]  # (row number, encoded item) of the valid rows
+    rejected: int
+    problems: Dict[str, Tuple[int, List[int]]]   # problem -> (row count, first row numbers)
+    replayed: bool = False  # rows before the resume checkpoint, validated again only for the report
+
+def _cell_text(value: Any) -> str:
+    """Spreadsheet cell as the text a CSV export would hold"""
+    if value is None or value != value:  # None or NaN
+        return ""
+    if isinstance(value, datetime.datetime):
+        return value.date().isoformat()
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+def validate_frame(frame: pd.DataFrame, seen_keys: Set[str]) -> Tuple[pd.DataFrame, np.ndarray, Dict[str, Tuple[int, List[int]]]]:
+    """Check a chunk of rows column by column.
+
+    ``frame`` holds text cells and is indexed by row number. Every check
+    (required fields, date formats, email shape) is one vectorised operation
+    over a column; only the duplicate-key check walks the rows, against
+    ``seen_keys`` which carries the keys of earlier chunks. Returns the
+    frame with stripped cells and a ``key`` column, the mask of accepted
+    rows and the problems found as ``{problem: (count, first row numbers)}``.
+    """
+    frame = frame.reindex(columns=EXPECTED_COLUMNS, fill_value="").fillna("")
+    frame = pd.DataFrame(
+        {column: [value.strip() for value in frame[column].tolist()] for column in EXPECTED_COLUMNS},
+        index=frame.index
+    )
+
+    problems: Dict[str, pd.Series] = {}
+    for column in REQUIRED_FIELDS:
+        problems[f"Missing required field {column}"] = frame[column] == ""
+    for column in DATE_COLUMNS:
+        values = frame[column]
+        parsed = pd.to_datetime(values, format=DATE_FORMAT, errors="coerce")
+        problems[f"Invalid date format for {column} (expected YYYY-MM-DD)"] = (values != "") & parsed.isna()
+    emails = frame["Email"]
+    problems["Invalid email address"] = (emails != "") & ~emails.str.fullmatch(EMAIL_PATTERN)
+    invalid = pd.concat(problems.values(), axis=1).any(axis=1).to_numpy()
+
+    # Same keys as employee_import_id
+    employee_ids = frame["EmployeeID"]
+    frame["key"] = ("employee_id:" + employee_ids.str.lower()).where(employee_ids != "", "email:" + emails.str.lower())
+    duplicate = np.zeros(len(frame), dtype=bool)
+    for position, key in enumerate(frame["key"].tolist()):
+        if invalid[position]:
+            continue
+        if key in seen_keys:
+            duplicate[position] = True
+        else:
+            seen_keys.add(key)
+    problems["Same EmployeeID/Email as an earlier row"] = pd.Series(duplicate, index=frame.index)
+
+    row_numbers = frame.index.to_numpy()
+    report = {}
+    for problem, mask in problems.items():
+        mask = mask.to_numpy()
+        count = int(mask.sum())
+        if count:
+            report[problem] = (count, row_numbers[mask][:MAX_REPORTED_ROWS].tolist())
+    return frame, ~(invalid | duplicate), report
+
+def frame_to_items(frame: pd.DataFrame, today: str) -> List[Tuple[int, Dict[str, Any]]]:
+    """Row numbers and encoded employee items of validated rows"""
+    if frame.empty:
+        return []
+    dates = {}
+    for column in DATE_COLUMNS:
+        parsed = pd.to_datetime(frame[column], format=DATE_FORMAT, errors="coerce")
+        dates[column] = parsed.dt.strftime(DATE_FORMAT).astype(object).where(parsed.notna(), None)
+    first_names = frame["FirstName"]
+    last_names = frame["LastName"]
+    fields = {
+        "employee_id": frame["EmployeeID"],
+        "first_name": first_names,
+        "last_name": last_names,
+        "name": (first_names + " " + last_names).str.strip(),
+        "email": frame["Email"],
+        "position": frame["Position"],
+        "department": frame["Department"],
+        "phone": frame["Mobile"],
+        "mobile": frame["Mobile"],
+        "employment_category": frame["EmploymentCategory"],
+        "gender": frame["Gender"],
+        "employee_status": frame["EmployeeStatus"],
+        "account": frame["Account"],
+        "is_leader": frame["IsLeader"],
+        "location": frame["Location"],
+        "date_of_birth": dates["Dob"],
+        "date_of_joining": dates["Doj"],
+        "photo_url": frame["ProfilePic"],
+        "expertise": frame["Expertise"],
+    }
+    ids = [str(uuid.uuid5(EMPLOYEE_ID_NAMESPACE, key)) for key in frame["key"].tolist()]
+    # Rows are assembled from plain column lists; DataFrame.to_dict boxes every cell.
+    # Blank cells are left out rather than stored as "": several of these
+    # attributes key GSIs, and DynamoDB rejects an empty string index key
+    # (failing the write of that row).
+    names = ["id", *fields]
+    values = [ids, *(column.tolist() for column in fields.values())]
+    return [
+        (row_number, employee_codec.encode({
+            **{name: value for name, value in zip(names, row) if value != ""},
+            "created_at": today,
+            "updated_at": today,
+        }))
+        for row_number, row in zip(frame.index.tolist(), zip(*values))
+    ]
+
+def _numbered(frame: pd.DataFrame, first_row: int) -> pd.DataFrame:
+    frame.index = pd.RangeIndex(first_row, first_row + len(frame))
+    return frame
+
+def _csv_frames(binary_file) -> Iterator[Any]:
+    """Header, then text-only frames of rows parsed by pandas' C reader"""
+    try:
+        reader = pd.read_csv(
+            binary_file, dtype=str, keep_default_na=False, encoding="utf-8-sig",
+            chunksize=PARSE_CHUNK_ROWS
+        )
+    except pd.errors.EmptyDataError:
+        yield []
+        return
+    with reader:
+        first_row = 1
+        for frame in reader:
+            if first_row == 1:
+                yield [str(column).strip() for column in frame.columns]
+            frame.columns = [str(column).strip() for column in frame.columns]
+            if frame.empty:
+                continue
+            yield _numbered(frame, first_row)
+            first_row += len(frame)
+
+def _xlsx_frames(binary_file) -> Iterator[Any]:
+    """Header, then frames of rows from the first worksheet in read-only (streaming) mode"""
+    workbook = openpyxl.load_workbook(binary_file, read_only=True, data_only=True)
+    try:
+        sheet_rows = workbook.active.iter_rows(values_only=True)
+        header = next(sheet_rows, None)
+        named = [
+            (position, str(value).strip()) for position, value in enumerate(header or ())
+            if value is not None and str(value).strip()
+        ]
+        columns = [column for _, column in named]
+        yield columns
+        first_row = 1
+        chunk: List[List[str]] = []
+        for values in sheet_rows:
+            if values is None or all(value is None or value == "" for value in values):
+                continue
+            chunk.append([_cell_text(values[position]) if position < len(values) else "" for position, _ in named])
+            if len(chunk) == PARSE_CHUNK_ROWS:
+                yield _numbered(pd.DataFrame(chunk, columns=columns), first_row)
+                first_row += len(chunk)
+                chunk = []
+        if chunk:
+            yield _numbered(pd.DataFrame(chunk, columns=columns), first_row)
+    finally:
+        workbook.close()
+
+def _xls_frames(binary_file) -> Iterator[Any]:
+    """Legacy .xls workbooks have no streaming reader; they are loaded whole and cut into frames"""
+    workbook = pd.read_excel(binary_file, dtype=object)
+    yield [str(column).strip() for column in workbook.columns]
+    workbook.columns = [str(column).strip() for column in workbook.columns]
+    for start in range(0, len(workbook), PARSE_CHUNK_ROWS):
+        frame = workbook.iloc[start:start + PARSE_CHUNK_ROWS].apply(lambda column: column.map(_cell_text))
+        yield _numbered(frame, start + 1)
+
+async def _stream_from_thread(produce: Callable[[], Iterator[Any]]) -> AsyncIterator[Any]:
+    """Run a blocking parser in a worker thread and yield what it produces.
+
+    Items cross over through a bounded queue, so the parser blocks once
+    ``PARSE_BUFFERED_CHUNKS`` items are waiting and memory stays flat
+    whatever the file size. Closing the generator stops the thread.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=PARSE_BUFFERED_CHUNKS)
+    stop = threading.Event()
+    finished = object()
+
+    def put(item) -> bool:
+        future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+        while True:
+            try:
+                future.result(timeout=0.5)
+                return True
+            except concurrent.futures.TimeoutError:
+                if stop.is_set():
+                    future.cancel()
+                    return False
+
+    def run():
+        try:
+            with closing(produce()) as items:
+                for item in items:
+                    if stop.is_set() or not put(item):
+                        return
+            put(finished)
+        except Exception as e:
+            put(e)
+
+    thread = loop.run_in_executor(None, run)
+    try:
+        while True:
+            item = await queue.get()
+            if item is finished:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        await thread
+
+async def open_import_file(filename: str, binary_file, start_row: int = 0) -> Tuple[List[str], AsyncIterator[ValidatedChunk]]:
+    """Header and a stream of validated chunks of a CSV or Excel file.
+
+    Parsing and validation run in a worker thread as chunks are consumed;
+    rows up to ``start_row`` are dropped unvalidated. The caller must close
+    the returned iterator (e.g. with ``aclosing``).
+    """
+    check_file_type(filename)
+    filename = filename.lower()
+    if filename.endswith(".csv"):
+        read_frames = _csv_frames
+    elif filename.endswith(".xlsx"):
+        read_frames = _xlsx_frames
+    else:
+        read_frames = _xls_frames
+
+    def produce() -> Iterator[Any]:
+        with closing(read_frames(binary_file)) as frames:
+            columns = next(frames, [])
+            yield columns
+            try:
+                check_columns(columns)
+            except EmployeeImportError:
+                return
+            seen_keys: Set[str] = set()
+            today = datetime.date.today().isoformat()
+            for frame in frames:
+                if start_row:
+                    committed = frame[frame.index <= start_row]
+                    if not committed.empty:
+                        # Replays the keys the earlier run accepted, so a duplicate
+                        # of a row before the checkpoint is still rejected, and
+                        # reports the problems the earlier run found in these rows
+                        committed, accepted, problems = validate_frame(committed, seen_keys)
+                        yield ValidatedChunk(
+                            last_row=int(committed.index[-1]),
+                            rows=len(committed),
+                            employees=[],
+                            rejected=int((~accepted).sum()),
+                            problems=problems,
+                            replayed=True,
+                        )
+                    frame = frame[frame.index > start_row]
+                    if frame.empty:
+                        continue
+                frame, accepted, problems = validate_frame(frame, seen_keys)
+                yield ValidatedChunk(
+                    last_row=int(frame.index[-1]),
+                    rows=len(frame),
+                    employees=frame_to_items(frame[accepted], today),
+                    rejected=int((~accepted).sum()),
+                    problems=problems,
+                )
+
+    chunks = _stream_from_thread(produce)
+    try:
+        columns = await chunks.__anext__()
+    except StopAsyncIteration:
+        columns = []
+    if not columns:
+        await chunks.aclose()
+        raise EmployeeImportError("File is empty")
+    return columns, chunks
+
+async def import_employees(
+    columns: List[str],
+    chunks: AsyncIterable[ValidatedChunk],
+    progress: Optional[ImportProgress] = None,
+    on_progress: Optional[Callable[[ImportProgress], Any]] = None,
+    concurrency: int = WRITE_CONCURRENCY,
+    on_conflict: str = "overwrite",
+    resume_from: Optional[ImportCheckpoint] = None
+) -> ImportProgress:
+    """Write the valid rows of ``chunks`` in concurrent batches of 25 rows.
+
+    Rows are validated per chunk before any of them is written (see
+    ``open_import_file``); rejected rows are summarised per problem in
+    ``progress.validation_errors``. Writers run behind the parser by at most
+    ``2 * concurrency`` batches, so memory stays bounded by the batch queue
+    rather than the file. ``on_progress`` is called after every committed
+    batch.
+
+    Ids are derived from EmployeeID/email, so importing a file again is
+    idempotent. By default (``on_conflict="overwrite"``) each row is one
+    UpdateItem that sets the attributes the file carries and bumps
+    ``version``: attributes the file does not carry (``reporting_to``,
+    ``bio``, ...) and those of blank cells are kept, as is ``created_at``.
+    With ``on_conflict="skip"`` existing employees are left untouched by a
+    conditional PutItem per row. A run resumed
+    from ``resume_from`` (whose chunks replay the rows up to
+    ``resume_from.row``) continues its counters and error report; a
+    ``progress`` passed for it should come from ``ImportProgress.resumed``; ``progress.checkpoint`` tracks where a later run
+    should resume. Rows DynamoDB rejects are listed in ``progress.failed_rows``
+    and do not hold the checkpoint back; throttled rows do, until a resumed
+    run writes them.
+    """
+    check_columns(columns)
+    check_conflict_mode(on_conflict)
+    if progress is None:
+        progress = ImportProgress.resumed(resume_from) if resume_from is not None else ImportProgress()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+    finished_batches: Dict[int, Tuple[int, int, int, List[Tuple[int, str]], bool]] = {}
+    next_checkpoint_batch = 0
+
+    def batch_finished(number: int, last_row: int, written: int, skipped: int, rejected: List[Tuple[int, str]], complete: bool):
+        """Advance the checkpoint over the batches that are now contiguous from the start"""
+        nonlocal next_checkpoint_batch
+        finished_batches[number] = (last_row, written, skipped, rejected, complete)
+        checkpoint = progress.checkpoint
+        while next_checkpoint_batch in finished_batches:
+            last_row, written, skipped, rejected, complete = finished_batches[next_checkpoint_batch]
+            if not complete:
+                # Rows of a batch with transient failures are retried by a resumed run
+                break
+            del finished_batches[next_checkpoint_batch]
+            checkpoint.row = last_row
+            checkpoint.written += written
+            checkpoint.skipped += skipped
+            checkpoint.failed += len(rejected)
+            checkpoint.rejections.extend(rejected[:MAX_REPORTED_ERRORS - len(checkpoint.rejections)])
+            next_checkpoint_batch += 1
+
+    def is_permanent(error: Exception) -> bool:
+        return isinstance(error, ClientError) and error.response["Error"]["Code"] in PERMANENT_WRITE_ERRORS
+
+    async def write_row(item: Dict[str, Any]) -> Any:
+        """The employee as stored after the write, or False when skip mode left an existing one alone"""
+        if on_conflict == "skip":
+            item = {**item, "version": 1}
+            return item if await dynamodb_service.put_item_if_absent("employees", item) else False
+        changes = {name: value for name, value in item.items() if name not in ("id", "created_at")}
+        return await dynamodb_service.merge_item_fields(
+            "employees", {"id": item["id"]}, changes, defaults={"created_at": item["created_at"]}
+        )
+
+    async def write(rows: List[Tuple[int, Dict[str, Any]]]) -> Tuple[List[Dict[str, Any]], List[Tuple[int, str]], int]:
+        """Write a batch: the employees written, the rows rejected (with their error) and the rows still to retry.
+
+        Rows are written concurrently, one conditional PutItem (skip mode) or
+        UpdateItem (overwrite) each, so an invalid row (an oversized item)
+        fails on its own and is rejected without holding back the others.
+        """
+        results = await asyncio.gather(*(write_row(item) for _, item in rows), return_exceptions=True)
+        written, rejected, retry = [], [], 0
+        for (row_number, item), result in zip(rows, results):
+            if result is False:
+                continue  # skip mode: already existed
+            if not isinstance(result, BaseException):
+                written.append(result)
+            elif is_permanent(result):
+                message = f"{item.get('email') or item['id']} rejected by DynamoDB: {result}"
+                progress.record_failed_row(row_number, message)
+                rejected.append((row_number, message))
+            else:
+                # Throttling or a network error: a resumed run writes the row again
+                progress.record_error(f"Row {row_number}: {item.get('email') or item['id']}: {result}")
+                retry += 1
+        return written, rejected, retry
+
+    async def writer():
+        while True:
+            entry = await queue.get()
+            if entry is None:
+                return
+            number, last_row, rows = entry
+            written, rejected, retry = await write(rows)
+            for item in written:
+                employee_events.upserted(employee_codec.decode(item))
+            if written:
+                # One broadcast per batch; other workers refresh just these employees
+                employee_cache.invalidate_many([item["id"] for item in written])
+            skipped = len(rows) - len(written) - len(rejected) - retry
+            progress.written += len(written)
+            progress.skipped += skipped
+            progress.failed += len(rejected) + retry
+            batch_finished(number, last_row, len(written), skipped, rejected, not retry)
+            if on_progress:
+                on_progress(progress)
+
+    workers = [asyncio.create_task(writer()) for _ in range(concurrency)]
+    try:
+        batch: List[Tuple[int, Dict[str, Any]]] = []
+        batch_count = 0
+        last_row = progress.checkpoint.row
+        async for chunk in chunks:
+            if chunk.replayed:
+                progress.record_rejections(chunk)
+                continue
+            progress.total_rows += chunk.rows
+            progress.valid_rows += len(chunk.employees)
+            progress.record_rejections(chunk)
+            last_row = chunk.last_row
+            for row_number, item in chunk.employees:
+                batch.append((row_number, item))
+                if len(batch) == BATCH_SIZE:
+                    await queue.put((batch_count, row_number, batch))
+                    batch_count += 1
+                    batch = []
+        if batch:
+            await queue.put((batch_count, last_row, batch))
+            batch_count += 1
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+        if next_checkpoint_batch == batch_count:
+            # Everything is committed, including invalid rows after the last batch
+            progress.checkpoint.row = max(progress.checkpoint.row, last_row)
+    finally:
+        for worker in workers:
+            worker.cancel()
+        progress.finished_at = time.time()
+    print(
+        f"Employee import finished: {progress.written}/{progress.total_rows} rows written, "
+        f"{progress.skipped} already existed, {progress.error_count} errors, {progress.rows_per_second} rows/s"
+    )
+    return progress
@@ -0,0 +1,322 @@
+import asyncio
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+import uuid
+from contextlib import aclosing
+from typing import Any, Dict, List, Optional
+
+from .employee_import import (
+    ImportCheckpoint,
+    ImportProgress,
+    check_columns,
+    check_conflict_mode,
+    check_file_type,
+    import_employees,
+    open_import_file,
+)
+
+IMPORT_JOBS_DIR = os.getenv("IMPORT_JOBS_DIR", os.path.join(tempfile.gettempdir(), "zenith-hr-import-jobs"))
+PROGRESS_SAVE_INTERVAL = 0.5  # seconds between progress writes to the job store
+ACTIVE_STATUSES = ("queued", "running")
+RESUMABLE_STATUSES = ("interrupted", "failed")
+
+class ImportJobConflict(Exception):
+    """The job is not in a state that allows the requested action"""
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def _process_start(pid: int) -> Optional[str]:
+    """Start time of a process (Linux /proc), which tells a reused PID from the process that had it"""
+    try:
+        with open(f"/proc/{pid}/stat") as stat_file:
+            stat = stat_file.read()
+    except OSError:
+        return None
+    # Field 22 (starttime); the fields after the parenthesised command name start at field 3
+    return stat.rsplit(")", 1)[1].split()[19]
+
+_worker_tokens: Dict[int, str] = {}
+
+def worker_token() -> str:
+    """Identifies this worker process across PID reuse (e.g. PID 1 again after a container restart)"""
+    pid = os.getpid()
+    if pid not in _worker_tokens:
+        _worker_tokens[pid] = f"{pid}:{_process_start(pid) or uuid.uuid4().hex}"
+    return _worker_tokens[pid]
+
+def _worker_alive(pid: Optional[int], token: Optional[str]) -> bool:
+    """Whether the worker that ran a job is still running"""
+    if not _pid_alive(pid):
+        return False
+    if pid == os.getpid():
+        # Our own PID: either we run the job, or a previous process with this PID did
+        return token == worker_token()
+    if token is None:
+        return True
+    start = _process_start(pid)
+    # Without /proc a live PID is all there is to go on
+    return start is None or token == f"{pid}:{start}"
+
+class ImportJobStore:
+    """Import job state kept in a local SQLite file.
+
+    Every worker on the host reads and writes the same file, so a job's
+    status can be polled through any worker and outlives the process that
+    ran it. Each job's checkpoint is a small JSON file next to its spooled
+    upload.
+    """
+
+    def __init__(self, directory: str = IMPORT_JOBS_DIR):
+        self.directory = directory
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def _db(self) -> sqlite3.Connection:
+        if self._connection is None or self._pid != os.getpid():
+            os.makedirs(self.directory, exist_ok=True)
+            connection = sqlite3.connect(
+                os.path.join(self.directory, "import_jobs.sqlite3"),
+                timeout=5, isolation_level=None, check_same_thread=False
+            )
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS import_jobs ("
+                "id TEXT PRIMARY KEY, status TEXT NOT NULL, filename TEXT NOT NULL, "
+                "spool_path TEXT NOT NULL, created_by TEXT, worker_pid INTEGER, "
+                "created_at REAL NOT NULL, updated_at REAL NOT NULL, progress TEXT, error TEXT, "
+                "on_conflict TEXT NOT NULL DEFAULT 'overwrite', worker_token TEXT)"
+            )
+            columns = {row["name"] for row in connection.execute("PRAGMA table_info(import_jobs)")}
+            if "on_conflict" not in columns:
+                connection.execute("ALTER TABLE import_jobs ADD COLUMN on_conflict TEXT NOT NULL DEFAULT 'overwrite'")
+            if "worker_token" not in columns:
+                connection.execute("ALTER TABLE import_jobs ADD COLUMN worker_token TEXT")
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def create(self, job_id: str, filename: str, spool_path: str, created_by: Optional[str], on_conflict: str = "overwrite"):
+        now = time.time()
+        self._db().execute(
+            "INSERT INTO import_jobs (id, status, filename, spool_path, created_by, worker_pid, worker_token, created_at, updated_at, progress, on_conflict) "
+            "VALUES (?, 'queued', ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (job_id, filename, spool_path, created_by, os.getpid(), worker_token(), now, now, json.dumps(ImportProgress().to_dict()), on_conflict)
+        )
+
+    def update(self, job_id: str, status: Optional[str] = None, progress: Optional[ImportProgress] = None, error: Optional[str] = None):
+        fields = {"updated_at": time.time(), "worker_pid": os.getpid(), "worker_token": worker_token()}
+        if status is not None:
+            fields["status"] = status
+        if progress is not None:
+            fields["progress"] = json.dumps(progress.to_dict())
+        if error is not None:
+            fields["error"] = error
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        self._db().execute(f"UPDATE import_jobs SET {assignments} WHERE id = ?", (*fields.values(), job_id))
+
+    def record(self, job_id: str) -> Optional[sqlite3.Row]:
+        return self._db().execute("SELECT * FROM import_jobs WHERE id = ?", (job_id,)).fetchone()
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        row = self.record(job_id)
+        if row is None:
+            return None
+        return {
+            "job_id": row["id"],
+            "status": row["status"],
+            "filename": row["filename"],
+            "on_conflict": row["on_conflict"],
+            "created_by": row["created_by"],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+            "error": row["error"],
+            **json.loads(row["progress"] or "{}"),
+        }
+
+    def claim(self, row: sqlite3.Row) -> bool:
+        """Requeue a job for this worker unless another worker changed it since ``row`` was read"""
+        cursor = self._db().execute(
+            "UPDATE import_jobs SET status = 'queued', worker_pid = ?, worker_token = ?, updated_at = ?, error = NULL "
+            "WHERE id = ? AND status = ? AND worker_pid IS ? AND worker_token IS ?",
+            (os.getpid(), worker_token(), time.time(), row["id"], row["status"], row["worker_pid"], row["worker_token"])
+        )
+        return cursor.rowcount == 1
+
+    def orphaned(self) -> List[sqlite3.Row]:
+        """Unfinished jobs whose worker process is gone (even if its PID now belongs to another process)"""
+        statuses = ACTIVE_STATUSES + ("interrupted",)
+        rows = self._db().execute(
+            f"SELECT * FROM import_jobs WHERE status IN ({', '.join('?' for _ in statuses)})",
+            statuses
+        ).fetchall()
+        return [row for row in rows if not _worker_alive(row["worker_pid"], row["worker_token"])]
+
+    def checkpoint_path(self, job_id: str) -> str:
+        return os.path.join(self.directory, f"{job_id}.checkpoint.json")
+
+    def save_checkpoint(self, job_id: str, checkpoint: ImportCheckpoint):
+        """Atomically replace the job's checkpoint file"""
+        path = self.checkpoint_path(job_id)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w") as checkpoint_file:
+            json.dump(checkpoint.to_dict(), checkpoint_file)
+        os.replace(temporary_path, path)
+
+    def load_checkpoint(self, job_id: str) -> Optional[ImportCheckpoint]:
+        try:
+            with open(self.checkpoint_path(job_id)) as checkpoint_file:
+                return ImportCheckpoint.from_dict(json.load(checkpoint_file))
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError) as e:
+            print(f"Ignoring unreadable checkpoint of import job {job_id}: {e}")
+            return None
+
+    def remove_files(self, job_id: str, spool_path: str):
+        """Drop a finished job's spooled upload and checkpoint"""
+        for path in (spool_path, self.checkpoint_path(job_id)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+class ImportJobRunner:
+    """Runs employee imports as background tasks of this worker.
+
+    A job's checkpoint is saved with its progress, so a job that was
+    interrupted (or failed) resumes after the last committed batch instead
+    of starting over.
+    """
+
+    def __init__(self, store: ImportJobStore):
+        self.store = store
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    async def submit(self, file, created_by: Optional[str] = None, on_conflict: str = "overwrite") -> Dict[str, Any]:
+        """Spool an upload to disk, check its header and start importing it in the background"""
+        check_file_type(file.filename)
+        check_conflict_mode(on_conflict)
+        job_id = uuid.uuid4().hex
+        os.makedirs(self.store.directory, exist_ok=True)
+        spool_path = os.path.join(self.store.directory, f"{job_id}{os.path.splitext(file.filename)[1].lower()}")
+
+        await file.seek(0)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._spool, file.file, spool_path)
+        try:
+            await self._check_header(file.filename, spool_path)
+        except Exception:
+            os.remove(spool_path)
+            raise
+
+        self.store.create(job_id, file.filename, spool_path, created_by, on_conflict)
+        self._start(job_id, file.filename, spool_path, on_conflict)
+        return self.store.get(job_id)
+
+    def resume(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Restart an interrupted, failed or orphaned job from its checkpoint; None if there is no such job"""
+        row = self.store.record(job_id)
+        if row is None:
+            return None
+        orphaned = row["status"] in ACTIVE_STATUSES and not _worker_alive(row["worker_pid"], row["worker_token"])
+        if row["status"] not in RESUMABLE_STATUSES and not orphaned:
+            raise ImportJobConflict(f"Import job is {row['status']}; only interrupted or failed jobs can be resumed")
+        if not os.path.exists(row["spool_path"]):
+            raise ImportJobConflict("The uploaded file of this import job is no longer available")
+        if not self.store.claim(row):
+            raise ImportJobConflict("Import job was resumed by another request")
+        self._start(job_id, row["filename"], row["spool_path"], row["on_conflict"])
+        return self.store.get(job_id)
+
+    def resume_orphaned(self) -> int:
+        """Take over unfinished jobs whose worker process stopped (called at startup)"""
+        resumed = 0
+        for row in self.store.orphaned():
+            if not os.path.exists(row["spool_path"]):
+                self.store.update(row["id"], status="failed", error="The uploaded file of this import job is no longer available")
+                continue
+            # Several workers start at once; only the one whose claim succeeds runs the job
+            if self.store.claim(row):
+                print(f"Resuming import job {row['id']}")
+                self._start(row["id"], row["filename"], row["spool_path"], row["on_conflict"])
+                resumed += 1
+        return resumed
+
+    def _start(self, job_id: str, filename: str, spool_path: str, on_conflict: str):
+        task = asyncio.create_task(self._run(job_id, filename, spool_path, on_conflict))
+        self._tasks[job_id] = task
+        task.add_done_callback(lambda _task: self._tasks.pop(job_id, None))
+
+    @staticmethod
+    def _spool(source, path: str):
+        with open(path, "wb") as target:
+            shutil.copyfileobj(source, target, 1024 * 1024)
+
+    @staticmethod
+    async def _check_header(filename: str, path: str):
+        with open(path, "rb") as binary_file:
+            columns, chunks = await open_import_file(filename, binary_file)
+            await chunks.aclose()
+        check_columns(columns)
+
+    async def _run(self, job_id: str, filename: str, spool_path: str, on_conflict: str):
+        checkpoint = self.store.load_checkpoint(job_id)
+        # A resumed job keeps its counters and the rows rejected before the checkpoint
+        progress = ImportProgress.resumed(checkpoint) if checkpoint else ImportProgress()
+        last_saved = 0.0
+
+        def save_progress(current: ImportProgress, force: bool = False):
+            nonlocal last_saved
+            now = time.time()
+            if force or now - last_saved >= PROGRESS_SAVE_INTERVAL:
+                last_saved = now
+                self.store.save_checkpoint(job_id, current.checkpoint)
+                self.store.update(job_id, progress=current)
+
+        self.store.update(job_id, status="running", progress=progress)
+        try:
+            with open(spool_path, "rb") as binary_file:
+                columns, chunks = await open_import_file(
+                    filename, binary_file, start_row=checkpoint.row if checkpoint else 0
+                )
+                async with aclosing(chunks):
+                    await import_employees(
+                        columns, chunks, progress, save_progress,
+                        on_conflict=on_conflict, resume_from=checkpoint
+                    )
+        except asyncio.CancelledError:
+            save_progress(progress, force=True)
+            self.store.update(job_id, status="interrupted", error="The import was stopped")
+            raise
+        except Exception as e:
+            print(f"Import job {job_id} failed: {e}")
+            save_progress(progress, force=True)
+            self.store.update(job_id, status="failed", error=str(e))
+            return
+        self.store.update(job_id, status="completed", progress=progress)
+        self.store.remove_files(job_id, spool_path)
+
+    async def shutdown(self):
+        """Stop running imports; they are left interrupted and resume on the next startup"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+# Global import job store and runner
+import_job_store = ImportJobStore()
+import_job_runner = ImportJobRunner(import_job_store)
@@ -1,23 +1,175 @@
 import os
 import uuid
 import json
-from typing import Optional
+import asyncio
+import inspect
+from typing import Any, Dict, List, Optional
+from urllib.parse import unquote, urlparse
 from fastapi import UploadFile, HTTPException
 import aioboto3
+from aiobotocore.config import AioConfig
 from botocore.exceptions import ClientError
 from dotenv import load_dotenv
 
 load_dotenv()
 
+MIN_MULTIPART_CHUNK_SIZE = 5 * 1024 * 1024  # S3 minimum for every part but the last
+
 class S3Service:
-    """S3 service for handling file uploads and storage"""
+    """S3 service for handling file uploads and storage.
+    
+    One aioboto3 client (with its HTTP connection pool) is opened per worker
+    process by ``connect()`` during application startup and shared by every
+    request until ``close()`` runs on shutdown.
+    """
     
     def __init__(self):
         self.bucket_name = os.getenv("S3_BUCKET_NAME", "zenith-hr-pulse-photos")
         self.region = os.getenv("S3_BUCKET_REGION", "us-east-1")
         self.photos_prefix = os.getenv("S3_PHOTOS_PREFIX", "profile-photos/")
         self.allowed_extensions = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
-        self.max_file_size = 5 * 1024 * 1024  # 5MB
+        self.max_file_size = int(os.getenv("S3_MAX_PHOTO_SIZE", str(20 * 1024 * 1024)))  # 20MB
+        self.max_pool_connections = int(os.getenv("S3_MAX_POOL_CONNECTIONS", "20"))
+        # Files larger than one chunk are sent as a multipart upload of chunk-sized parts;
+        # the chunk is kept below the photo limit so large photos take that path
+        self.multipart_chunk_size = max(
+            MIN_MULTIPART_CHUNK_SIZE,
+            min(int(os.getenv("S3_MULTIPART_CHUNK_SIZE", str(8 * 1024 * 1024))), self.max_file_size // 2)
+        )
+        self.multipart_concurrency = int(os.getenv("S3_MULTIPART_CONCURRENCY", "4"))
+        self.session = None
+        self.client = None
+        self._client_context = None
+        self._loop = None
+        self._lock = None
+    
+    @property
+    def is_connected(self) -> bool:
+        """Whether a pooled client is open for the running event loop"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        return self.client is not None and self._loop is loop
+    
+    async def connect(self):
+        """Open the shared session and pooled client if not already open"""
+        if self.is_connected:
+            return self
+        
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock = asyncio.Lock()
+        
+        async with self._lock:
+            if self.is_connected:
+                return self
+            if self.client is not None:
+                # Opened on an event loop that no longer runs; its connections cannot be reused
+                self._reset()
+            
+            config = AioConfig(max_pool_connections=self.max_pool_connections)
+            self.session = aioboto3.Session()
+            self._client_context = self.session.client('s3', region_name=self.region, config=config)
+            self.client = await self._client_context.__aenter__()
+            self._loop = loop
+            print(f"S3 connection pool opened (max_pool_connections={self.max_pool_connections})")
+        return self
+    
+    async def close(self):
+        """Close the shared client and release its connection pool"""
+        if self._client_context is not None and self.is_connected:
+            try:
+                await self._client_context.__aexit__(None, None, None)
+                print("S3 connection pool closed")
+            except Exception as e:
+                print(f"Error closing S3 connection pool: {e}")
+        self._reset()
+    
+    def _reset(self):
+        self.session = None
+        self.client = None
+        self._client_context = None
+        self._loop = None
+    
+    async def get_client(self):
+        """The shared S3 client, connecting first if needed"""
+        await self.connect()
+        return self.client
+    
+    @staticmethod
+    async def _read(source, size: int) -> bytes:
+        data = source.read(size)
+        if inspect.isawaitable(data):
+            data = await data
+        return data or b""
+    
+    async def upload_fileobj(self, source, key: str, **put_kwargs) -> int:
+        """Stream a file (UploadFile or binary file object) to ``key`` and return its size.
+        
+        A file of at most one chunk goes up with a single PutObject. Larger
+        files become a multipart upload: parts are read one chunk at a time
+        and up to ``multipart_concurrency`` of them are uploaded at once, so
+        memory stays bounded by the parts in flight. A failed multipart upload
+        is aborted. ``put_kwargs`` (ContentType, CacheControl, ...) apply to
+        the object either way.
+        """
+        s3 = await self.get_client()
+        chunk_size = self.multipart_chunk_size
+        first = await self._read(source, chunk_size)
+        second = await self._read(source, chunk_size) if len(first) == chunk_size else b""
+        if not second:
+            await s3.put_object(Bucket=self.bucket_name, Key=key, Body=first, **put_kwargs)
+            return len(first)
+        
+        upload = await s3.create_multipart_upload(Bucket=self.bucket_name, Key=key, **put_kwargs)
+        upload_id = upload["UploadId"]
+        slots = asyncio.Semaphore(self.multipart_concurrency)
+        parts: List[Dict[str, Any]] = []
+        tasks: List[asyncio.Task] = []
+        
+        async def upload_part(number: int, body: bytes):
+            try:
+                response = await s3.upload_part(
+                    Bucket=self.bucket_name, Key=key, UploadId=upload_id, PartNumber=number, Body=body
+                )
+                parts.append({"PartNumber": number, "ETag": response["ETag"]})
+            finally:
+                slots.release()
+        
+        size = 0
+        try:
+            body, number = first, 0
+            while body:
+                number += 1
+                await slots.acquire()
+                failed = next((task for task in tasks if task.done() and task.exception()), None)
+                if failed is not None:
+                    slots.release()
+                    raise failed.exception()
+                tasks.append(asyncio.create_task(upload_part(number, body)))
+                size += len(body)
+                if second:
+                    body, second = second, b""
+                else:
+                    body = await self._read(source, chunk_size)
+            await asyncio.gather(*tasks)
+            await s3.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": sorted(parts, key=lambda part: part["PartNumber"])}
+            )
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            try:
+                await s3.abort_multipart_upload(Bucket=self.bucket_name, Key=key, UploadId=upload_id)
+            except Exception as e:
+                print(f"Error aborting multipart upload of {key}: {e}")
+            raise
+        return size
     
     async def upload_photo(self, file: UploadFile, employee_id: str = None, location: str = None, department: str = None) -> str:
         """Upload a photo to S3 with partition-based organization and return its URL"""
@@ -30,13 +182,17 @@ class S3Service:
                     detail="File type not allowed. Use JPG, PNG, GIF, or WEBP"
                 )
             
-            # Validate file size
-            file_content = await file.read()
-            if len(file_content) > self.max_file_size:
+            # Validate file size (the upload is already spooled, so this reads nothing)
+            file_size = file.size
+            if file_size is None:
+                file.file.seek(0, os.SEEK_END)
+                file_size = file.file.tell()
+            if file_size > self.max_file_size:
                 raise HTTPException(
                     status_code=400,
-                    detail="File size too large. Maximum size is 5MB"
+                    detail=f"File size too large. Maximum size is {self.max_file_size // (1024 * 1024)}MB"
                 )
+            await file.seek(0)
             
             # Generate unique filename
             unique_filename = f"{uuid.uuid4()}{file_ext}"
@@ -52,26 +208,22 @@ class S3Service:
                 s3_key = f"{self.photos_prefix}{unique_filename}"
             
             # Upload to S3
-            session = aioboto3.Session()
-            async with session.client('s3', region_name=self.region) as s3:
-                await s3.put_object(
-                    Bucket=self.bucket_name,
-                    Key=s3_key,
-                    Body=file_content,
-                    ContentType=file.content_type or 'image/jpeg',
-                    # Use presigned URL approach for public access
-                    CacheControl='public, max-age=31536000'
-                )
+            await self.upload_fileobj(
+                file,
+                s3_key,
+                ContentType=file.content_type or 'image/jpeg',
+                # Use presigned URL approach for public access
+                CacheControl='public, max-age=31536000'
+            )
             
             # Generate a presigned URL for public access (valid for 1 year)
-            session = aioboto3.Session()
-            async with session.client('s3', region_name=self.region) as s3:
-                photo_url = await s3.generate_presigned_url(
-                    'get_object',
-                    Params={'Bucket': self.bucket_name, 'Key': s3_key},
-                    ExpiresIn=31536000  # 1 year
-                )
-                return photo_url
+            s3 = await self.get_client()
+            photo_url = await s3.generate_presigned_url(
+                'get_object',
+                Params={'Bucket': self.bucket_name, 'Key': s3_key},
+                ExpiresIn=31536000  # 1 year
+            )
+            return photo_url
             
         except HTTPException as he:
             raise he
@@ -89,16 +241,15 @@ class S3Service:
     async def delete_photo(self, photo_url: str) -> bool:
         """Delete a photo from S3"""
         try:
-            # Extract S3 key from URL
-            if not photo_url.startswith(f"https://{self.bucket_name}.s3."):
+            # Extract S3 key from URL (plain or presigned, which carries a query string)
+            url = urlparse(photo_url)
+            if url.scheme != "https" or not url.netloc.startswith(f"{self.bucket_name}.s3."):
                 return False
             
-            # Extract the key from the URL
-            s3_key = photo_url.split(f"https://{self.bucket_name}.s3.{self.region}.amazonaws.com/")[-1]
+            s3_key = unquote(url.path.lstrip("/"))
             
-            session = aioboto3.Session()
-            async with session.client('s3', region_name=self.region) as s3:
-                await s3.delete_object(Bucket=self.bucket_name, Key=s3_key)
+            s3 = await self.get_client()
+            await s3.delete_object(Bucket=self.bucket_name, Key=s3_key)
             
             return True
             
@@ -112,14 +263,13 @@ class S3Service:
     async def get_photo_url(self, s3_key: str) -> str:
         """Get the presigned URL for an S3 object"""
         try:
-            session = aioboto3.Session()
-            async with session.client('s3', region_name=self.region) as s3:
-                photo_url = await s3.generate_presigned_url(
-                    'get_object',
-                    Params={'Bucket': self.bucket_name, 'Key': s3_key},
-                    ExpiresIn=31536000  # 1 year
-                )
-                return photo_url
+            s3 = await self.get_client()
+            photo_url = await s3.generate_presigned_url(
+                'get_object',
+                Params={'Bucket': self.bucket_name, 'Key': s3_key},
+                ExpiresIn=31536000  # 1 year
+            )
+            return photo_url
         except Exception as e:
             print(f"Error generating presigned URL: {e}")
             # Fallback to direct URL
@@ -130,24 +280,23 @@ class S3Service:
         try:
             search_prefix = prefix or self.photos_prefix
             
-            session = aioboto3.Session()
-            async with session.client('s3', region_name=self.region) as s3:
-                response = await s3.list_objects_v2(
-                    Bucket=self.bucket_name,
-                    Prefix=search_prefix
-                )
-                
-                photos = []
-                if 'Contents' in response:
-                    for obj in response['Contents']:
-                        photos.append({
-                            'key': obj['Key'],
-                            'url': await self.get_photo_url(obj['Key']),
-                            'size': obj['Size'],
-                            'last_modified': obj['LastModified']
-                        })
-                
-                return photos
+            s3 = await self.get_client()
+            response = await s3.list_objects_v2(
+                Bucket=self.bucket_name,
+                Prefix=search_prefix
+            )
+            
+            photos = []
+            if 'Contents' in response:
+                for obj in response['Contents']:
+                    photos.append({
+                        'key': obj['Key'],
+                        'url': await self.get_photo_url(obj['Key']),
+                        'size': obj['Size'],
+                        'last_modified': obj['LastModified']
+                    })
+            
+            return photos
                 
         except ClientError as e:
             print(f"Error listing photos from S3: {e}")
@@ -167,24 +316,23 @@ class S3Service:
             else:
                 search_prefix = f"{self.photos_prefix}{employee_id}/"
             
-            session = aioboto3.Session()
-            async with session.client('s3', region_name=self.region) as s3:
-                response = await s3.list_objects_v2(
-                    Bucket=self.bucket_name,
-                    Prefix=search_prefix
-                )
-                
-                photos = []
-                if 'Contents' in response:
-                    for obj in response['Contents']:
-                        photos.append({
-                            'key': obj['Key'],
-                            'url': await self.get_photo_url(obj['Key']),
-                            'size': obj['Size'],
-                            'last_modified': obj['LastModified']
-                        })
-                
-                return photos
+            s3 = await self.get_client()
+            response = await s3.list_objects_v2(
+                Bucket=self.bucket_name,
+                Prefix=search_prefix
+            )
+            
+            photos = []
+            if 'Contents' in response:
+                for obj in response['Contents']:
+                    photos.append({
+                        'key': obj['Key'],
+                        'url': await self.get_photo_url(obj['Key']),
+                        'size': obj['Size'],
+                        'last_modified': obj['LastModified']
+                    })
+            
+            return photos
                 
         except ClientError as e:
             print(f"Error getting employee photos from S3: {e}")
@@ -208,34 +356,33 @@ class S3Service:
     async def create_bucket_if_not_exists(self) -> bool:
         """Create S3 bucket if it doesn't exist"""
         try:
-            session = aioboto3.Session()
-            async with session.client('s3', region_name=self.region) as s3:
-                # Check if bucket exists
-                try:
-                    await s3.head_bucket(Bucket=self.bucket_name)
-                    print(f"S3 bucket {self.bucket_name} already exists")
-                    # Ensure bucket policy is set for public read access
+            s3 = await self.get_client()
+            # Check if bucket exists
+            try:
+                await s3.head_bucket(Bucket=self.bucket_name)
+                print(f"S3 bucket {self.bucket_name} already exists")
+                # Ensure bucket policy is set for public read access
+                await self._set_bucket_policy(s3)
+                return True
+            except ClientError as e:
+                if e.response['Error']['Code'] == '404':
+                    # Bucket doesn't exist, create it
+                    if self.region == 'us-east-1':
+                        # us-east-1 doesn't need LocationConstraint
+                        await s3.create_bucket(Bucket=self.bucket_name)
+                    else:
+                        await s3.create_bucket(
+                            Bucket=self.bucket_name,
+                            CreateBucketConfiguration={'LocationConstraint': self.region}
+                        )
+                    print(f"S3 bucket {self.bucket_name} created successfully")
+                    # Set bucket policy for public read access
                     await self._set_bucket_policy(s3)
                     return True
-                except ClientError as e:
-                    if e.response['Error']['Code'] == '404':
-                        # Bucket doesn't exist, create it
-                        if self.region == 'us-east-1':
-                            # us-east-1 doesn't need LocationConstraint
-                            await s3.create_bucket(Bucket=self.bucket_name)
-                        else:
-                            await s3.create_bucket(
-                                Bucket=self.bucket_name,
-                                CreateBucketConfiguration={'LocationConstraint': self.region}
-                            )
-                        print(f"S3 bucket {self.bucket_name} created successfully")
-                        # Set bucket policy for public read access
-                        await self._set_bucket_policy(s3)
-                        return True
-                    else:
-                        print(f"Error checking S3 bucket: {e}")
-                        return False
-                        
+                else:
+                    print(f"Error checking S3 bucket: {e}")
+                    return False
+                    
         except Exception as e:
             print(f"Error creating S3 bucket: {e}")
             return False
@@ -273,8 +420,13 @@ s3_service = S3Service()
 async def initialize_s3():
     """Initialize S3 bucket"""
     try:
+        await s3_service.connect()
         await s3_service.create_bucket_if_not_exists()
         print("S3 initialization completed successfully")
     except Exception as e:
         print(f"S3 initialization failed: {e}")
         print("File uploads will not work until S3 is properly configured")
+
+async def close_s3():
+    """Release the pooled S3 client on shutdown"""
+    await s3_service.close()
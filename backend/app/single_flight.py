@@ -0,0 +1,51 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+class SingleFlight:
+    """Coalesces concurrent identical reads into one call.
+
+    The first caller for a key starts the load; callers arriving while it is
+    in flight await the same task instead of issuing their own read, and all
+    of them get its result (or its exception). The key is free again as soon
+    as the load finishes, so nothing is cached here. A waiter that is
+    cancelled does not cancel the shared load for the others.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.deduplicated = 0
+        self._flights: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Result of ``loader()``, shared with any other caller currently loading ``key``"""
+        self.calls += 1
+        flight = self._flights.get(key)
+        if flight is not None and flight.get_loop() is asyncio.get_running_loop():
+            self.deduplicated += 1
+        else:
+            flight = asyncio.ensure_future(loader())
+            self._flights[key] = flight
+            flight.add_done_callback(lambda done: self._finished(key, done))
+        return await asyncio.shield(flight)
+
+    def _finished(self, key: Hashable, flight: asyncio.Future):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not flight.cancelled():
+            # Retrieved here so an error nobody awaited any more is not reported as unhandled
+            flight.exception()
+
+    def forget(self, key: Hashable):
+        """Make the next caller for ``key`` start a new load (after a write changed what it reads)"""
+        self._flights.pop(key, None)
+
+    def clear(self):
+        self._flights.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "deduplicated": self.deduplicated,
+            "in_flight": len(self._flights),
+        }
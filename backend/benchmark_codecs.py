@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+DynamoDB Item Conversion Benchmark Script
+
+This script measures the per-item cost of converting a 10k-item page of
+employees with the generic parse_dynamodb_item / format_dynamodb_item helpers
+and with the compiled model codecs, including the client-level path that
+decodes the raw wire format directly. No AWS access is needed.
+
+Usage:
+    python benchmark_codecs.py [--items 10000] [--rounds 5]
+"""
+
+import argparse
+import random
+import time
+from decimal import Decimal
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+
+from app.database_dynamodb import parse_dynamodb_item, format_dynamodb_item
+from app.item_codecs import employee_codec
+from app.models.employee import EmployeeInDB
+
+DEPARTMENTS = ["Engineering", "Sales", "Marketing", "Finance", "People"]
+LOCATIONS = ["Chennai", "Bangalore", "London", "New York"]
+
+def make_item(i: int) -> dict:
+    """Employee item as returned by the DynamoDB resource layer"""
+    return {
+        "id": f"emp-{i:06d}",
+        "employee_id": f"E{i:06d}",
+        "first_name": f"First{i}",
+        "last_name": f"Last{i}",
+        "name": f"First{i} Last{i}",
+        "email": f"user{i}@example.com",
+        "position": "Software Engineer",
+        "department": random.choice(DEPARTMENTS),
+        "location": random.choice(LOCATIONS),
+        "employee_status": "Active",
+        "employment_category": "Permanent",
+        "gender": random.choice(["Male", "Female"]),
+        "is_leader": "No",
+        "date_of_birth": "1990-05-17",
+        "date_of_joining": f"20{random.randint(10, 24)}-0{random.randint(1, 9)}-15",
+        "photo_url": "",
+        "skills": ["Python", "React"],
+        "experience_years": Decimal(random.randint(0, 20)),
+        "performance_communication": Decimal("82.5"),
+        "performance_leadership": Decimal("77"),
+        "performance_client_feedback": Decimal("90.25"),
+        "overall_rating": Decimal("83.25"),
+        "strengths": ["Leadership"],
+        "tech_stack": [{"name": "Python", "percent": Decimal("90")}],
+        "created_at": "2024-01-01",
+        "updated_at": "2024-06-30",
+    }
+
+def timed(label: str, function, items, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start_time = time.perf_counter()
+        for item in items:
+            function(item)
+        best = min(best, time.perf_counter() - start_time)
+    per_item_us = best / len(items) * 1e6
+    print(f"  {label:<40} {best * 1000:9.2f} ms/page  {per_item_us:7.2f} us/item")
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DynamoDB item conversion")
+    parser.add_argument("--items", type=int, default=10000, help="Items per page")
+    parser.add_argument("--rounds", type=int, default=5, help="Rounds per measurement (best is reported)")
+    args = parser.parse_args()
+
+    random.seed(42)
+    items = [make_item(i) for i in range(args.items)]
+    decoded = [employee_codec.decode(item) for item in items]
+    serializer = TypeSerializer()
+    wire_items = [{key: serializer.serialize(value) for key, value in item.items()} for item in items]
+    deserializer = TypeDeserializer()
+
+    def resource_then_parse(wire_item):
+        return parse_dynamodb_item({key: deserializer.deserialize(value) for key, value in wire_item.items()})
+
+    print(f"Converting a page of {args.items} employee items (best of {args.rounds})")
+    print("=" * 80)
+
+    print("Decode (DynamoDB item -> dict):")
+    legacy = timed("parse_dynamodb_item", parse_dynamodb_item, items, args.rounds)
+    compiled = timed("employee_codec.decode", employee_codec.decode, items, args.rounds)
+    print(f"  Speedup: {legacy / compiled:.1f}x")
+
+    print("Wire format (client item -> dict):")
+    legacy = timed("TypeDeserializer + parse_dynamodb_item", resource_then_parse, wire_items, args.rounds)
+    compiled = timed("employee_codec.decode_wire", employee_codec.decode_wire, wire_items, args.rounds)
+    print(f"  Speedup: {legacy / compiled:.1f}x")
+
+    print("Decode + model validation:")
+    legacy = timed("EmployeeInDB(**parse_dynamodb_item())", lambda item: EmployeeInDB(**parse_dynamodb_item(item)), items, args.rounds)
+    compiled = timed("employee_codec.to_model", employee_codec.to_model, items, args.rounds)
+    print(f"  Speedup: {legacy / compiled:.1f}x")
+
+    print("Encode (dict -> DynamoDB item):")
+    legacy = timed("format_dynamodb_item", format_dynamodb_item, decoded, args.rounds)
+    compiled = timed("employee_codec.encode", employee_codec.encode, decoded, args.rounds)
+    print(f"  Speedup: {legacy / compiled:.1f}x")
+
+if __name__ == "__main__":
+    main()
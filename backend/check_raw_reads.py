@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+DynamoDB Raw Read Check Script
+
+This script writes a few employees to a temporary table and reads them back
+through every bulk read path of DynamoDBService (scan, paged scan and
+BatchGetItem), once with the low-level wire-format reads and once through the
+table resource, and checks that both return the same decoded employees. The
+table is deleted afterwards.
+
+It needs a real DynamoDB endpoint: AWS credentials, DynamoDB Local or moto
+(point AWS_ENDPOINT_URL at it, or pass --moto to start a moto server here).
+
+Usage:
+    python check_raw_reads.py [--moto] [--items 250]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import uuid
+
+from app.database_dynamodb import DynamoDBService
+from app.item_codecs import employee_codec
+
+def make_employee(i: int) -> dict:
+    return {
+        "id": f"check-{i:05d}",
+        "employee_id": f"E{i:05d}",
+        "name": f"Employee {i}",
+        "email": f"employee{i}@example.com",
+        "department": "Engineering" if i % 2 else "Sales",
+        "experience_years": i % 12,
+        "skills": ["python", "aws"],
+        "created_at": "2024-01-01",
+        "updated_at": "2024-01-01",
+    }
+
+async def read_all(service: DynamoDBService, ids: list) -> dict:
+    scanned = [item async for item in service.scan_items("employees", codec=employee_codec)]
+    page, _ = await service.read_page("employees", 10, codec=employee_codec)
+    fetched, unprocessed = await service.batch_get_items(
+        "employees", [{"id": employee_id} for employee_id in ids], codec=employee_codec
+    )
+    return {
+        "scan": sorted(scanned, key=lambda item: item["id"]),
+        "page": len(page),
+        "batch_get": sorted(fetched, key=lambda item: item["id"]),
+        "unprocessed": unprocessed,
+    }
+
+async def check(items: int) -> bool:
+    service = DynamoDBService()
+    table_name = f"zenith-hr-raw-read-check-{uuid.uuid4().hex[:8]}"
+    service.tables["employees"] = table_name
+    await service.connect()
+    print(f"Creating temporary table {table_name}")
+    await service.dynamodb.create_table(
+        TableName=table_name,
+        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST"
+    )
+    await service.client.get_waiter("table_exists").wait(TableName=table_name)
+    try:
+        employees = [make_employee(i) for i in range(items)]
+        table = await service.get_table("employees")
+        async with table.batch_writer() as writer:
+            for employee in employees:
+                await writer.put_item(Item=employee_codec.encode(employee))
+        ids = [employee["id"] for employee in employees] + ["check-missing"]
+
+        results = {}
+        for raw_reads in (True, False):
+            service.raw_reads = raw_reads
+            results[raw_reads] = await read_all(service, ids)
+
+        ok = True
+        for raw_reads, result in results.items():
+            label = "raw" if raw_reads else "resource"
+            for path in ("scan", "batch_get"):
+                found = len(result[path])
+                status = "✅" if found == items else "❌"
+                ok = ok and found == items
+                print(f"  {status} {label:<8} {path:<9} {found} of {items} employees")
+            if result["unprocessed"]:
+                ok = False
+                print(f"  ❌ {label:<8} batch_get left {len(result['unprocessed'])} keys unprocessed")
+        for path in ("scan", "batch_get"):
+            same = results[True][path] == results[False][path]
+            ok = ok and same
+            print(f"  {'✅' if same else '❌'} raw and resource {path} results {'match' if same else 'differ'}")
+        sample = results[True]["scan"][0] if results[True]["scan"] else {}
+        print(f"Sample decoded employee: {sample}")
+        return ok
+    finally:
+        await service.client.delete_table(TableName=table_name)
+        print(f"Deleted temporary table {table_name}")
+        await service.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Check DynamoDB raw (wire format) reads against a real table")
+    parser.add_argument("--moto", action="store_true", help="Start a local moto server and check against it")
+    parser.add_argument("--items", type=int, default=250, help="Employees written to the temporary table")
+    args = parser.parse_args()
+
+    if args.moto:
+        from moto.server import ThreadedMotoServer
+        server = ThreadedMotoServer(port=0, verbose=False)
+        server.start()
+        host, port = server.get_host_and_port()
+        os.environ["AWS_ENDPOINT_URL"] = f"http://{host}:{port}"
+        os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+        os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
+    ok = asyncio.run(check(args.items))
+    print("All read paths agree" if ok else "Read paths disagree")
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
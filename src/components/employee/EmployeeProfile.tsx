@@ -345,7 +345,7 @@ export function EmployeeProfile({ isOpen, onClose, employee }: EmployeeProfilePr
                       </div>
                     </div>
                     <p className="text-xs text-muted-foreground">
-                      Upload a new profile picture (JPG, PNG, GIF). Maximum file size: 5MB
+                      Upload a new profile picture (JPG, PNG, GIF). Maximum file size: 20MB
                     </p>
                     {photo && (
                       <p className="text-xs text-blue-600 font-medium">
@@ -31,10 +31,12 @@ export interface Employee {
   dateOfBirth?: string;
   dateOfJoining?: string;
   gender?: string;
+  version?: number;
 }
 
 // API base URL - could be moved to environment config
 const API_BASE_URL = 'http://localhost:8000/api';
+const IMPORT_POLL_INTERVAL_MS = 1000;
 
 export function useEmployees() {
   const [employees, setEmployees] = useState<Employee[]>(globalEmployees);
@@ -285,7 +287,8 @@ export function useEmployees() {
             account: emp.account || "",
             dateOfBirth: emp.date_of_birth || "",
             dateOfJoining: emp.date_of_joining || "",
-            gender: emp.gender || ""
+            gender: emp.gender || "",
+            version: emp.version ?? undefined
           };
         });
         
@@ -498,6 +501,51 @@ export function useEmployees() {
     }
   };
 
+  // Get many employees by ID in one request, keyed by ID (unknown IDs are left out)
+  const getEmployeesByIds = async (ids: string[]): Promise<Record<string, Employee>> => {
+    if (ids.length === 0) {
+      return {};
+    }
+    try {
+      const response = await fetch(`${API_BASE_URL}/employees/batch-get`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ ids }),
+      });
+
+      if (!response.ok) {
+        throw new Error(`Error ${response.status}: ${response.statusText}`);
+      }
+
+      const data = await response.json();
+      const result: Record<string, Employee> = {};
+      Object.entries(data.employees as Record<string, any>).forEach(([id, emp]) => {
+        result[id] = {
+          id: emp.id,
+          name: emp.name,
+          position: emp.position,
+          department: emp.department,
+          photoUrl: emp.photo_url,
+          email: emp.email,
+          phone: emp.phone,
+          bio: emp.bio,
+          startDate: emp.start_date,
+          manager: emp.manager_name,
+          skills: emp.skills,
+          version: emp.version
+        };
+      });
+      return result;
+    } catch (err) {
+      toast({
+        title: 'Error',
+        description: 'Failed to load employee details.',
+        variant: 'destructive',
+      });
+      return {};
+    }
+  };
+
   // Create a new employee
   const createEmployee = async (employeeData: Omit<Employee, 'id'>): Promise<Employee | null> => {
     try {
@@ -608,10 +656,20 @@ export function useEmployees() {
           employment_category: formattedData.employmentCategory,
           employee_status: formattedData.employeeStatus,
           account: formattedData.account,
-          is_leader: formattedData.isLeader
+          is_leader: formattedData.isLeader,
+          version: formattedData.version
         }),
       });
       
+      if (response.status === 409) {
+        toast({
+          title: 'Update conflict',
+          description: 'Someone else changed this employee in the meantime. Reload to see the latest details and try again.',
+          variant: 'destructive',
+        });
+        return null;
+      }
+      
       if (!response.ok) {
         throw new Error(`Error ${response.status}: ${response.statusText}`);
       }
@@ -639,7 +697,8 @@ export function useEmployees() {
         location: data.location || "",
         dateOfBirth: data.date_of_birth || "",
         dateOfJoining: data.date_of_joining || "",
-        gender: data.gender || ""
+        gender: data.gender || "",
+        version: data.version ?? undefined
       };
       
       // Update global state
@@ -736,14 +795,29 @@ export function useEmployees() {
         throw new Error(`Error ${response.status}: ${response.statusText}`);
       }
       
-      const result = await response.json();
+      // The import runs as a background job; poll it until it finishes
+      let job = await response.json();
+      while (job.status === 'queued' || job.status === 'running') {
+        await new Promise((resolve) => setTimeout(resolve, IMPORT_POLL_INTERVAL_MS));
+        const statusResponse = await fetch(`${API_BASE_URL}/employees/import-jobs/${job.job_id}`, { headers });
+        if (!statusResponse.ok) {
+          throw new Error(`Error ${statusResponse.status}: ${statusResponse.statusText}`);
+        }
+        job = await statusResponse.json();
+      }
       
       // Refresh employee list
       await fetchEmployees();  // Added await
       
+      if (job.status !== 'completed') {
+        throw new Error(job.error || `Import ${job.status}`);
+      }
+      
       toast({
         title: 'Import successful',
-        description: `${result.inserted || result.successful_imports} employees have been imported.`,  // Handle both response formats
+        description: job.error_count
+          ? `${job.written} employees have been imported, ${job.error_count} rows were rejected.`
+          : `${job.written} employees have been imported.`,
       });
       
       return true;
@@ -810,6 +884,7 @@ export function useEmployees() {
     error,
     fetchEmployees,
     getEmployee,
+    getEmployeesByIds,
     createEmployee,
     updateEmployee,
     deleteEmployee,
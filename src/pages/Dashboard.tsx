@@ -45,6 +45,7 @@ interface Employee {
 interface DashboardData {
   total_employees: number;
   monthly_headcount: Array<{ month: string; count: number; month_number: number }>;
+  undated_employees?: number;
   by_account: { [key: string]: number };
   by_location: { [key: string]: number };
   by_employee_status: { [key: string]: number };
@@ -53,20 +54,42 @@ interface DashboardData {
   by_position: { [key: string]: number };
   by_department: { [key: string]: number };
   by_gender: { [key: string]: number };
-  employees: Employee[];
+}
+
+// Monthly hires and end-of-month headcount per value of the selected dimension
+interface DimensionBreakdown {
+  [value: string]: { hires: number[]; headcount: number[] };
+}
+
+interface DrilldownParams {
+  dimension?: string;
+  value?: string;
+  joined_from?: string;
+  joined_to?: string;
 }
 
 interface ChartDataPoint {
   month: string;
   count: number;
   month_number: number;
-  employees?: Employee[];
 }
 
+const DASHBOARD_API = 'http://localhost:8000/api/employees-dashboard';
+const DRILLDOWN_PAGE_SIZE = 500;
+
+const toIsoDate = (date: Date) => {
+  const pad = (n: number) => String(n).padStart(2, '0');
+  return `${date.getFullYear()}-${pad(date.getMonth() + 1)}-${pad(date.getDate())}`;
+};
+
+const monthStart = (year: number, month: number) => toIsoDate(new Date(year, month - 1, 1));
+const monthEnd = (year: number, month: number) => toIsoDate(new Date(year, month, 0));
+
 export default function Dashboard() {
   const [sidebarOpen, setSidebarOpen] = useState(false);
   const [activeModule, setActiveModule] = useState<string>("Dashboard");
   const [dashboardData, setDashboardData] = useState<DashboardData | null>(null);
+  const [breakdown, setBreakdown] = useState<DimensionBreakdown | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [selectedFilter, setSelectedFilter] = useState<string>("all");
@@ -74,8 +97,12 @@ export default function Dashboard() {
   const [selectedDataPoint, setSelectedDataPoint] = useState<ChartDataPoint | null>(null);
   const [showModal, setShowModal] = useState(false);
   const [filteredEmployees, setFilteredEmployees] = useState<Employee[]>([]);
+  const [drilldownLoading, setDrilldownLoading] = useState(false);
+  const [drilldownParams, setDrilldownParams] = useState<DrilldownParams>({});
+  const [drilldownCursor, setDrilldownCursor] = useState<string | null>(null);
   
   const toggleSidebar = () => setSidebarOpen(!sidebarOpen);
+  const current_year = new Date().getFullYear();
 
   // Fetch dashboard data
   useEffect(() => {
@@ -94,7 +121,7 @@ export default function Dashboard() {
         return;
       }
       
-      const response = await fetch('http://localhost:8000/api/employees-dashboard/');
+      const response = await fetch(`${DASHBOARD_API}/`);
       
       if (!response.ok) {
         throw new Error(`HTTP error! status: ${response.status}`);
@@ -112,99 +139,115 @@ export default function Dashboard() {
     }
   };
 
+  // Fetch the per-category monthly series for the selected dimension
+  useEffect(() => {
+    if (selectedFilter === "all") {
+      setBreakdown(null);
+      return;
+    }
+
+    let cancelled = false;
+    const fetchBreakdown = async () => {
+      try {
+        const params = new URLSearchParams({ dimension: selectedFilter, year: String(current_year) });
+        const response = await fetch(`${DASHBOARD_API}/breakdown?${params}`);
+        if (!response.ok) {
+          throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        const data = await response.json();
+        if (!cancelled) {
+          setBreakdown(data.values);
+        }
+      } catch (err) {
+        console.error('Failed to fetch dashboard breakdown:', err);
+        if (!cancelled) {
+          setBreakdown({});
+        }
+      }
+    };
+    fetchBreakdown();
+    return () => {
+      cancelled = true;
+    };
+  }, [selectedFilter]);
+
+  // Fetch one page of a drill-down; the X-Next-Cursor header points at the next one
+  const fetchDrilldownPage = async (params: DrilldownParams, cursor: string | null) => {
+    setDrilldownLoading(true);
+    try {
+      const query = new URLSearchParams({ limit: String(DRILLDOWN_PAGE_SIZE) });
+      Object.entries(params).forEach(([key, value]) => {
+        if (value !== undefined) {
+          query.set(key, value);
+        }
+      });
+      if (cursor) {
+        query.set('cursor', cursor);
+      }
+      const response = await fetch(`${DASHBOARD_API}/drilldown?${query}`);
+      if (!response.ok) {
+        throw new Error(`HTTP error! status: ${response.status}`);
+      }
+      const page: Employee[] = await response.json();
+      setFilteredEmployees(previous => (cursor ? [...previous, ...page] : page));
+      setDrilldownCursor(response.headers.get('X-Next-Cursor'));
+    } catch (err) {
+      console.error('Failed to fetch dashboard drill-down:', err);
+    } finally {
+      setDrilldownLoading(false);
+    }
+  };
+
+  // Load the employees behind a clicked data point
+  const openDrilldown = async (dataPoint: ChartDataPoint, params: DrilldownParams) => {
+    setSelectedDataPoint(dataPoint);
+    setFilteredEmployees([]);
+    setDrilldownParams(params);
+    setDrilldownCursor(null);
+    setShowModal(true);
+    await fetchDrilldownPage(params, null);
+  };
+
+  const loadMoreDrilldown = () => {
+    if (drilldownCursor && !drilldownLoading) {
+      fetchDrilldownPage(drilldownParams, drilldownCursor);
+    }
+  };
+
   // Apply filters to data
   useEffect(() => {
     if (dashboardData) {
       applyFilters();
     }
-  }, [dashboardData, selectedFilter, filterValue]);
+  }, [dashboardData, breakdown, selectedFilter, filterValue]);
 
   const applyFilters = () => {
     if (!dashboardData) return;
 
-    // Calculate monthly headcount data for multi-line chart
-    const monthly_headcount = [];
-    const current_year = new Date().getFullYear();
-    
-    // Get all unique categories for the selected filter
-    const categories = new Set<string>();
-    dashboardData.employees.forEach(emp => {
-      const fieldValue = emp[selectedFilter as keyof Employee];
-      if (fieldValue && fieldValue !== "Unknown") {
-        categories.add(fieldValue);
-      }
-    });
-    
+    const categories = getChartCategories();
+
     // If no filter selected or no categories, show total count
-    if (selectedFilter === "all" || categories.size === 0) {
-      for (let month = 1; month <= 12; month++) {
-        const month_date = new Date(current_year, month - 1, 1);
-        const end_date = new Date(current_year, month, 1);
-        
-        let count = 0;
-        for (const emp of dashboardData.employees) {
-          const join_date_str = emp.date_of_joining || emp.created_at;
-          if (join_date_str) {
-            try {
-              const join_date = new Date(join_date_str);
-              if (join_date <= end_date) {
-                count += 1;
-              }
-            } catch {
-              count += 1;
-            }
-          }
-        }
-        
-        monthly_headcount.push({
-          month: month_date.toLocaleDateString('en-US', { month: 'short' }),
-          count,
-          month_number: month,
-          employees: dashboardData.employees
-        });
-      }
-    } else {
-      // Generate data for each category
-      for (let month = 1; month <= 12; month++) {
-        const month_date = new Date(current_year, month - 1, 1);
-        const end_date = new Date(current_year, month, 1);
-        
-        const monthData: any = {
-          month: month_date.toLocaleDateString('en-US', { month: 'short' }),
-          month_number: month,
-          employees: []
-        };
-        
-        // Calculate count for each category
-        categories.forEach(category => {
-          let count = 0;
-          const categoryEmployees: Employee[] = [];
-          
-          for (const emp of dashboardData.employees) {
-            const fieldValue = emp[selectedFilter as keyof Employee];
-            if (fieldValue === category) {
-              const join_date_str = emp.date_of_joining || emp.created_at;
-              if (join_date_str) {
-                try {
-                  const join_date = new Date(join_date_str);
-                  if (join_date <= end_date) {
-                    count += 1;
-                    categoryEmployees.push(emp);
-                  }
-                } catch {
-                  count += 1;
-                  categoryEmployees.push(emp);
-                }
-              }
-            }
-          }
-          
-          monthData[category] = count;
-          monthData[`${category}_employees`] = categoryEmployees;
-        });
-        
-        monthly_headcount.push(monthData);
-      }
+    if (selectedFilter === "all" || categories.length === 0) {
+      setChartData(dashboardData.monthly_headcount.map(point => ({
+        month: point.month,
+        count: point.count,
+        month_number: point.month_number
+      })));
+      return;
+    }
+
+    // Generate data for each category
+    const monthly_headcount = [];
+    for (let month = 1; month <= 12; month++) {
+      const month_date = new Date(current_year, month - 1, 1);
+      const monthData: any = {
+        month: month_date.toLocaleDateString('en-US', { month: 'short' }),
+        month_number: month
+      };
+      categories.forEach(category => {
+        monthData[category] = breakdown?.[category]?.headcount[month - 1] || 0;
+      });
+      monthly_headcount.push(monthData);
     }
 
     setChartData(monthly_headcount);
@@ -214,19 +257,13 @@ export default function Dashboard() {
 
   // Get categories for the selected filter
   const getChartCategories = () => {
-    if (!dashboardData || selectedFilter === "all") {
+    if (!breakdown || selectedFilter === "all") {
       return [];
     }
 
-    const categories = new Set<string>();
-    dashboardData.employees.forEach(emp => {
-      const fieldValue = emp[selectedFilter as keyof Employee];
-      if (fieldValue && fieldValue !== "Unknown") {
-        categories.add(fieldValue);
-      }
-    });
-
-    return Array.from(categories).sort();
+    return Object.keys(breakdown)
+      .filter(category => category && category !== "Unknown")
+      .sort();
   };
 
   // Get colors for different lines
@@ -240,26 +277,16 @@ export default function Dashboard() {
 
   // Generate stacked column data for monthly hires by category
   const getStackedColumnData = () => {
-    if (!dashboardData || selectedFilter === "all") {
+    if (!breakdown || selectedFilter === "all") {
       return [];
     }
 
-    const current_year = new Date().getFullYear();
-    const categories = new Set<string>();
-    
-    // Get all unique categories for the selected filter
-    dashboardData.employees.forEach(emp => {
-      const fieldValue = emp[selectedFilter as keyof Employee];
-      if (fieldValue && fieldValue !== "Unknown") {
-        categories.add(fieldValue);
-      }
-    });
-
+    const categories = getChartCategories();
     const monthlyData = [];
     
     for (let month = 1; month <= 12; month++) {
       const month_date = new Date(current_year, month - 1, 1);
-      const monthKey = month_date.toISOString().slice(0, 7); // YYYY-MM format
+      const monthKey = monthStart(current_year, month).slice(0, 7); // YYYY-MM format
       const monthName = month_date.toLocaleDateString('en-US', { month: 'short' });
       
       const monthData: any = {
@@ -269,34 +296,10 @@ export default function Dashboard() {
         total: 0
       };
       
-      // Calculate hires for each category in this month
+      // Hires for each category in this month
       categories.forEach(category => {
-        let hires = 0;
-        const categoryEmployees: Employee[] = [];
-        
-        for (const emp of dashboardData.employees) {
-          const fieldValue = emp[selectedFilter as keyof Employee];
-          if (fieldValue === category) {
-            const join_date_str = emp.date_of_joining || emp.created_at;
-            if (join_date_str) {
-              try {
-                const join_date = new Date(join_date_str);
-                const join_month = join_date.toISOString().slice(0, 7);
-                if (join_month === monthKey) {
-                  hires += 1;
-                  categoryEmployees.push(emp);
-                }
-              } catch {
-                // If date parsing fails, count as current month
-                hires += 1;
-                categoryEmployees.push(emp);
-              }
-            }
-          }
-        }
-        
+        const hires = breakdown[category]?.hires[month - 1] || 0;
         monthData[category] = hires;
-        monthData[`${category}_employees`] = categoryEmployees;
         monthData.total += hires;
       });
       
@@ -314,35 +317,16 @@ export default function Dashboard() {
     return `Monthly Headcount Trend - ${getFilterLabel(selectedFilter)}`;
   };
 
-  // Get filtered employees based on selected filter
-  const getFilteredEmployees = () => {
-    if (!dashboardData || selectedFilter === "all") {
-      return dashboardData?.employees || [];
-    }
-
-    return dashboardData.employees.filter(emp => {
-      const fieldValue = emp[selectedFilter as keyof Employee];
-      return fieldValue && fieldValue !== "Unknown";
-    });
-  };
-
-  // Get category distribution for filtered data
+  // Get category distribution for the selected filter
   const getCategoryDistribution = () => {
     if (!dashboardData || selectedFilter === "all") {
       return null;
     }
 
-    const filteredEmployees = getFilteredEmployees();
-    const distribution: { [key: string]: number } = {};
-
-    filteredEmployees.forEach(emp => {
-      const fieldValue = emp[selectedFilter as keyof Employee];
-      if (fieldValue && fieldValue !== "Unknown") {
-        distribution[fieldValue] = (distribution[fieldValue] || 0) + 1;
-      }
-    });
-
-    return Object.entries(distribution).map(([name, value]) => ({ name, value }));
+    const distribution = dashboardData[`by_${selectedFilter}` as keyof DashboardData] as { [key: string]: number } | undefined;
+    return Object.entries(distribution || {})
+      .filter(([name]) => name && name !== "Unknown")
+      .map(([name, value]) => ({ name, value }));
   };
 
   const handleChartClick = (data: any) => {
@@ -351,39 +335,35 @@ export default function Dashboard() {
       
       // Check if it's from the monthly trend chart or other charts
       if (clickedData.month && selectedFilter === "all") {
-        // Monthly trend chart - show all employees
-        setSelectedDataPoint(clickedData as ChartDataPoint);
-        setFilteredEmployees(clickedData.employees || []);
-        setShowModal(true);
+        // Monthly trend chart - everyone who had joined by the end of the month
+        openDrilldown(clickedData as ChartDataPoint, {
+          joined_to: monthEnd(current_year, clickedData.month_number)
+        });
       } else if (clickedData.month && selectedFilter !== "all" && !clickedData.monthName) {
         // Monthly trend chart (not stacked column) - show employees for the clicked category
         const categoryName = data.activePayload[0].dataKey;
-        const categoryEmployees = clickedData[`${categoryName}_employees`] || [];
         
-        setSelectedDataPoint({
+        openDrilldown({
           month: `${clickedData.month} - ${categoryName}`,
           count: clickedData[categoryName] || 0,
-          month_number: clickedData.month_number,
-          employees: categoryEmployees
+          month_number: clickedData.month_number
+        }, {
+          dimension: selectedFilter,
+          value: categoryName,
+          joined_to: monthEnd(current_year, clickedData.month_number)
         });
-        setFilteredEmployees(categoryEmployees);
-        setShowModal(true);
       } else if (!clickedData.month) {
         // Other charts - show employees for the clicked category
         const categoryName = clickedData.name;
-        const categoryEmployees = getFilteredEmployees().filter(emp => {
-          const fieldValue = emp[selectedFilter as keyof Employee];
-          return fieldValue === categoryName;
-        });
         
-        setSelectedDataPoint({
+        openDrilldown({
           month: `${getFilterLabel(selectedFilter)}: ${categoryName}`,
           count: clickedData.value,
-          month_number: 0,
-          employees: categoryEmployees
+          month_number: 0
+        }, {
+          dimension: selectedFilter,
+          value: categoryName
         });
-        setFilteredEmployees(categoryEmployees);
-        setShowModal(true);
       }
       // Note: Stacked column chart clicks are handled by individual Bar onClick handlers
     }
@@ -682,19 +662,20 @@ export default function Dashboard() {
                           stackId="a"
                           fill={getLineColors()[index % getLineColors().length]}
                           onClick={(data, index, event) => {
-                            // Custom click handler for each bar
+                            // Custom click handler for each bar: hires of the category in that month
                             const categoryName = category;
                             const monthData = data.payload;
-                            const categoryEmployees = monthData[`${categoryName}_employees`] || [];
                             
-                            setSelectedDataPoint({
+                            openDrilldown({
                               month: `${monthData.monthName} ${monthData.month} - ${categoryName}`,
                               count: monthData[categoryName] || 0,
-                              month_number: monthData.month_number,
-                              employees: categoryEmployees
+                              month_number: monthData.month_number
+                            }, {
+                              dimension: selectedFilter,
+                              value: categoryName,
+                              joined_from: monthStart(current_year, monthData.month_number),
+                              joined_to: monthEnd(current_year, monthData.month_number)
                             });
-                            setFilteredEmployees(categoryEmployees);
-                            setShowModal(true);
                           }}
                         />
                       ))}
@@ -822,7 +803,9 @@ export default function Dashboard() {
               <div className="space-y-4">
                 <div className="flex items-center justify-between">
                   <p className="text-sm text-muted-foreground">
-                    Showing {filteredEmployees.length} employees
+                    {drilldownLoading && filteredEmployees.length === 0
+                      ? 'Loading employees...'
+                      : `Showing ${filteredEmployees.length} of ${selectedDataPoint?.count ?? filteredEmployees.length} employees`}
                   </p>
                   <Button variant="outline" size="sm" onClick={() => setShowModal(false)}>
                     Close
@@ -865,6 +848,14 @@ export default function Dashboard() {
                     </TableBody>
                   </Table>
                 </div>
+
+                {drilldownCursor && (
+                  <div className="flex justify-center">
+                    <Button variant="outline" size="sm" onClick={loadMoreDrilldown} disabled={drilldownLoading}>
+                      {drilldownLoading ? 'Loading...' : 'Load more'}
+                    </Button>
+                  </div>
+                )}
               </div>
             </DialogContent>
           </Dialog>